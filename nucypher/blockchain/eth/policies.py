@@ -149,6 +149,9 @@ class BlockchainPolicy(Policy):
         start_time = maya.now()                            # marker for timeout calculation
 
         found_ursulas, unknown_addresses = set(), deque()  # type: set, deque
+
+        # Look up all of the Ursulas we don't know about yet at once, rather than one at a time below.
+        self.alice.get_nodes_by_ids(ether_addresses)
         while len(found_ursulas) < target_quantity:        # until there are enough Ursulas
 
             delta = maya.now() - start_time                # check for a timeout
@@ -49,7 +49,7 @@ from nucypher.crypto.powers import (
     CryptoPowerUp,
     DelegatingPower
 )
-from nucypher.crypto.signing import signature_splitter, StrangerStamp, SignatureStamp
+from nucypher.crypto.signing import signature_splitter, StrangerStamp, SignatureStamp, verification_cache
 from nucypher.network.middleware import RestMiddleware
 from nucypher.network.nicknames import nickname_from_seed
 from nucypher.network.nodes import Learner
@@ -378,7 +378,7 @@ class Character(Learner):
         signature_to_use = signature or signature_from_kit
 
         if signature_to_use:
-            is_valid = signature_to_use.verify(message, sender_pubkey_sig)
+            is_valid = verification_cache.verify(signature_to_use, message, sender_pubkey_sig)
             if not is_valid:
                 raise stranger.InvalidSignature(
                     "Signature for message isn't valid: {}".format(signature_to_use))
@@ -17,7 +17,8 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 import json
 import random
 from base64 import b64encode
-from collections import OrderedDict
+from collections import OrderedDict, Counter
+from contextlib import suppress
 from functools import partial
 from json.decoder import JSONDecodeError
 from typing import Dict
@@ -60,11 +61,13 @@ from nucypher.crypto.kits import UmbralMessageKit
 from nucypher.crypto.powers import SigningPower, DecryptingPower, DelegatingPower, BlockchainPower, PowerUpError
 from nucypher.crypto.signing import InvalidSignature
 from nucypher.keystore.keypairs import HostingKeypair
+from nucypher.keystore.keystore import PolicyArrangementCache, WorkOrderLog
 from nucypher.network.exceptions import NodeSeemsToBeDown
 from nucypher.network.middleware import RestMiddleware, UnexpectedResponse, NotFound
 from nucypher.network.nicknames import nickname_from_seed
-from nucypher.network.nodes import Teacher
+from nucypher.network.nodes import NodeSketch, Teacher
 from nucypher.network.protocols import InterfaceInfo, parse_node_uri
+from nucypher.network.reencryption import ReencryptionEngine
 from nucypher.network.server import ProxyRESTServer, TLSHostingPower, make_rest_app
 from nucypher.blockchain.eth.decorators import validate_checksum_address
 
@@ -428,11 +431,11 @@ class Bob(Character):
 
         unknown_ursulas, known_ursulas = self.peek_at_treasure_map(treasure_map=treasure_map)
 
+        self._push_certain_newly_discovered_nodes_here(known_ursulas, unknown_ursulas)
+
         if unknown_ursulas:
             self.learn_about_specific_nodes(unknown_ursulas)
 
-        self._push_certain_newly_discovered_nodes_here(known_ursulas, unknown_ursulas)
-
         if block:
             if new_thread:
                 return threads.deferToThread(self.block_until_specific_nodes_are_known, unknown_ursulas,
@@ -543,16 +546,53 @@ class Bob(Character):
         return generated_work_orders
 
     def get_reencrypted_cfrags(self, work_order):
-        cfrags = self.network_middleware.reencrypt(work_order)
-        for task in work_order.tasks:
+        return list(self.get_reencrypted_cfrags_incrementally(work_order))
+
+    def get_reencrypted_cfrags_incrementally(self, work_order):
+        """
+        Yields each cfrag of work_order as soon as Ursula sends it, so that it can be
+        attached before she has finished the rest of the work order.
+        """
+        work_orders_by_ursula = self._saved_work_orders[work_order.ursula.checksum_public_address]
+        cfrags = self.network_middleware.reencrypt_incrementally(work_order)
+        for cfrag, task in zip(cfrags, work_order.tasks):
             # TODO: Maybe just update the work order here instead of setting it anew.
-            work_orders_by_ursula = self._saved_work_orders[work_order.ursula.checksum_public_address]
             work_orders_by_ursula[task.capsule] = work_order
-        return cfrags
+            yield cfrag
+
+    def get_reencrypted_cfrags_in_bulk(self, work_orders):
+        """
+        Gets the cfrags for many work orders - perhaps for many policies - coalescing the
+        work orders for each Ursula into a single request to her.
+
+        Returns the cfrags for each work order in turn, or None for those whose Ursula didn't have the arrangement.
+        """
+        work_orders_by_ursula = OrderedDict()
+        for work_order in work_orders:
+            work_orders_by_ursula.setdefault(work_order.ursula.checksum_public_address, []).append(work_order)
+
+        cfrags_by_work_order = dict()
+        for ursula_address, ursulas_work_orders in work_orders_by_ursula.items():
+            if len(ursulas_work_orders) == 1:
+                try:
+                    results = [self.network_middleware.reencrypt(ursulas_work_orders[0])]
+                except NotFound:  # Just as in bulk: Ursula doesn't have this arrangement.
+                    results = [None]
+            else:
+                results = self.network_middleware.reencrypt_in_bulk(ursulas_work_orders)
+
+            for work_order, cfrags in zip(ursulas_work_orders, results):
+                cfrags_by_work_order[id(work_order)] = cfrags
+                if cfrags is not None:
+                    for task in work_order.tasks:
+                        self._saved_work_orders[ursula_address][task.capsule] = work_order
+
+        return [cfrags_by_work_order[id(work_order)] for work_order in work_orders]
 
     def join_policy(self, label, alice_pubkey_sig, node_list=None, block=False):
         if node_list:
-            self._node_ids_to_learn_about_immediately.update(node_list)
+            with self._learning_state_lock:
+                self._node_ids_to_learn_about_immediately.update(node_list)
         treasure_map = self.get_treasure_map(alice_pubkey_sig, label)
         self.follow_treasure_map(treasure_map=treasure_map, block=block)
 
@@ -650,6 +690,9 @@ class Ursula(Teacher, Character, Miner):
     banner = URSULA_BANNER
     _alice_class = Alice
 
+    # Shared by all Ursulas in this process, so that we can see how often __bytes__ is served from cache.
+    serialization_cache_stats = Counter()
+
     # TODO: Maybe this wants to be a registry, so that, for example,
     # TLSHostingPower still can enjoy default status, but on a different class
     _default_crypto_powerups = [SigningPower, DecryptingPower]
@@ -689,6 +732,8 @@ class Ursula(Teacher, Character, Miner):
                  crypto_power=None,
                  tls_curve: EllipticCurve = None,
                  known_nodes: Iterable = None,
+                 reencryption_workers: int = None,
+                 reencryption_queue_depth: int = None,
 
                  **character_kwargs
                  ) -> None:
@@ -696,7 +741,7 @@ class Ursula(Teacher, Character, Miner):
         #
         # Character
         #
-        self._work_orders = list()
+        self._work_orders = None  # Only a Self-Ursula completes work orders.
         Character.__init__(self,
                            is_me=is_me,
                            checksum_public_address=checksum_public_address,
@@ -713,6 +758,7 @@ class Ursula(Teacher, Character, Miner):
         #
         if is_me is True:  # TODO: 340
             self._stored_treasure_maps = dict()
+            self._work_orders = WorkOrderLog()
 
             #
             # Staking Ursula
@@ -738,6 +784,16 @@ class Ursula(Teacher, Character, Miner):
             if is_me:
                 self.suspicious_activities_witnessed = {'vladimirs': [], 'bad_treasure_maps': []}
 
+                # Re-encryption happens in-process, or in worker processes (off the GIL of the node itself)
+                # if reencryption_workers are asked for.
+                signing_keypair = self._crypto_power.power_ups(SigningPower).keypair
+                self.reencryption_engine = ReencryptionEngine(signing_key=signing_keypair._privkey,
+                                                              workers=reencryption_workers,
+                                                              queue_depth=reencryption_queue_depth)
+
+                # Hot arrangements are kept deserialized; see arrangement_cache.stats for how that's going.
+                self.arrangement_cache = PolicyArrangementCache()
+
                 #
                 # REST Server (Ephemeral Self-Ursula)
                 #
@@ -750,11 +806,15 @@ class Ursula(Teacher, Character, Miner):
                     node_bytes_caster=self.__bytes__,
                     node_nickname=self.nickname,
                     work_order_tracker=self._work_orders,
-                    node_recorder=self.remember_node,
+                    node_verifier=self.verification_pool.submit,
                     stamp=self.stamp,
                     verifier=self.verify_from,
                     suspicious_activity_tracker=self.suspicious_activities_witnessed,
                     serving_domains=domains,
+                    reencryption_engine=self.reencryption_engine,
+                    node_health=self.node_health,
+                    node_finder=self.lookup_nodes,
+                    arrangement_cache=self.arrangement_cache,
                 )
 
                 #
@@ -830,6 +890,18 @@ class Ursula(Teacher, Character, Miner):
             hosting_power.keypair.pubkey
         )
 
+    def stop(self) -> None:
+        """
+        Stops learning, shuts down the re-encryption workers,
+        and writes out any work orders not yet in the datastore.
+        """
+        if self._learning_task.running:
+            self.stop_learning_loop()
+        with suppress(AttributeError):  # Strangers don't re-encrypt.
+            self.reencryption_engine.shutdown()
+        if self._work_orders is not None:
+            self._work_orders.close()
+
     def get_deployer(self):
         port = self.rest_information()[0].port
         deployer = self._crypto_power.power_ups(TLSHostingPower).get_deployer(rest_app=self.rest_app, port=port)
@@ -838,7 +910,22 @@ class Ursula(Teacher, Character, Miner):
     def rest_server_certificate(self):
         return self._crypto_power.power_ups(TLSHostingPower).keypair.certificate
 
+    def _serialization_fingerprint(self) -> tuple:
+        """
+        The parts of our metadata that can change over the life of this instance.
+        """
+        return (self.TEACHER_VERSION,
+                self.timestamp,
+                self._interface_signature,
+                self._evidence_of_decentralized_identity,
+                frozenset(self.serving_domains))
+
     def __bytes__(self):
+        fingerprint = self._serialization_fingerprint()
+        if self._serialized_node is not None and fingerprint == self._serialized_node_fingerprint:
+            self.serialization_cache_stats['hits'] += 1
+            return self._serialized_node
+        self.serialization_cache_stats['misses'] += 1
 
         version = self.TEACHER_VERSION.to_bytes(2, "big")
         interface_info = VariableLengthBytestring(bytes(self.rest_information()[0]))
@@ -859,6 +946,8 @@ class Ursula(Teacher, Character, Miner):
                                  bytes(cert_vbytes),
                                  bytes(interface_info))
                                 )
+        self._serialized_node = as_bytes
+        self._serialized_node_fingerprint = fingerprint
         return as_bytes
 
     #
@@ -935,6 +1024,8 @@ class Ursula(Teacher, Character, Miner):
                                  minimum_stake: int = 0,
                                  checksum_address: str = None,  # TODO: Why is this unused?
                                  network_middleware: RestMiddleware = None,
+                                 seed_certificate: Certificate = None,
+                                 timeout: float = 3,
                                  *args,
                                  **kwargs
                                  ) -> 'Ursula':
@@ -949,8 +1040,11 @@ class Ursula(Teacher, Character, Miner):
 
         host, port, checksum_address = parse_node_uri(seed_uri)
 
-        # Fetch the hosts TLS certificate and read the common name
-        certificate = network_middleware.get_certificate(host=host, port=port)
+        # Fetch the hosts TLS certificate (unless we already have it from an earlier visit) and read the common name
+        if seed_certificate is not None:
+            certificate = seed_certificate
+        else:
+            certificate = network_middleware.get_certificate(host=host, port=port, timeout=timeout)
         real_host = certificate.subject.get_attributes_for_oid(NameOID.COMMON_NAME)[0].value
         temp_node_storage = ForgetfulNodeStorage(federated_only=federated_only)
         certificate_filepath = temp_node_storage.store_node_certificate(certificate=certificate)
@@ -984,7 +1078,8 @@ class Ursula(Teacher, Character, Miner):
             potential_seed_node.verify_node(
                 network_middleware=network_middleware,
                 accept_federated_only=federated_only,
-                certificate_filepath=certificate_filepath)
+                certificate_filepath=certificate_filepath,
+                timeout=timeout)
 
         except potential_seed_node.InvalidNode:
             raise  # TODO: What if our seed node fails verification?
@@ -1011,16 +1106,7 @@ class Ursula(Teacher, Character, Miner):
         return result(splittable)
 
     @classmethod
-    def from_bytes(cls,
-                   ursula_as_bytes: bytes,
-                   version: int = INCLUDED_IN_BYTESTRING,
-                   federated_only: bool = False,
-                   ) -> 'Ursula':
-        if version is INCLUDED_IN_BYTESTRING:
-            version, payload = cls.version_splitter(ursula_as_bytes, return_remainder=True)
-        else:
-            payload = ursula_as_bytes
-
+    def _check_version(cls, version: int, payload: bytes) -> None:
         # Check version and raise IsFromTheFuture if this node is... you guessed it...
         if version > cls.LEARNER_VERSION:
             # TODO: Some auto-updater logic?
@@ -1035,6 +1121,19 @@ class Ursula(Teacher, Character, Miner):
 
             raise cls.IsFromTheFuture(message)
 
+    @classmethod
+    def from_bytes(cls,
+                   ursula_as_bytes: bytes,
+                   version: int = INCLUDED_IN_BYTESTRING,
+                   federated_only: bool = False,
+                   ) -> 'Ursula':
+        if version is INCLUDED_IN_BYTESTRING:
+            version, payload = cls.version_splitter(ursula_as_bytes, return_remainder=True)
+        else:
+            payload = ursula_as_bytes
+
+        cls._check_version(version, payload)
+
         # Version stuff checked out.  Moving on.
         node_info = cls.internal_splitter(payload)
 
@@ -1057,30 +1156,42 @@ class Ursula(Teacher, Character, Miner):
         return ursula
 
     @classmethod
-    def batch_from_bytes(cls,
-                         ursulas_as_bytes: Iterable[bytes],
-                         federated_only: bool = False,
-                         fail_fast: bool = False,
-                         ) -> List['Ursula']:
-
+    def sketches_from_bytes(cls,
+                            ursulas_as_bytes: Iterable[bytes],
+                            federated_only: bool = False,
+                            fail_fast: bool = False,
+                            ) -> List[NodeSketch]:
+        """
+        Like batch_from_bytes, but only reads the address, domains and timestamp of each Ursula;
+        each NodeSketch builds its full Ursula when it's materialized.
+        """
         node_splitter = BytestringSplitter(VariableLengthBytestring)
         nodes_vbytes = node_splitter.repeat(ursulas_as_bytes)
         version_splitter = BytestringSplitter((int, 2, {"byteorder": "big"}))
         versions_and_node_bytes = [version_splitter(n, return_remainder=True) for n in nodes_vbytes]
 
-        ursulas = []
+        sketches = []
         for version, node_bytes in versions_and_node_bytes:
             try:
-                ursula = cls.from_bytes(node_bytes, version, federated_only=federated_only)
+                cls._check_version(version, node_bytes)
             except Ursula.IsFromTheFuture as e:
                 if fail_fast:
                     raise
                 else:
                     cls.log.warn(e.args[0])
             else:
-                ursulas.append(ursula)
+                sketches.append(NodeSketch(cls, version, node_bytes, federated_only=federated_only))
 
-        return ursulas
+        return sketches
+
+    @classmethod
+    def batch_from_bytes(cls,
+                         ursulas_as_bytes: Iterable[bytes],
+                         federated_only: bool = False,
+                         fail_fast: bool = False,
+                         ) -> List['Ursula']:
+        sketches = cls.sketches_from_bytes(ursulas_as_bytes, federated_only=federated_only, fail_fast=fail_fast)
+        return [sketch.materialize() for sketch in sketches]
 
     @classmethod
     def from_storage(cls,
@@ -1128,16 +1239,12 @@ class Ursula(Teacher, Character, Miner):
 
     def work_orders(self, bob=None):
         """
-        TODO: This is better written as a model method for Ursula's datastore.
+        The work orders Ursula has completed recently, optionally just those from bob.
+        For older ones, search the datastore with _work_orders.find.
         """
-        if not bob:
-            return self._work_orders
-        else:
-            work_orders_from_bob = []
-            for work_order in self._work_orders:
-                if work_order.bob == bob:
-                    work_orders_from_bob.append(work_order)
-            return work_orders_from_bob
+        if self._work_orders is None:
+            return []
+        return self._work_orders.recent(bob=bob)
 
 
 class Enrico(Character):
@@ -300,6 +300,7 @@ def ursula(click_config,
         # Graceful Exit / Crash
         finally:
             click_config.emit(message="Stopping Ursula", color='green')
+            URSULA.stop()
             ursula_config.cleanup()
             click_config.emit(message="Ursula Stopped", color='red')
         return
@@ -114,7 +114,7 @@ def paint_node_status(ursula, start_time):
              'Rest Interface ...... {}'.format(ursula.rest_url()),
              'Node Storage Type ... {}'.format(ursula.node_storage._name.capitalize()),
              'Known Nodes ......... {}'.format(len(ursula.known_nodes)),
-             'Work Orders ......... {}'.format(len(ursula._work_orders)),
+             'Work Orders ......... {}'.format(ursula._work_orders.total),
              teacher]
 
     if not ursula.federated_only and ursula.stakes:
@@ -14,7 +14,12 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
+import threading
+from collections import Counter, OrderedDict
+
 from bytestring_splitter import BytestringSplitter
+from eth_keys.datatypes import Signature as EthSignature
+from umbral.keys import UmbralPublicKey
 from umbral.signing import Signature, Signer
 
 from nucypher.crypto.api import keccak_digest
@@ -22,6 +27,81 @@ from nucypher.crypto.api import keccak_digest
 signature_splitter = BytestringSplitter(Signature)
 
 
+class VerificationCache:
+    """
+    A bounded, least-recently-used record of signature checks which have already succeeded.
+
+    Entries are keyed by a digest of (signature, message, key), so the same metadata arriving
+    again in a new object (as it does every time a node is deserialized) is recognized
+    without redoing the elliptic curve work.  Failed checks are never cached.
+    """
+
+    _MAX_SIZE = 10000
+
+    def __init__(self, max_size: int = None) -> None:
+        self.max_size = max_size or self._MAX_SIZE
+        self.stats = Counter()
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.stats['hits'] + self.stats['misses']
+        return self.stats['hits'] / lookups if lookups else 0.0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.stats.clear()
+
+    def _get(self, digest: bytes):
+        with self._lock:
+            try:
+                value = self._entries[digest]
+            except KeyError:
+                self.stats['misses'] += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.stats['hits'] += 1
+            return value
+
+    def _put(self, digest: bytes, value) -> None:
+        with self._lock:
+            self._entries[digest] = value
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def verify(self, signature: Signature, message: bytes, verifying_key: UmbralPublicKey) -> bool:
+        """
+        Same as signature.verify(message, verifying_key), but only does the work once for a valid signature.
+        """
+        digest = keccak_digest(b"umbral", bytes(signature), bytes(verifying_key), message)
+        if self._get(digest):
+            return True
+        is_valid = signature.verify(message, verifying_key)
+        if is_valid:
+            self._put(digest, True)
+        return is_valid
+
+    def recover_address(self, signature: EthSignature, message: bytes) -> str:
+        """
+        Returns the checksum address of the Ethereum key which made signature over message.
+        """
+        digest = keccak_digest(b"ecrecover", bytes(signature), message)
+        address = self._get(digest)
+        if address is None:
+            address = signature.recover_public_key_from_msg(message).to_checksum_address()
+            self._put(digest, address)
+        return address
+
+
+verification_cache = VerificationCache()
+
+
 class SignatureStamp(object):
     """
     Can be called to sign something or used to express the signing public
@@ -82,15 +82,18 @@ class Workorder(Base):
     __tablename__ = 'workorders'
 
     id = Column(Integer, primary_key=True)
-    bob_pubkey_sig_id = Column(Integer, ForeignKey('keys.id'))
+    bob_pubkey_sig_id = Column(Integer, ForeignKey('keys.id'), index=True)
+    bob_pubkey_sig = relationship(Key, backref="workorders", lazy='joined')
     bob_signature = Column(LargeBinary, unique=True)
-    arrangement_id = Column(LargeBinary, unique=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    arrangement_id = Column(LargeBinary, unique=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
 
-    def __init__(self, bob_pubkey_sig_id, bob_signature, arrangement_id) -> None:
+    def __init__(self, bob_pubkey_sig_id, bob_signature, arrangement_id, created_at=None) -> None:
         self.bob_pubkey_sig_id = bob_pubkey_sig_id
         self.bob_signature = bob_signature
         self.arrangement_id = arrangement_id
+        if created_at is not None:
+            self.created_at = created_at
 
     def __repr__(self):
         return f'{self.__class__.__name__}(id={self.id})'
@@ -14,15 +14,23 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
 from bytestring_splitter import BytestringSplitter
 from sqlalchemy.orm import sessionmaker
-from typing import Union
+from twisted.logger import Logger
+from typing import Callable, List, Tuple, Union
 from umbral.kfrags import KFrag
 from umbral.keys import UmbralPublicKey
 
 from nucypher.crypto.signing import Signature
 from nucypher.crypto.utils import fingerprint_from_key
 from nucypher.keystore.db.models import Key, PolicyArrangement, Workorder
+from nucypher.keystore.threading import ThreadedSession
 from . import keypairs
 
 
@@ -165,7 +173,7 @@ class KeyStore(object):
         Adds a Workorder to the keystore.
         """
         session = session or self._session_on_init_thread
-        bob_pubkey_sig = self.add_key(bob_pubkey_sig)
+        bob_pubkey_sig = self._key_for(bob_pubkey_sig, session=session)
         new_workorder = Workorder(bob_pubkey_sig.id, bob_signature, arrangement_id)
 
         session.add(new_workorder)
@@ -173,6 +181,63 @@ class KeyStore(object):
 
         return new_workorder
 
+    def add_workorders(self, workorders: List[Tuple], session=None) -> int:
+        """
+        Adds many Workorders to the keystore in one transaction.  Each is given as
+        (bob_pubkey_sig, bob_signature, arrangement_id, created_at); ones already stored are skipped.
+
+        :return: The number of Workorders added.
+        """
+        session = session or self._session_on_init_thread
+
+        signatures = [bytes(bob_signature) for _key, bob_signature, _id, _created_at in workorders]
+        already_stored = {stored for stored, in session.query(Workorder.bob_signature).filter(
+            Workorder.bob_signature.in_(signatures))}
+
+        added = 0
+        for bob_pubkey_sig, bob_signature, arrangement_id, created_at in workorders:
+            bob_signature = bytes(bob_signature)
+            if bob_signature in already_stored:
+                continue
+            already_stored.add(bob_signature)
+            bob_key = self._key_for(bob_pubkey_sig, session=session)
+            session.add(Workorder(bob_key.id, bob_signature, arrangement_id, created_at=created_at))
+            added += 1
+
+        session.commit()
+        return added
+
+    def _key_for(self, key, session) -> Key:
+        existing_key = session.query(Key).filter_by(key_data=bytes(key)).first()
+        if existing_key:
+            return existing_key
+        new_key = Key(fingerprint_from_key(key), bytes(key), is_signing=True)
+        session.add(new_key)
+        session.flush()  # So that it has an id.
+        return new_key
+
+    def find_workorders(self,
+                        bob_pubkey_sig=None,
+                        arrangement_id: bytes = None,
+                        since: datetime = None,
+                        until: datetime = None,
+                        session=None) -> List[Workorder]:
+        """
+        Returns the Workorders from a Bob, for an arrangement, and/or made within a time range, oldest first.
+        """
+        session = session or self._session_on_init_thread
+
+        query = session.query(Workorder)
+        if bob_pubkey_sig is not None:
+            query = query.join(Key, Workorder.bob_pubkey_sig_id == Key.id).filter(Key.key_data == bytes(bob_pubkey_sig))
+        if arrangement_id is not None:
+            query = query.filter(Workorder.arrangement_id == arrangement_id)
+        if since is not None:
+            query = query.filter(Workorder.created_at >= since)
+        if until is not None:
+            query = query.filter(Workorder.created_at < until)
+        return query.order_by(Workorder.created_at).all()
+
     def get_workorders(self, arrangement_id: bytes, session=None) -> Workorder:
         """
         Returns a list of Workorders by HRAC.
@@ -196,3 +261,253 @@ class KeyStore(object):
         session.commit()
 
         return deleted
+
+
+class CachedArrangement:
+    """
+    What Ursula needs to know about a PolicyArrangement to re-encrypt for it, already deserialized.
+    """
+
+    def __init__(self,
+                 kfrag_bytes: bytes,
+                 alices_verifying_key: UmbralPublicKey,
+                 alices_address: bytes,
+                 expiration: datetime = None) -> None:
+        self.kfrag_bytes = kfrag_bytes
+        self.alices_verifying_key = alices_verifying_key
+        self.verifying_key_bytes = bytes(alices_verifying_key)
+        self.alices_address = alices_address
+
+        if expiration is None:
+            self.expires_at = None
+        else:
+            if expiration.tzinfo is None:
+                expiration = expiration.replace(tzinfo=timezone.utc)  # That's how the datastore keeps them.
+            self.expires_at = expiration.timestamp()
+
+    def __len__(self):
+        return len(self.kfrag_bytes) + len(self.verifying_key_bytes) + len(self.alices_address)
+
+    def expired(self, now: float) -> bool:
+        return self.expires_at is not None and self.expires_at <= now
+
+
+class PolicyArrangementCache:
+    """
+    A bounded, least-recently-used record of arrangements Ursula has recently re-encrypted for,
+    keyed by arrangement ID, so that a hot policy doesn't cost a trip to the datastore
+    (and the deserialization that follows) on every work order.
+
+    Entries are dropped when the arrangement is revoked or expires.
+    """
+
+    _MAX_ENTRIES = 10000
+    _MAX_BYTES = 16 * 1024 * 1024
+
+    def __init__(self, max_entries: int = None, max_bytes: int = None) -> None:
+        self.max_entries = max_entries or self._MAX_ENTRIES
+        self.max_bytes = max_bytes or self._MAX_BYTES
+        self.stats = Counter()
+        self.size_in_bytes = 0
+        self._entries = OrderedDict()
+        self._invalidations = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.stats['hits'] + self.stats['misses']
+        return self.stats['hits'] / lookups if lookups else 0.0
+
+    def get(self, arrangement_id: bytes, load: Callable[[], CachedArrangement], now: float = None) -> CachedArrangement:
+        """
+        Returns the cached arrangement, or the one produced by load (which is remembered for next time).
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            arrangement = self._entries.get(arrangement_id)
+            if arrangement is not None:
+                if not arrangement.expired(now):
+                    self._entries.move_to_end(arrangement_id)
+                    self.stats['hits'] += 1
+                    return arrangement
+                self._remove(arrangement_id)
+                self.stats['expirations'] += 1
+            self.stats['misses'] += 1
+            invalidations_before_load = self._invalidations
+
+        arrangement = load()
+
+        with self._lock:
+            # If anything was revoked while we were loading, what we loaded may be stale already.
+            if self._invalidations == invalidations_before_load and not arrangement.expired(now):
+                self._put(arrangement_id, arrangement)
+        return arrangement
+
+    def invalidate(self, arrangement_id: bytes) -> None:
+        with self._lock:
+            self._invalidations += 1
+            if arrangement_id in self._entries:
+                self._remove(arrangement_id)
+                self.stats['invalidations'] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._invalidations += 1
+            self._entries.clear()
+            self.size_in_bytes = 0
+            self.stats.clear()
+
+    def _put(self, arrangement_id: bytes, arrangement: CachedArrangement) -> None:
+        if arrangement_id in self._entries:
+            self._remove(arrangement_id)
+        self._entries[arrangement_id] = arrangement
+        self.size_in_bytes += len(arrangement)
+        while len(self._entries) > self.max_entries or self.size_in_bytes > self.max_bytes:
+            evicted_id = next(iter(self._entries))
+            self._remove(evicted_id)
+            self.stats['evictions'] += 1
+
+    def _remove(self, arrangement_id: bytes) -> None:
+        arrangement = self._entries.pop(arrangement_id)
+        self.size_in_bytes -= len(arrangement)
+
+
+class WorkOrderLog:
+    """
+    Ursula's record of the work orders she has completed.
+
+    The most recent ones are kept in memory, indexed by Bob; all of them are written to the
+    datastore's Workorder table, a batch at a time, on a thread of their own.
+    """
+
+    _RECENT_WORK_ORDERS = 1000
+    _BATCH_SIZE = 100
+    _FLUSH_INTERVAL = 5  # seconds
+    _MAX_PENDING = 10000
+
+    log = Logger("work-order-log")
+
+    def __init__(self,
+                 datastore: KeyStore = None,
+                 recent_work_orders: int = None,
+                 batch_size: int = None,
+                 flush_interval: float = None) -> None:
+        self.datastore = datastore
+        self.batch_size = batch_size or self._BATCH_SIZE
+        self.flush_interval = self._FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self.total = 0
+
+        self._recent = deque(maxlen=recent_work_orders or self._RECENT_WORK_ORDERS)
+        self._recent_by_bob = dict()
+        self._pending = list()
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._batch_ready = threading.Event()
+        self._write_scheduled = False
+        self._writer = ThreadPoolExecutor(max_workers=1)
+
+    def __len__(self):
+        return len(self._recent)
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._recent))
+
+    def use_datastore(self, datastore: KeyStore) -> None:
+        self.datastore = datastore
+        if self._pending:
+            self._schedule_write()
+
+    def append(self, work_order) -> None:
+        """
+        Records a completed work order.
+        """
+        bob_key = bytes(work_order.bob.stamp)
+        with self._lock:
+            if len(self._recent) == self._recent.maxlen:
+                forgotten = self._recent[0]
+                forgotten_bob_key = bytes(forgotten.bob.stamp)
+                bobs_work_orders = self._recent_by_bob[forgotten_bob_key]
+                bobs_work_orders.popleft()
+                if not bobs_work_orders:
+                    del self._recent_by_bob[forgotten_bob_key]
+            self._recent.append(work_order)
+            self._recent_by_bob.setdefault(bob_key, deque()).append(work_order)
+
+            self.total += 1
+            self._pending.append((work_order.bob.stamp,
+                                  work_order.receipt_signature,
+                                  work_order.arrangement_id,
+                                  datetime.utcnow()))
+            if len(self._pending) >= self.batch_size:
+                self._batch_ready.set()
+        if self.datastore is not None:
+            self._schedule_write()
+
+    def recent(self, bob=None) -> List:
+        """
+        The work orders still held in memory - all of them, or just those from bob.
+        """
+        with self._lock:
+            if bob is None:
+                return list(self._recent)
+            return list(self._recent_by_bob.get(bytes(bob.stamp), ()))
+
+    def _schedule_write(self) -> None:
+        with self._lock:
+            if self._write_scheduled:
+                return
+            self._write_scheduled = True
+        self._writer.submit(self._write_behind)
+
+    def _write_behind(self) -> None:
+        # Wait a little for a batch to build up, unless one already has.
+        self._batch_ready.wait(timeout=self.flush_interval)
+        with self._lock:
+            self._batch_ready.clear()
+            self._write_scheduled = False
+        try:
+            self.flush()
+        except Exception as e:
+            self.log.failure("Failed to write work orders to the datastore: {}".format(e))
+
+    def flush(self) -> int:
+        """
+        Writes any work orders not yet in the datastore, and returns how many were written.
+        """
+        with self._write_lock:
+            with self._lock:
+                pending, self._pending = self._pending, list()
+            if not pending or self.datastore is None:
+                return 0
+            try:
+                with ThreadedSession(self.datastore.engine) as session:
+                    return self.datastore.add_workorders(pending, session=session)
+            except Exception:
+                with self._lock:
+                    # Try these again next time - but if the datastore stays broken, only so many of them.
+                    self._pending = (pending + self._pending)[-self._MAX_PENDING:]
+                raise
+
+    def find(self, bob=None, arrangement_id: bytes = None, since: datetime = None, until: datetime = None) -> List:
+        """
+        Searches every work order in the datastore (after writing out those still pending)
+        by Bob, arrangement ID and/or time range.
+        """
+        self.flush()
+        if self.datastore is None:
+            return []
+        with ThreadedSession(self.datastore.engine) as session:
+            return self.datastore.find_workorders(bob_pubkey_sig=bob.stamp if bob is not None else None,
+                                                  arrangement_id=arrangement_id,
+                                                  since=since,
+                                                  until=until,
+                                                  session=session)
+
+    def close(self) -> None:
+        self._batch_ready.set()
+        self._writer.shutdown(wait=True)
+        self.flush()
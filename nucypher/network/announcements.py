@@ -0,0 +1,153 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import wait
+from typing import Callable
+
+import requests
+from twisted.logger import Logger
+
+from nucypher.network.exceptions import NodeSeemsToBeDown
+from nucypher.network.middleware import UnexpectedResponse
+
+
+class NodeAnnouncementQueue:
+    """
+    Collects the nodes that learners announce to us and verifies them in batches,
+    so that many learners announcing themselves at once can't make us do more work
+    than our verifier allows.
+
+    Announcements are deduplicated by address (keeping the newest timestamp) and
+    limited per announcer.  Only one drain runs at a time; any other drain returns
+    straight away, leaving the pending nodes to the one that is running.
+    """
+
+    _BATCH_SIZE = 10
+    _MAX_PENDING = 1000
+    _ANNOUNCEMENTS_PER_ANNOUNCER = 100
+    _RATE_LIMIT_WINDOW = 60  # seconds
+
+    log = Logger("node-announcements")
+
+    def __init__(self,
+                 verifier: Callable,
+                 on_suspicious_node: Callable = None,
+                 batch_size: int = None,
+                 max_pending: int = None,
+                 announcements_per_announcer: int = None,
+                 rate_limit_window: int = None) -> None:
+        self.verifier = verifier
+        self.on_suspicious_node = on_suspicious_node
+        self.batch_size = batch_size or self._BATCH_SIZE
+        self.max_pending = max_pending or self._MAX_PENDING
+        self.announcements_per_announcer = announcements_per_announcer or self._ANNOUNCEMENTS_PER_ANNOUNCER
+        self.rate_limit_window = rate_limit_window or self._RATE_LIMIT_WINDOW
+
+        self._pending = OrderedDict()
+        self._announcers = dict()
+        self._lock = threading.Lock()
+        self._drain_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def announce(self, announcer, nodes) -> bool:
+        """
+        Queues nodes announced by announcer for verification.  Returns True if any of them were queued.
+        """
+        queued = False
+        with self._lock:
+            allowance = self._allowance(announcer)
+            for node in nodes:
+                address = node.checksum_public_address
+                already_pending = self._pending.get(address)
+                if already_pending is not None and node.timestamp <= already_pending.timestamp:
+                    continue
+                if allowance <= 0:
+                    self.log.debug("Rate-limiting node announcements from {}.".format(announcer))
+                    break
+                if already_pending is None and len(self._pending) >= self.max_pending:
+                    self.log.debug("Too many pending node announcements; dropping {}.".format(address))
+                    break
+                self._pending[address] = node
+                allowance -= 1
+                queued = True
+            self._spend(announcer, allowance)
+        return queued
+
+    def _allowance(self, announcer) -> int:
+        now = time.time()
+        window_start, remaining = self._announcers.get(announcer, (now, self.announcements_per_announcer))
+        if now - window_start >= self.rate_limit_window:
+            window_start, remaining = now, self.announcements_per_announcer
+        self._announcers[announcer] = (window_start, remaining)
+
+        # Forget announcers whose windows are long over, so that this doesn't grow without bound.
+        if len(self._announcers) > self.max_pending:
+            self._announcers = {a: (start, left) for a, (start, left) in self._announcers.items()
+                                if now - start < self.rate_limit_window}
+        return remaining
+
+    def _spend(self, announcer, remaining: int) -> None:
+        window_start, _ = self._announcers[announcer]
+        self._announcers[announcer] = (window_start, remaining)
+
+    def _next_batch(self) -> list:
+        with self._lock:
+            batch = list()
+            while self._pending and len(batch) < self.batch_size:
+                _address, node = self._pending.popitem(last=False)
+                batch.append(node)
+            return batch
+
+    def drain(self) -> None:
+        """
+        Verifies pending nodes, a batch at a time, until there are none left.
+        """
+        # Nodes may be queued just as the running drain finishes, so check again after letting go.
+        while self._pending:
+            if not self._drain_lock.acquire(blocking=False):
+                return  # Another drain is taking care of it.
+            try:
+                for batch in iter(self._next_batch, []):
+                    verifications = {self.verifier(node): node for node in batch}
+                    wait(verifications)
+                    for verification, node in verifications.items():
+                        self._handle_outcome(node, verification)
+            finally:
+                self._drain_lock.release()
+
+    def _handle_outcome(self, node, verification) -> None:
+        error = verification.exception()
+        if error is None:
+            self.log.info("Learned about previously unknown node: {}".format(node))
+        elif isinstance(error, node.SuspiciousActivity):
+            # TODO: Include data about caller?
+            # TODO: Account for possibility that stamp, rather than interface, was bad.
+            # TODO: Maybe also record the bytes representation separately to disk?
+            message = f"Suspicious Activity: Discovered node with bad signature: {node}.  Announced via REST."
+            self.log.warn(message)
+            if self.on_suspicious_node is not None:
+                self.on_suspicious_node(node)
+        elif isinstance(error, (*NodeSeemsToBeDown, requests.exceptions.Timeout)):
+            self.log.info("Can't connect to announced node {} to verify it right now: {}".format(node, error))
+        elif isinstance(error, (requests.exceptions.RequestException, UnexpectedResponse, node.WrongMode)):
+            self.log.warn("Failed to verify announced node {}: {}".format(node, error))
+        else:
+            self.log.critical("Failed to verify announced node {}: {}".format(node, error))
@@ -0,0 +1,296 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Callable
+
+import maya
+import requests
+from constant_sorrow.constants import NEVER_SEEN
+from twisted.logger import Logger
+
+
+class NodeHealth:
+    """
+    How a single node has responded to us lately.
+    """
+
+    def __init__(self, checksum_address: str) -> None:
+        self.checksum_address = checksum_address
+        self.consecutive_failures = 0
+        self.last_success = NEVER_SEEN
+        self.last_failure = None
+        self.next_eligible = None
+        self.bucket = None
+
+    def __repr__(self):
+        return "{}({}, bucket={}, failures={})".format(self.__class__.__name__,
+                                                       self.checksum_address,
+                                                       self.bucket,
+                                                       self.consecutive_failures)
+
+    def is_eligible(self, now: maya.MayaDT = None) -> bool:
+        if self.next_eligible is None:
+            return True
+        return (now or maya.now()) >= self.next_eligible
+
+
+class NodeHealthTracker:
+    """
+    Keeps a NodeHealth record for every node we have tried to reach, so that
+    nodes which keep failing are left alone for exponentially longer periods.
+    """
+
+    GHOST = "ghost"      # Somebody else knows about this node, but we can't reach it.
+    BAD_TLS = "bad TLS"  # We reached this node, but its certificate wasn't the one we expected.
+
+    _BASE_BACKOFF = 10  # seconds
+    _MAX_BACKOFF = 60 * 60
+
+    log = Logger("node-health")
+
+    def __init__(self,
+                 base_backoff: int = None,
+                 max_backoff: int = None,
+                 peer_is_available: Callable = None) -> None:
+        self.base_backoff = base_backoff or self._BASE_BACKOFF
+        self.max_backoff = max_backoff or self._MAX_BACKOFF
+        self.peer_is_available = peer_is_available  # Our middleware's view of the node, if we have one.
+        self._records = dict()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, checksum_address) -> NodeHealth:
+        return self._records[checksum_address]
+
+    def __contains__(self, checksum_address):
+        return checksum_address in self._records
+
+    def __len__(self):
+        return len(self._records)
+
+    def _record(self, checksum_address) -> NodeHealth:
+        try:
+            return self._records[checksum_address]
+        except KeyError:
+            health = self._records[checksum_address] = NodeHealth(checksum_address)
+            return health
+
+    def backoff(self, consecutive_failures: int) -> int:
+        return min(self.base_backoff * 2 ** (consecutive_failures - 1), self.max_backoff)
+
+    def record_success(self, checksum_address: str) -> None:
+        with self._lock:
+            health = self._record(checksum_address)
+            health.consecutive_failures = 0
+            health.last_success = maya.now()
+            health.next_eligible = None
+            health.bucket = None
+
+    def record_failure(self, checksum_address: str, bucket: str) -> None:
+        with self._lock:
+            health = self._record(checksum_address)
+            health.consecutive_failures += 1
+            health.last_failure = maya.now()
+            backoff = self.backoff(health.consecutive_failures)
+            health.next_eligible = health.last_failure.add(seconds=backoff)
+            health.bucket = bucket
+        self.log.debug("Backing off {} ({}) for {} seconds.".format(checksum_address, bucket, backoff))
+
+    def is_eligible(self, checksum_address: str) -> bool:
+        try:
+            health = self._records[checksum_address]
+        except KeyError:
+            return True
+        return health.is_eligible()
+
+    def is_available(self, node, now: maya.MayaDT = None) -> bool:
+        """
+        Like is_eligible, but also asks our middleware whether it is willing to contact node right now.
+        """
+        health = self._records.get(node.checksum_public_address)
+        if health is not None and not health.is_eligible(now):
+            return False
+        return self.peer_is_available is None or self.peer_is_available(node)
+
+    def partition(self, nodes) -> tuple:
+        """
+        Splits nodes into those we may contact now and those which are still backed off.
+        """
+        now = maya.now()
+        eligible, backed_off = list(), list()
+        for node in nodes:
+            if self.is_available(node, now):
+                eligible.append(node)
+            else:
+                backed_off.append(node)
+        return eligible, backed_off
+
+    def buckets(self) -> dict:
+        buckets = defaultdict(list)
+        for health in list(self._records.values()):
+            if health.bucket is not None:
+                buckets[health.bucket].append(health)
+        return dict(buckets)
+
+
+class PeerCircuitBreaker:
+    """
+    How a single peer has responded to our requests lately: recent latencies, from which
+    request timeouts are derived, and whether we are willing to send it requests at all.
+
+    After failure_threshold consecutive failures the breaker opens and requests fail fast.
+    Once cool_down seconds have passed, a single trial request is let through (half-open);
+    it closes the breaker again if it succeeds, and re-opens it if it doesn't.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold: int, cool_down: float, latency_samples: int) -> None:
+        self.failure_threshold = failure_threshold
+        self.cool_down = cool_down
+        self.latencies = deque(maxlen=latency_samples)
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.trial_started_at = None
+
+    def __repr__(self):
+        return "{}({}, failures={})".format(self.__class__.__name__, self.state, self.consecutive_failures)
+
+    def is_available(self, now: float) -> bool:
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            return now - self.opened_at >= self.cool_down
+        # Half-open: only one trial at a time (unless the trial itself seems to have gone missing).
+        return now - self.trial_started_at >= self.cool_down
+
+    def allow_request(self, now: float) -> bool:
+        if not self.is_available(now):
+            return False
+        if self.state != self.CLOSED:
+            self.state = self.HALF_OPEN
+            self.trial_started_at = now
+        return True
+
+    def record_success(self, latency: float) -> None:
+        self.latencies.append(latency)
+        self.consecutive_failures = 0
+        self.state = self.CLOSED
+        self.opened_at = self.trial_started_at = None
+
+    def record_failure(self, now: float) -> None:
+        self.consecutive_failures += 1
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = now
+            self.trial_started_at = None
+
+    def latency_percentile(self, percentile: float) -> float:
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percentile))]
+
+
+class PeerCircuitBreakers:
+    """
+    A PeerCircuitBreaker for every peer (by host and port) that a middleware client talks to.
+    """
+
+    _FAILURE_THRESHOLD = 3
+    _COOL_DOWN = 30  # seconds
+    _LATENCY_SAMPLES = 50
+    _MIN_LATENCY_SAMPLES = 5
+    _TIMEOUT_PERCENTILE = .99
+    _TIMEOUT_MULTIPLIER = 3
+    _MIN_TIMEOUT = 1  # seconds
+    _MAX_TIMEOUT_GROWTH = 3
+
+    log = Logger("circuit-breakers")
+
+    class CircuitOpen(requests.exceptions.ConnectionError):
+        """
+        Raised instead of sending a request to a peer whose breaker is open (and so, is one of NodeSeemsToBeDown).
+        """
+
+    def __init__(self,
+                 failure_threshold: int = None,
+                 cool_down: float = None,
+                 latency_samples: int = None,
+                 clock: Callable = time.time) -> None:
+        self.failure_threshold = failure_threshold or self._FAILURE_THRESHOLD
+        self.cool_down = cool_down or self._COOL_DOWN
+        self.latency_samples = latency_samples or self._LATENCY_SAMPLES
+        self.clock = clock
+        self._breakers = dict()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, peer) -> PeerCircuitBreaker:
+        return self._breakers[peer]
+
+    def __contains__(self, peer):
+        return peer in self._breakers
+
+    def _breaker(self, peer) -> PeerCircuitBreaker:
+        try:
+            return self._breakers[peer]
+        except KeyError:
+            breaker = self._breakers[peer] = PeerCircuitBreaker(failure_threshold=self.failure_threshold,
+                                                                cool_down=self.cool_down,
+                                                                latency_samples=self.latency_samples)
+            return breaker
+
+    def is_available(self, peer) -> bool:
+        try:
+            breaker = self._breakers[peer]
+        except KeyError:
+            return True
+        return breaker.is_available(self.clock())
+
+    def before_request(self, peer) -> None:
+        with self._lock:
+            if not self._breaker(peer).allow_request(self.clock()):
+                raise self.CircuitOpen("Not contacting {} for now; it has failed repeatedly.".format(peer))
+
+    def timeout(self, peer, default: float = None) -> float:
+        """
+        A timeout for the next request to peer: a multiple of its recent high-percentile latency.
+        That is shorter than default (the timeout we'd otherwise have used) for fast peers, and longer
+        for slow but healthy ones - though never more than _MAX_TIMEOUT_GROWTH times default.
+        """
+        if default is None:
+            return default
+        with self._lock:
+            breaker = self._breakers.get(peer)
+            if breaker is None or len(breaker.latencies) < self._MIN_LATENCY_SAMPLES:
+                return default
+            observed = breaker.latency_percentile(self._TIMEOUT_PERCENTILE)
+        derived = max(self._MIN_TIMEOUT, observed * self._TIMEOUT_MULTIPLIER)
+        return min(default * self._MAX_TIMEOUT_GROWTH, derived)
+
+    def record_success(self, peer, latency: float) -> None:
+        with self._lock:
+            self._breaker(peer).record_success(latency)
+
+    def record_failure(self, peer) -> None:
+        with self._lock:
+            breaker = self._breaker(peer)
+            breaker.record_failure(self.clock())
+            if breaker.state == breaker.OPEN:
+                self.log.debug("Circuit breaker for {} is open for {} seconds.".format(peer, self.cool_down))
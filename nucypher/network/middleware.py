@@ -14,19 +14,33 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
+import os
 import socket
 import ssl
+import threading
+from collections import OrderedDict
 
+import msgpack
 import requests
 import time
+from requests.adapters import HTTPAdapter
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
+from eth_utils import to_canonical_address
 from twisted.logger import Logger
 from umbral.cfrags import CapsuleFrag
 from umbral.signing import Signature
 from constant_sorrow.constants import CERTIFICATE_NOT_SAVED
 
 from bytestring_splitter import BytestringSplitter, VariableLengthBytestring
+from nucypher.network.exceptions import NodeSeemsToBeDown
+from nucypher.network.health import PeerCircuitBreakers
+
+# Teachers compress node metadata for learners that ask for it; others get the plain payload.
+NODE_METADATA_ENCODING = "deflate"
+
+# Ursula sends each cfrag as a VariableLengthBytestring; this is the size of its length header.
+_LENGTH_PREFIX_SIZE = len(bytes(VariableLengthBytestring(b"")))
 
 
 class UnexpectedResponse(Exception):
@@ -37,9 +51,85 @@ class NotFound(UnexpectedResponse):
     pass
 
 
+class PeerSessionPool:
+    """
+    Keep-alive HTTPS sessions, one for each node (and the certificate we have pinned for it).
+
+    The least recently used sessions are closed once there are more than max_sessions
+    of them, as are sessions which have been idle for longer than idle_timeout.
+    """
+
+    _MAX_SESSIONS = 100
+    _CONNECTIONS_PER_PEER = 4
+    _IDLE_TIMEOUT = 5 * 60  # seconds
+
+    def __init__(self,
+                 max_sessions: int = None,
+                 connections_per_peer: int = None,
+                 idle_timeout: int = None) -> None:
+        self.max_sessions = max_sessions or self._MAX_SESSIONS
+        self.connections_per_peer = connections_per_peer or self._CONNECTIONS_PER_PEER
+        self.idle_timeout = idle_timeout or self._IDLE_TIMEOUT
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def session(self, host: str, certificate_filepath) -> requests.Session:
+        # A node's certificate may be rewritten in place, so the file's modification time is part of the pin.
+        try:
+            pin = (certificate_filepath, os.stat(certificate_filepath).st_mtime_ns)
+        except (TypeError, OSError):
+            pin = (certificate_filepath, None)
+        key = (host, pin)
+
+        now = time.time()
+        with self._lock:
+            self._close_idle_sessions(now)
+            try:
+                session, _last_used = self._sessions.pop(key)
+            except KeyError:
+                session = self._new_session()
+            self._sessions[key] = (session, now)
+            while len(self._sessions) > self.max_sessions:
+                _key, (evicted_session, _last_used) = self._sessions.popitem(last=False)
+                evicted_session.close()
+        return session
+
+    def _new_session(self) -> requests.Session:
+        # The node's certificate is passed as verify with each request, and is only
+        # loaded when the session opens a new connection to the node.
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=self.connections_per_peer))
+        return session
+
+    def _close_idle_sessions(self, now: float) -> None:
+        # Sessions are kept in order of use, so the idle ones are all at the front.
+        while self._sessions:
+            key, (session, last_used) = next(iter(self._sessions.items()))
+            if now - last_used < self.idle_timeout:
+                break
+            del self._sessions[key]
+            session.close()
+
+    def close(self) -> None:
+        with self._lock:
+            for session, _last_used in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
 class NucypherMiddlewareClient:
     library = requests
     timeout = 1.2
+    accept_encoding = NODE_METADATA_ENCODING  # requests decodes compressed responses for us.
+
+    def __init__(self,
+                 session_pool: PeerSessionPool = None,
+                 circuit_breakers: PeerCircuitBreakers = None) -> None:
+        self.session_pool = session_pool or PeerSessionPool()
+        self.circuit_breakers = circuit_breakers or PeerCircuitBreakers()
 
     @staticmethod
     def response_cleaner(response):
@@ -72,6 +162,14 @@ class NucypherMiddlewareClient:
         No cleaning needed.
         """
 
+    def http_client_for(self, host, certificate_filepath, http_client):
+        """
+        Requests to a node go through a pooled, keep-alive session rather than a new connection each time.
+        """
+        if http_client is self.library:
+            return self.session_pool.session(host, certificate_filepath)
+        return http_client
+
     def __getattr__(self, method_name):
         # Quick sanity check.
         if not method_name in ("post", "get", "put", "patch", "delete"):
@@ -95,10 +193,22 @@ class NucypherMiddlewareClient:
             else:
                 certificate_filepath = node_certificate_filepath
 
+            http_client = self.http_client_for(host, certificate_filepath, http_client)
             method = getattr(http_client, method_name)
 
+            # Peers that keep failing aren't contacted for a while, and the rest get timeouts to match their latency.
+            self.circuit_breakers.before_request(host)
+            kwargs["timeout"] = self.circuit_breakers.timeout(host, default=kwargs.get("timeout") or self.timeout)
+
             url = f"https://{host}/{path}"
-            response = self.invoke_method(method, url, verify=certificate_filepath, *args, **kwargs)
+            started = time.time()
+            try:
+                response = self.invoke_method(method, url, verify=certificate_filepath, *args, **kwargs)
+            except (*NodeSeemsToBeDown, requests.exceptions.Timeout):
+                self.circuit_breakers.record_failure(host)
+                raise
+            self.circuit_breakers.record_success(host, latency=time.time() - started)
+
             cleaned_response = self.response_cleaner(response)
             if cleaned_response.status_code >= 300:
                 if cleaned_response.status_code == 404:
@@ -118,30 +228,51 @@ class NucypherMiddlewareClient:
 class RestMiddleware:
     log = Logger()
 
-    client = NucypherMiddlewareClient()
+    _client_class = NucypherMiddlewareClient
+
+    def __init__(self, client: NucypherMiddlewareClient = None) -> None:
+        # Each middleware has a client of its own, so that its keep-alive sessions and circuit breakers
+        # (and so the failures it has seen) aren't shared with every other character in the process.
+        self.client = client or self._client_class()
+
+    def peer_is_available(self, node) -> bool:
+        """
+        False while our circuit breaker for node is open.
+        """
+        return self.client.circuit_breakers.is_available(node.rest_url())
 
     def get_certificate(self, host, port, timeout=3, retry_attempts: int = 3, retry_rate: int = 2,
                         current_attempt: int = 0):
 
-        socket.setdefaulttimeout(timeout)  # Set Socket Timeout
+        for attempt in range(current_attempt, retry_attempts + 1):
+            try:
+                self.log.info(f"Fetching seednode {host}:{port} TLS certificate")
+                seednode_certificate = self._fetch_certificate(host, port, timeout=timeout)
 
-        try:
-            self.log.info(f"Fetching seednode {host}:{port} TLS certificate")
-            seednode_certificate = ssl.get_server_certificate(addr=(host, port))
-
-        except socket.timeout:
-            if current_attempt == retry_attempts:
-                message = f"No Response from seednode {host}:{port} after {retry_attempts} attempts"
-                self.log.info(message)
-                raise RuntimeError("No response from {}:{}".format(host, port))
-            self.log.info("No Response from seednode {}. Retrying in {} seconds...".format(host, retry_rate))
-            time.sleep(retry_rate)
-            return self.get_certificate(host, port, timeout, retry_attempts, retry_rate, current_attempt + 1)
+            except socket.timeout:
+                if attempt == retry_attempts:
+                    message = f"No Response from seednode {host}:{port} after {retry_attempts} attempts"
+                    self.log.info(message)
+                    raise RuntimeError("No response from {}:{}".format(host, port))
+                self.log.info("No Response from seednode {}. Retrying in {} seconds...".format(host, retry_rate))
+                time.sleep(retry_rate)
 
-        else:
-            certificate = x509.load_pem_x509_certificate(seednode_certificate.encode(),
-                                                         backend=default_backend())
-            return certificate
+            else:
+                return seednode_certificate
+
+    @staticmethod
+    def _fetch_certificate(host, port, timeout):
+        """
+        Like ssl.get_server_certificate, but with a timeout on this connection only
+        (rather than the process-wide default socket timeout).
+        """
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE  # We're fetching the certificate precisely because we don't know it yet.
+        with socket.create_connection((host, port), timeout=timeout) as connection:
+            with context.wrap_socket(connection, server_hostname=host) as tls_connection:
+                der_certificate = tls_connection.getpeercert(binary_form=True)
+        return x509.load_der_x509_certificate(der_certificate, backend=default_backend())
 
     def consider_arrangement(self, arrangement):
         node = arrangement.ursula
@@ -160,11 +291,75 @@ class RestMiddleware:
         return True, ursula.stamp.as_umbral_pubkey()
 
     def reencrypt(self, work_order):
-        ursula_rest_response = self.send_work_order_payload_to_ursula(work_order)
+        return list(self.reencrypt_incrementally(work_order))
+
+    def reencrypt_incrementally(self, work_order):
+        """
+        Yields each cfrag of work_order as soon as Ursula sends it (and it checks out), rather than
+        waiting for the whole work order to be done.  The request is made on the first iteration.
+        """
+        ursula_rest_response = self.send_work_order_payload_to_ursula(work_order, stream=True)
+        try:
+            chunks = ursula_rest_response.iter_content(chunk_size=None)
+            cfrags_and_signatures = self.split_cfrag_stream(chunks, expected_cfrags=len(work_order.tasks))
+            yield from work_order.complete_incrementally(cfrags_and_signatures)
+        finally:
+            ursula_rest_response.close()
+
+    @staticmethod
+    def split_cfrag_stream(chunks, expected_cfrags: int = None):
+        """
+        Parses (cfrag, signature) pairs out of a stream of chunks of bytes, yielding each as soon as it is whole.
+        If expected_cfrags is given, a stream with fewer cfrags than that is an UnexpectedResponse too.
+        """
         splitter = BytestringSplitter((CapsuleFrag, VariableLengthBytestring), Signature)
-        cfrags_and_signatures = splitter.repeat(ursula_rest_response.content)
-        cfrags = work_order.complete(cfrags_and_signatures)
-        return cfrags
+        signature_length = Signature.expected_bytes_length()
+        buffer = bytearray()
+        cfrags_received = 0
+        for chunk in chunks:
+            buffer.extend(chunk)
+            while len(buffer) >= _LENGTH_PREFIX_SIZE:
+                cfrag_length = int.from_bytes(buffer[:_LENGTH_PREFIX_SIZE], byteorder="big")
+                item_length = _LENGTH_PREFIX_SIZE + cfrag_length + signature_length
+                if len(buffer) < item_length:
+                    break
+                cfrag, reencryption_signature = splitter(bytes(buffer[:item_length]))
+                del buffer[:item_length]
+                cfrags_received += 1
+                yield cfrag, reencryption_signature
+        if buffer:
+            raise UnexpectedResponse("Ursula's cfrag stream ended part way through a cfrag.")
+        if expected_cfrags is not None and cfrags_received < expected_cfrags:
+            raise UnexpectedResponse(f"Ursula's cfrag stream ended after {cfrags_received} "
+                                     f"of {expected_cfrags} cfrags.")
+
+    def reencrypt_in_bulk(self, work_orders):
+        """
+        Sends work orders for several arrangements to the Ursula they are all for, in one request.
+        Returns the cfrags for each work order in turn - or None where Ursula didn't have the arrangement.
+        """
+        from nucypher.policy.models import WorkOrder  # Avoid circular import
+
+        ursula_rest_response = self.client.post(
+            node=work_orders[0].ursula,
+            path="kFrags/reencrypt",
+            data=WorkOrder.batch_payload(work_orders),
+            timeout=2 * len(work_orders))
+
+        grouped_cfrag_streams = msgpack.loads(ursula_rest_response.content)
+        if len(grouped_cfrag_streams) != len(work_orders):
+            raise UnexpectedResponse("Ursula answered for the wrong number of work orders.")
+
+        splitter = BytestringSplitter((CapsuleFrag, VariableLengthBytestring), Signature)
+        cfrags_by_work_order = []
+        for work_order, (arrangement_id, cfrag_stream) in zip(work_orders, grouped_cfrag_streams):
+            if bytes(arrangement_id) != work_order.arrangement_id:
+                raise UnexpectedResponse("Ursula answered for the wrong arrangement.")
+            if cfrag_stream is None:
+                cfrags_by_work_order.append(None)
+            else:
+                cfrags_by_work_order.append(work_order.complete(splitter.repeat(cfrag_stream)))
+        return cfrags_by_work_order
 
     def revoke_arrangement(self, ursula, revocation):
         # TODO: Implement revocation confirmations
@@ -191,47 +386,56 @@ class RestMiddleware:
                                     timeout=2)
         return response
 
-    def send_work_order_payload_to_ursula(self, work_order):
+    def send_work_order_payload_to_ursula(self, work_order, stream=False):
         payload = work_order.payload()
         id_as_hex = work_order.arrangement_id.hex()
         return self.client.post(
             node=work_order.ursula,
             path=f"kFrag/{id_as_hex}/reencrypt",
-            data=payload, timeout=2)
+            data=payload, timeout=2, stream=stream)
 
-    def node_information(self, host, port, certificate_filepath=None):
+    def node_information(self, host, port, certificate_filepath=None, timeout=2):
         response = self.client.get(host=host, port=port,
                                    path="public_information",
-                                   timeout=2,
+                                   timeout=timeout,
                                    certificate_filepath=certificate_filepath)
         return response.content
 
     def get_nodes_via_rest(self,
                            node,
                            announce_nodes=None,
-                           nodes_i_need=None,
                            fleet_checksum=None):
-        if nodes_i_need:
-            # TODO: This needs to actually do something.
-            # Include node_ids in the request; if the teacher node doesn't know about the
-            # nodes matching these ids, then it will ask other nodes.
-            pass
-
         if fleet_checksum:
             params = {'fleet': fleet_checksum}
         else:
             params = {}
+        headers = {'Accept-Encoding': self.client.accept_encoding}
 
         if announce_nodes:
             payload = bytes().join(bytes(VariableLengthBytestring(n)) for n in announce_nodes)
             response = self.client.post(node=node,
                                         path="node_metadata",
                                         params=params,
+                                        headers=headers,
                                         data=payload,
                                         )
         else:
             response = self.client.get(node=node,
                                        path="node_metadata",
-                                       params=params)
+                                       params=params,
+                                       headers=headers)
+
+        return response
 
+    def lookup_nodes(self, node, checksum_addresses, hops: int = 0, visited=()):
+        """
+        Asks node for the metadata of specific nodes.  If node doesn't know about all of them,
+        it will ask its own teachers (other than those in visited), who may ask theirs, up to hops times.
+        """
+        payload = bytes().join(to_canonical_address(address) for address in checksum_addresses)
+        response = self.client.post(node=node,
+                                    path="node_metadata/lookup",
+                                    params={'hops': hops, 'visited': ",".join(sorted(visited))},
+                                    data=payload,
+                                    )
         return response
@@ -16,40 +16,49 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import binascii
+import heapq
 import random
+import threading
 from collections import defaultdict, OrderedDict
 from collections import deque
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, Future, wait
 from contextlib import suppress
+from functools import partial
 
 from twisted.python.threadpool import ThreadPool
-from typing import Set, Tuple
+from typing import Set, Tuple, Callable
 
 import maya
 import requests
 import time
 from cryptography.x509 import Certificate
 from eth_keys.datatypes import Signature as EthSignature
+from eth_utils import to_checksum_address
 from requests.exceptions import SSLError
 from twisted.internet import reactor, defer
 from twisted.internet import task
 from twisted.internet.threads import deferToThread
 from twisted.logger import Logger
+from twisted.python.failure import Failure
 
 from bytestring_splitter import BytestringSplitter
 from bytestring_splitter import VariableLengthBytestring, BytestringSplittingError
 from constant_sorrow import constant_or_bytes
 from constant_sorrow.constants import NO_KNOWN_NODES, NOT_SIGNED, NEVER_SEEN, NO_STORAGE_AVAILIBLE, FLEET_STATES_MATCH
 from nucypher.config.constants import SeednodeMetadata, GLOBAL_DOMAIN
-from nucypher.config.storages import ForgetfulNodeStorage
+from nucypher.config.storages import ForgetfulNodeStorage, NodeStorage
 from nucypher.crypto.api import keccak_digest
+from nucypher.crypto.constants import PUBLIC_ADDRESS_LENGTH
 from nucypher.crypto.powers import BlockchainPower, SigningPower, DecryptingPower, NoSigningPower
-from nucypher.crypto.signing import signature_splitter
+from nucypher.crypto.signing import signature_splitter, verification_cache
 from nucypher.network import LEARNING_LOOP_VERSION
 from nucypher.network.exceptions import NodeSeemsToBeDown
+from nucypher.network.health import NodeHealthTracker, PeerCircuitBreakers
 from nucypher.network.middleware import RestMiddleware
 from nucypher.network.nicknames import nickname_from_seed
 from nucypher.network.protocols import SuspiciousActivity
+from nucypher.network.teachers import LatencyAwareTeacherSelection
 from nucypher.network.server import TLSHostingPower
 
 
@@ -76,6 +85,39 @@ def icon_from_checksum(checksum,
     )
 
 
+class FleetStateNodes:
+    """
+    The (checksum address, timestamp epoch) of every node in a fleet state, sorted by address.
+
+    Recording a fleet state only notes how far along the tracker's change journal it was;
+    the nodes themselves are worked out from the journal the first time somebody asks.
+    """
+
+    def __init__(self, tracker: 'FleetStateTracker', position: int, number_of_nodes: int) -> None:
+        self._tracker = tracker
+        self.position = position
+        self._number_of_nodes = number_of_nodes
+        self._node_timestamps = None
+
+    def _materialize(self) -> tuple:
+        if self._node_timestamps is None:
+            self._node_timestamps = self._tracker.node_timestamps_as_of(self.position)
+            self._tracker = None
+        return self._node_timestamps
+
+    def __len__(self):
+        return self._number_of_nodes
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __eq__(self, other):
+        return self._materialize() == tuple(other)
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, self._materialize())
+
+
 class FleetStateTracker:
     """
     A representation of a fleet of NuCypher nodes.
@@ -89,20 +131,69 @@ class FleetStateTracker:
     log = Logger("Learning")
     state_template = namedtuple("FleetState", ("nickname", "metadata", "icon", "nodes", "updated"))
 
+    # Node digests are combined by multiplication modulo this (3072-bit) prime, as in MuHash:
+    # unlike a sum of digests modulo 2**256, finding two different fleets with the same
+    # product is as hard as computing discrete logarithms in a group of this size.
+    _DIGEST_MODULUS = 2 ** 3072 - 1103717
+    _DIGEST_SIZE = 384  # bytes
+
+    # How much fleet state history to keep (for /status, monitoring, and delta syncs with learners).
+    _MAX_FLEET_STATES = 100
+    _MAX_FLEET_STATE_AGE = 60 * 60 * 24  # seconds
+
     def __init__(self):
         self.additional_nodes_to_track = []
         self.updated = maya.now()
-        self._nodes = OrderedDict()
+        self.__nodes = OrderedDict()
         self.states = OrderedDict()
 
+        # Secondary indexes, kept up to date as nodes are remembered: by stamp (for membership tests
+        # with node objects), by serving domain, and a heap of (last seen, address) for staleness.
+        self._addresses_by_stamp = dict()
+        self._addresses_by_domain = defaultdict(set)
+        self._last_seen = dict()
+        self._last_seen_heap = list()
+
+        # The fleet checksum is derived from a running product of per-node digests, so that adding
+        # or replacing a single node doesn't mean re-serializing the whole fleet.  Replaced digests
+        # are divided out lazily: they are multiplied into a denominator, which is only inverted
+        # when the checksum is next calculated.
+        self._node_digests = dict()
+        self._digest_accumulator = 1
+        self._digest_denominator = 1
+
+        # Signed node metadata responses, ready to be served to learners until the fleet changes.
+        self._signed_payloads = dict()
+
+        # Every change to the fleet is journaled as (address, timestamp epoch, or None if the node was
+        # dropped), so that a fleet state only needs to record its position in the journal.  Entries
+        # older than every state we still keep are folded into _journal_base.
+        self._journal = list()
+        self._journal_offset = 0
+        self._journal_base = dict()
+
+        # Nodes may be remembered from node verification threads as well as the reactor.
+        self._lock = threading.RLock()
+
+    @property
+    def _nodes(self):
+        return self.__nodes
+
+    @_nodes.setter
+    def _nodes(self, nodes):
+        with self._lock:
+            self.__nodes = OrderedDict(nodes)
+            self._reindex()
+
     def __setitem__(self, key, value):
-        self._nodes[key] = value
+        with self._lock:
+            self._index_node(key, value)
 
-        if self._tracking:
-            self.log.info("Updating fleet state after saving node {}".format(value))
-            self.record_fleet_state()
-        else:
-            self.log.debug("Not updating fleet state.")
+            if self._tracking:
+                self.log.info("Updating fleet state after saving node {}".format(value))
+                self.record_fleet_state()
+            else:
+                self.log.debug("Not updating fleet state.")
 
     def __getitem__(self, item):
         return self._nodes[item]
@@ -111,7 +202,12 @@ class FleetStateTracker:
         return bool(self._nodes)
 
     def __contains__(self, item):
-        return item in self._nodes.keys() or item in self._nodes.values()
+        if isinstance(item, str):
+            return item in self._nodes
+        try:
+            return bytes(item.stamp) in self._addresses_by_stamp
+        except (AttributeError, NoSigningPower):
+            return False
 
     def __iter__(self):
         yield from self._nodes.values()
@@ -161,34 +257,251 @@ class FleetStateTracker:
         fleet_state_updated_bytes = self.updated.epoch.to_bytes(4, byteorder="big")
         return fleet_state_checksum_bytes + fleet_state_updated_bytes
 
+    @classmethod
+    def node_digest(cls, node) -> int:
+        """
+        Maps node to an element of the multiplicative group modulo _DIGEST_MODULUS,
+        by stretching its keccak digest to _DIGEST_SIZE bytes.
+        """
+        seed = keccak_digest(bytes(node))
+        stretched = b"".join(keccak_digest(seed + counter.to_bytes(2, byteorder="big"))
+                             for counter in range(cls._DIGEST_SIZE // 32))
+        return int.from_bytes(stretched, byteorder="big") % cls._DIGEST_MODULUS
+
+    @classmethod
+    def _inverse(cls, digest: int) -> int:
+        try:
+            return pow(digest, -1, cls._DIGEST_MODULUS)
+        except ValueError:  # Before Python 3.8; Fermat's little theorem will do, if more slowly.
+            return pow(digest, cls._DIGEST_MODULUS - 2, cls._DIGEST_MODULUS)
+
+    def _track_node_digest(self, address, node) -> None:
+        previous_digest = self._node_digests.get(address)
+        new_digest = self.node_digest(node)
+        self._node_digests[address] = new_digest
+        self._digest_accumulator = self._digest_accumulator * new_digest % self._DIGEST_MODULUS
+        if previous_digest is not None:
+            self._digest_denominator = self._digest_denominator * previous_digest % self._DIGEST_MODULUS
+        self._signed_payloads.clear()
+
+    def _index_node(self, address, node) -> None:
+        previous_node = self._nodes.get(address)
+        self._nodes[address] = node
+        self._track_node_digest(address, node)
+
+        if previous_node is not None:
+            with suppress(AttributeError, NoSigningPower):
+                del self._addresses_by_stamp[bytes(previous_node.stamp)]
+            for domain in getattr(previous_node, "serving_domains", ()):
+                self._addresses_by_domain[domain].discard(address)
+        with suppress(AttributeError, NoSigningPower):
+            self._addresses_by_stamp[bytes(node.stamp)] = address
+        for domain in getattr(node, "serving_domains", ()):
+            self._addresses_by_domain[domain].add(address)
+
+        with suppress(AttributeError):
+            self._journal.append((address, node.timestamp.epoch))
+
+        last_seen = getattr(node, "last_seen", NEVER_SEEN)
+        if last_seen is not NEVER_SEEN:
+            self._track_last_seen(address, last_seen.epoch)
+        elif address not in self._last_seen:
+            self._track_last_seen(address, -1)
+
+    def _reindex(self) -> None:
+        """
+        Rebuilds every index (and the fleet digest) from scratch, as when _nodes is replaced wholesale.
+        """
+        nodes = list(self._nodes.items())
+        dropped_addresses = set(self._node_digests) - set(address for address, _node in nodes)
+        self._journal.extend((address, None) for address in dropped_addresses)
+        self.__nodes = OrderedDict()
+        self._addresses_by_stamp = dict()
+        self._addresses_by_domain = defaultdict(set)
+        self._last_seen = dict()
+        self._last_seen_heap = list()
+        self._node_digests = dict()
+        self._digest_accumulator = 1
+        self._digest_denominator = 1
+        for address, node in nodes:
+            self._index_node(address, node)
+
+    def _track_last_seen(self, address, epoch: int) -> None:
+        self._last_seen[address] = epoch
+        heapq.heappush(self._last_seen_heap, (epoch, address))
+        if len(self._last_seen_heap) > 2 * len(self._last_seen) + 16:
+            # Too many superseded entries; start over.
+            self._last_seen_heap = [(e, a) for a, e in self._last_seen.items()]
+            heapq.heapify(self._last_seen_heap)
+
+    def mark_seen(self, node, when: maya.MayaDT = None) -> None:
+        """
+        Records that we just heard from node.
+        """
+        when = when or maya.now()
+        node.last_seen = when
+        with self._lock:
+            if node.checksum_public_address in self._nodes:
+                self._track_last_seen(node.checksum_public_address, when.epoch)
+
+    def stalest(self, quantity: int) -> list:
+        """
+        Returns up to quantity known nodes, those we haven't heard from for longest (or ever) first.
+        """
+        with self._lock:
+            stalest_entries = list()
+            seen_addresses = set()
+            while self._last_seen_heap and len(stalest_entries) < quantity:
+                epoch, address = heapq.heappop(self._last_seen_heap)
+                if self._last_seen.get(address) != epoch or address in seen_addresses:
+                    continue  # Superseded by a more recent sighting.
+                stalest_entries.append((epoch, address))
+                seen_addresses.add(address)
+            for entry in stalest_entries:
+                heapq.heappush(self._last_seen_heap, entry)
+            return [self._nodes[address] for _epoch, address in stalest_entries]
+
+    def nodes_serving(self, domains) -> list:
+        """
+        Returns the known nodes which serve at least one of domains.
+        """
+        with self._lock:
+            addresses = set()
+            for domain in domains:
+                addresses.update(self._addresses_by_domain.get(domain, ()))
+            return [self._nodes[address] for address in addresses]
+
+    def signed_payload(self, key, build_payload: Callable) -> bytes:
+        """
+        Returns the signed response for key, building it with build_payload only
+        if we haven't already done so since the fleet last changed.
+        """
+        try:
+            return self._signed_payloads[key]
+        except KeyError:
+            payload = build_payload()
+            self._signed_payloads[key] = payload
+            return payload
+
+    def update(self, nodes: dict) -> None:
+        with self._lock:
+            for address, node in nodes.items():
+                self._index_node(address, node)
+
+    def _calculate_checksum(self) -> str:
+        with self._lock:
+            if self._digest_denominator != 1:
+                inverse = self._inverse(self._digest_denominator)
+                self._digest_accumulator = self._digest_accumulator * inverse % self._DIGEST_MODULUS
+                self._digest_denominator = 1
+            accumulator = self._digest_accumulator
+        for node in self.additional_nodes_to_track:
+            accumulator = accumulator * self.node_digest(node) % self._DIGEST_MODULUS
+        number_of_nodes = len(self._nodes) + len(self.additional_nodes_to_track)
+
+        checksum_preimage = accumulator.to_bytes(self._DIGEST_SIZE, byteorder="big") \
+                            + number_of_nodes.to_bytes(4, byteorder="big")
+        return keccak_digest(checksum_preimage).hex()
+
+    def _track_additional_nodes(self, nodes) -> None:
+        for node in nodes:
+            self.additional_nodes_to_track.append(node)
+            self._journal.append((node.checksum_public_address, node.timestamp.epoch))
+
     def record_fleet_state(self, additional_nodes_to_track=None):
-        if additional_nodes_to_track:
-            self.additional_nodes_to_track.extend(additional_nodes_to_track)
-        if not self._nodes:
-            # No news here.
+        with self._lock:
+            if additional_nodes_to_track:
+                self._track_additional_nodes(additional_nodes_to_track)
+            if not self._nodes:
+                # No news here.
+                return
+
+            checksum = self._calculate_checksum()
+            if checksum not in self.states:
+                self._signed_payloads.clear()
+                self.checksum = checksum
+                self.updated = maya.now()
+                # Rather than holding on to the nodes themselves, each state records
+                # where the change journal was up to; see FleetStateNodes.
+                node_timestamps = FleetStateNodes(tracker=self,
+                                                  position=self._journal_offset + len(self._journal),
+                                                  number_of_nodes=len(self._nodes) + len(self.additional_nodes_to_track))
+                new_state = self.state_template(nickname=self.nickname,
+                                                metadata=self.nickname_metadata,
+                                                nodes=node_timestamps,
+                                                icon=self.icon,
+                                                updated=self.updated,
+                                                )
+                self.states[checksum] = new_state
+                self._evict_old_states()
+                return checksum, new_state
+
+    def _evict_old_states(self) -> None:
+        """
+        Forgets the oldest fleet states beyond _MAX_FLEET_STATES, and those older than _MAX_FLEET_STATE_AGE.
+        The current state is always kept.
+        """
+        oldest_to_keep = self.updated.subtract(seconds=self._MAX_FLEET_STATE_AGE)
+        while len(self.states) > 1:
+            oldest_checksum, oldest_state = next(iter(self.states.items()))
+            if len(self.states) <= self._MAX_FLEET_STATES and oldest_state.updated >= oldest_to_keep:
+                break
+            del self.states[oldest_checksum]
+        self._compact_journal()
+
+    def _compact_journal(self) -> None:
+        """
+        Folds the journal entries that no state we keep still needs into _journal_base.  This is only done
+        once they make up half the journal, so that each entry is folded (and copied) a bounded number of times.
+        """
+        oldest_position = next(iter(self.states.values())).nodes.position
+        foldable = oldest_position - self._journal_offset
+        if foldable < max(len(self._journal) // 2, 1):
             return
-        sorted_nodes = self.sorted()
-
-        sorted_nodes_joined = b"".join(bytes(n) for n in sorted_nodes)
-        checksum = keccak_digest(sorted_nodes_joined).hex()
-        if checksum not in self.states:
-            self.checksum = keccak_digest(b"".join(bytes(n) for n in self.sorted())).hex()
-            self.updated = maya.now()
-            # For now we store the sorted node list.  Someday we probably spin this out into
-            # its own class, FleetState, and use it as the basis for partial updates.
-            new_state = self.state_template(nickname=self.nickname,
-                                            metadata=self.nickname_metadata,
-                                            nodes=sorted_nodes,
-                                            icon=self.icon,
-                                            updated=self.updated,
-                                            )
-            self.states[checksum] = new_state
-            return checksum, new_state
+        for address, epoch in self._journal[:foldable]:
+            if epoch is None:
+                self._journal_base.pop(address, None)
+            else:
+                self._journal_base[address] = epoch
+        del self._journal[:foldable]
+        self._journal_offset = oldest_position
+
+    def node_timestamps_as_of(self, position: int) -> tuple:
+        """
+        Returns the (address, timestamp epoch) of every node, sorted by address,
+        as they were when the change journal was at position.
+        """
+        with self._lock:
+            if position < self._journal_offset:
+                raise ValueError("The fleet state at journal position {} has been forgotten.".format(position))
+            node_timestamps = dict(self._journal_base)
+            for address, epoch in self._journal[:position - self._journal_offset]:
+                if epoch is None:
+                    node_timestamps.pop(address, None)
+                else:
+                    node_timestamps[address] = epoch
+        return tuple(sorted(node_timestamps.items()))
+
+    def nodes_updated_since(self, checksum):
+        """
+        Returns the known nodes which were added or updated since this tracker
+        was in the fleet state identified by checksum, or None if we don't have
+        a record of that state.
+        """
+        with self._lock:
+            try:
+                state = self.states[checksum]
+            except KeyError:
+                return None
+
+            changes_since = self._journal[state.nodes.position - self._journal_offset:]
+            updated_addresses = OrderedDict.fromkeys(address for address, _epoch in changes_since)
+            return [self._nodes[address] for address in updated_addresses if address in self._nodes]
 
     def start_tracking_state(self, additional_nodes_to_track=None):
         if additional_nodes_to_track is None:
             additional_nodes_to_track = list()
-        self.additional_nodes_to_track.extend(additional_nodes_to_track)
+        self._track_additional_nodes(additional_nodes_to_track)
         self._tracking = True
         self.update_fleet_state()
 
@@ -241,6 +554,103 @@ class FleetStateTracker:
                 }
 
 
+class NodeSketch:
+    """
+    The handful of fields a learner needs in order to decide whether a node is worth
+    considering (its address, timestamp and domains), read from the front of a node's
+    metadata without parsing the rest of it.
+
+    The full node is only built - certificate, powers, REST server and all - when
+    materialize() is called, which is when we actually go on to verify or remember it.
+    """
+
+    _header_splitter = BytestringSplitter(PUBLIC_ADDRESS_LENGTH,
+                                          VariableLengthBytestring,
+                                          (int, 4, {'byteorder': 'big'}))
+
+    def __init__(self, node_class, version: int, node_bytes: bytes, federated_only: bool = False) -> None:
+        self.node_class = node_class
+        self.version = version
+        self.node_bytes = node_bytes
+        self.federated_only = federated_only
+        self._node = None
+
+        canonical_address, domains_vbytes, timestamp = self._header_splitter(node_bytes, return_remainder=True)[:3]
+        self.checksum_public_address = to_checksum_address(canonical_address)
+        self.serving_domains = set(constant_or_bytes(d) for d in VariableLengthBytestring.dispense(domains_vbytes))
+        self.timestamp = maya.MayaDT(timestamp)
+
+    def __repr__(self):
+        return "{}({}, {})".format(self.__class__.__name__, self.checksum_public_address, self.timestamp)
+
+    def materialize(self):
+        """
+        Returns the full node which this sketch describes (only building it the first time).
+        """
+        if self._node is None:
+            self._node = self.node_class.from_bytes(self.node_bytes, self.version, federated_only=self.federated_only)
+        return self._node
+
+
+class NodeVerificationPool:
+    """
+    Verifies nodes on a bounded number of threads on behalf of a Learner,
+    remembering each node as soon as its verification succeeds.
+
+    Only one verification per address is in flight at a time; asking to verify a node
+    which is already being verified returns the pending verification.
+    """
+
+    def __init__(self, learner: 'Learner', concurrency: int, timeout: float) -> None:
+        self.learner = learner
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=concurrency)
+        self._in_flight = dict()
+        self._lock = threading.Lock()
+
+        # Certificates of nodes we haven't verified yet are kept out of the learner's node storage;
+        # remember_node puts them there once (and only if) verification succeeds.
+        self._unverified_certificates = ForgetfulNodeStorage(federated_only=learner.federated_only,
+                                                             character_class=learner.__class__)
+
+    def __len__(self):
+        return len(self._in_flight)
+
+    def submit(self, node) -> Future:
+        """
+        Schedules node for verification.  The result of the returned Future is that
+        of remember_node, or the exception which kept the node from being verified.
+        """
+        address = node.checksum_public_address
+        with self._lock:
+            with suppress(KeyError):
+                return self._in_flight[address]
+            verification = self._executor.submit(self._verify_and_remember, node)
+            self._in_flight[address] = verification
+        verification.add_done_callback(lambda _: self._finish(address, verification))
+        return verification
+
+    def _finish(self, address, verification) -> None:
+        with self._lock:
+            if self._in_flight.get(address) is verification:
+                del self._in_flight[address]
+
+    def _verify_and_remember(self, node):
+        certificate_filepath = self._unverified_certificates.store_node_certificate(certificate=node.certificate)
+        try:
+            node.verify_node(self.learner.network_middleware,
+                             accept_federated_only=self.learner.federated_only,  # TODO: 466
+                             certificate_filepath=certificate_filepath,
+                             timeout=self.timeout)
+        except NodeSeemsToBeDown as e:
+            self.learner.record_connection_failure(node, e)
+            raise
+        finally:
+            with suppress(KeyError):
+                self._unverified_certificates.remove(node.checksum_public_address, metadata=False)
+        return self.learner.remember_node(node, record_fleet_state=False)
+
+
 class Learner:
     """
     Any participant in the "learning loop" - a class inheriting from
@@ -253,6 +663,14 @@ class Learner:
     _LONG_LEARNING_DELAY = 90
     LEARNING_TIMEOUT = 10
     _ROUNDS_WITHOUT_NODES_AFTER_WHICH_TO_SLOW_DOWN = 10
+    _TEACHERS_PER_ROUND = 1
+    _VERIFICATION_CONCURRENCY = 10
+    _VERIFICATION_TIMEOUT = 2
+    _PAUSE_BETWEEN_BLOCKING_ROUNDS = .1
+    _SEEDNODE_TIMEOUT = 3
+    _SEEDING_DEADLINE = 10  # For all of the seed nodes together, however many retries each of them takes.
+    _LOOKUP_HOPS = 1
+    _LOOKUP_FANOUT = 3
 
     # For Keeps
     __DEFAULT_NODE_STORAGE = ForgetfulNodeStorage
@@ -262,6 +680,7 @@ class Learner:
     node_splitter = BytestringSplitter(VariableLengthBytestring)
     version_splitter = BytestringSplitter((int, 2, {"byteorder": "big"}))
     tracker_class = FleetStateTracker
+    teacher_selection_class = LatencyAwareTeacherSelection
 
     invalid_metadata_message = "{} has invalid metadata.  Maybe its stake is over?  Or maybe it is transitioning to a new interface.  Ignoring."
     unknown_version_message = "{} purported to be of version {}, but we're only version {}.  Is there a new version of NuCypher?"
@@ -285,7 +704,7 @@ class Learner:
 
     def __init__(self,
                  domains: Set,
-                 network_middleware: RestMiddleware = __DEFAULT_MIDDLEWARE_CLASS(),
+                 network_middleware: RestMiddleware = None,
                  start_learning_now: bool = False,
                  learn_on_same_thread: bool = False,
                  known_nodes: tuple = None,
@@ -294,20 +713,38 @@ class Learner:
                  save_metadata: bool = False,
                  abort_on_learning_error: bool = False,
                  lonely: bool = False,
+                 teachers_per_round: int = None,
+                 verification_concurrency: int = None,
+                 verification_timeout: float = None,
+                 teacher_selection=None,
                  ) -> None:
 
         self.log = Logger("learning-loop")  # type: Logger
 
         self.learning_domains = domains
-        self.network_middleware = network_middleware
+        self.network_middleware = network_middleware or self.__DEFAULT_MIDDLEWARE_CLASS()
         self.save_metadata = save_metadata
         self.start_learning_now = start_learning_now
         self.learn_on_same_thread = learn_on_same_thread
+        self.teachers_per_round = teachers_per_round or self._TEACHERS_PER_ROUND
+        self.verification_concurrency = verification_concurrency or self._VERIFICATION_CONCURRENCY
+        self.verification_timeout = verification_timeout or self._VERIFICATION_TIMEOUT
+        self.node_health = NodeHealthTracker(peer_is_available=lambda node: self.network_middleware.peer_is_available(node))
+        self.teacher_selection = teacher_selection or self.teacher_selection_class()
+        self.verification_pool = NodeVerificationPool(learner=self,
+                                                      concurrency=self.verification_concurrency,
+                                                      timeout=self.verification_timeout)
 
         self._abort_on_learning_error = abort_on_learning_error
         self._learning_listeners = defaultdict(list)
+        self._known_nodes_changed = threading.Condition()
         self._node_ids_to_learn_about_immediately = set()
 
+        # Learning rounds run on the learning thread, while REST handlers and callers on the reactor
+        # ask for nodes and register listeners; this guards the listeners, the nodes we've been asked
+        # to learn about, and the queue of teachers.
+        self._learning_state_lock = threading.RLock()
+
         self.__known_nodes = self.tracker_class()
 
         self.lonely = lonely
@@ -334,7 +771,13 @@ class Learner:
 
         self.teacher_nodes = deque()
         self._current_teacher_node = None  # type: Teacher
-        self._learning_task = task.LoopingCall(self.keep_learning_about_nodes)
+        # Learning rounds make blocking network calls, so they run on a thread of their own
+        # rather than on the reactor (which may be serving our REST app at the same time).
+        # It's started with the first round, and shut down when the learning loop is stopped.
+        self._learning_executor = None
+        self._learning_round_in_flight = False
+        self._learn_again_when_done = False
+        self._learning_task = task.LoopingCall(self._learn_in_background)
         self._learning_round = 0  # type: int
         self._rounds_without_new_nodes = 0  # type: int
         self._seed_nodes = seed_nodes or []
@@ -357,22 +800,32 @@ class Learner:
             self.log.debug("Already done seeding; won't try again.")
             return
 
-        from nucypher.characters.lawful import Ursula
-        for seednode_metadata in self._seed_nodes:
-
-            self.log.debug(
-                "Seeding from: {}|{}:{}".format(seednode_metadata.checksum_public_address,
-                                                seednode_metadata.rest_host,
-                                                seednode_metadata.rest_port))
-
-            seed_node = Ursula.from_seednode_metadata(seednode_metadata=seednode_metadata,
-                                                      network_middleware=self.network_middleware,
-                                                      federated_only=self.federated_only)  # TODO: 466
-            if seed_node is False:
-                self.unresponsive_seed_nodes.add(seednode_metadata)
-            else:
-                self.unresponsive_seed_nodes.discard(seednode_metadata)
-                self.remember_node(seed_node)
+        if self._seed_nodes:
+            # Every seed node is contacted at once, so that an unreachable one doesn't hold up the rest -
+            # and those that haven't answered by the deadline are left to it, and tried again later.
+            executor = ThreadPoolExecutor(max_workers=len(self._seed_nodes))
+            pending_seed_nodes = {executor.submit(self._load_seednode, seednode_metadata): seednode_metadata
+                                  for seednode_metadata in self._seed_nodes}
+            executor.shutdown(wait=False)
+            _answered, too_slow = wait(pending_seed_nodes, timeout=self._SEEDING_DEADLINE)
+
+            for pending_seed_node, seednode_metadata in pending_seed_nodes.items():
+                if pending_seed_node in too_slow:
+                    self.log.warn("Seednode {}:{} didn't answer within {} seconds.".format(seednode_metadata.rest_host,
+                                                                                       seednode_metadata.rest_port,
+                                                                                       self._SEEDING_DEADLINE))
+                    self.unresponsive_seed_nodes.add(seednode_metadata)
+                    continue
+                try:
+                    seed_node = pending_seed_node.result()
+                except (RuntimeError, OSError) as e:  # Down, timed out, or with a TLS certificate we can't use.
+                    self.log.warn("Seednode {}:{} is unresponsive: {}".format(seednode_metadata.rest_host,
+                                                                           seednode_metadata.rest_port,
+                                                                           e))
+                    self.unresponsive_seed_nodes.add(seednode_metadata)
+                else:
+                    self.unresponsive_seed_nodes.discard(seednode_metadata)
+                    self.remember_node(seed_node)  # This also keeps its certificate in our node storage.
 
         if not self.unresponsive_seed_nodes:
             self.log.info("Finished learning about all seednodes.")
@@ -386,10 +839,45 @@ class Learner:
             self.log.warn("No seednodes were available after {} attempts".format(retry_attempts))
             # TODO: Need some actual logic here for situation with no seed nodes (ie, maybe try again much later)
 
+    def _load_seednode(self, seednode_metadata):
+        """
+        Connects to and verifies a single seed node, skipping the TLS certificate probe
+        if we already have its certificate from a previous run.
+        """
+        from nucypher.characters.lawful import Ursula
+
+        self.log.debug(
+            "Seeding from: {}|{}:{}".format(seednode_metadata.checksum_public_address,
+                                            seednode_metadata.rest_host,
+                                            seednode_metadata.rest_port))
+
+        seed_certificate = None
+        if self.node_storage is not NO_STORAGE_AVAILIBLE:
+            with suppress(FileNotFoundError, NodeStorage.UnknownNode):
+                seed_certificate = self.node_storage.get(checksum_address=seednode_metadata.checksum_public_address,
+                                                         federated_only=self.federated_only,
+                                                         certificate_only=True)
+
+        load_seednode = partial(Ursula.from_seednode_metadata,
+                                seednode_metadata=seednode_metadata,
+                                network_middleware=self.network_middleware,
+                                federated_only=self.federated_only,  # TODO: 466
+                                timeout=self._SEEDNODE_TIMEOUT)
+        try:
+            return load_seednode(seed_certificate=seed_certificate)
+        except SSLError:
+            if seed_certificate is None:
+                raise
+            # The seed node has a new certificate since we last saw it.
+            self.log.info("Stored certificate for seednode {} is out of date; fetching it again.".format(
+                seednode_metadata.checksum_public_address))
+            return load_seednode()
+
     def read_nodes_from_storage(self) -> set:
         stored_nodes = self.node_storage.all(federated_only=self.federated_only)  # TODO: 466
-        for node in stored_nodes:
-            self.remember_node(node)
+        new_nodes = self._verify_and_remember_nodes(stored_nodes)
+        if new_nodes:
+            self.known_nodes.record_fleet_state()
 
     def remember_node(self, node, force_verification_check=False, record_fleet_state=True):
 
@@ -424,15 +912,20 @@ class Learner:
                              accept_federated_only=self.federated_only,
                              # TODO: 466 - move federated-only up to Learner?
                              )
-        except SSLError:
-            return False  # TODO: Bucket this node as having bad TLS info - maybe it's an update that hasn't fully propagated?
+        except SSLError as e:
+            # Maybe it's an update that hasn't fully propagated?
+            self.record_connection_failure(node, e)
+            return False
 
-        except NodeSeemsToBeDown:
+        except NodeSeemsToBeDown as e:
             self.log.info("No Response while trying to verify node {}|{}".format(node.rest_interface, node))
-            return False  # TODO: Bucket this node as "ghost" or something: somebody else knows about it, but we can't get to it.
+            self.record_connection_failure(node, e)
+            return False
 
-        listeners = self._learning_listeners.pop(node.checksum_public_address, tuple())
         address = node.checksum_public_address
+        with self._learning_state_lock:
+            listeners = self._learning_listeners.pop(address, tuple())
+            self._node_ids_to_learn_about_immediately.discard(address)
 
         self.known_nodes[address] = node
 
@@ -442,7 +935,8 @@ class Learner:
         self.log.info("Remembering {} ({}), popping {} listeners.".format(node.nickname, node.checksum_public_address, len(listeners)))
         for listener in listeners:
             listener.add(address)
-        self._node_ids_to_learn_about_immediately.discard(address)
+        with self._known_nodes_changed:
+            self._known_nodes_changed.notify_all()
 
         if record_fleet_state:
             self.known_nodes.record_fleet_state()
@@ -463,7 +957,8 @@ class Learner:
                 self.load_seednodes()
 
             self.learn_from_teacher_node()
-            self.learning_deferred = self._learning_task.start(interval=self._SHORT_LEARNING_DELAY)
+            # We just had a round; the next one can wait for the interval.
+            self.learning_deferred = self._learning_task.start(interval=self._SHORT_LEARNING_DELAY, now=False)
             self.learning_deferred.addErrback(self.handle_learning_errors)
             return self.learning_deferred
         else:
@@ -487,6 +982,10 @@ class Learner:
         Only for tests at this point.  Maybe some day for graceful shutdowns.
         """
         self._learning_task.stop()
+        if self._learning_executor is not None:
+            # A round that's already underway is left to finish on its own.
+            self._learning_executor.shutdown(wait=False)
+            self._learning_executor = None
 
     def handle_learning_errors(self, *args, **kwargs):
         failure = args[0]
@@ -505,6 +1004,8 @@ class Learner:
         is unhandled in a different thread, especially inside a loop like the learning loop.
         """
         self._crashed = failure
+        with self._known_nodes_changed:
+            self._known_nodes_changed.notify_all()  # Don't leave anyone waiting on a learner that has crashed.
         failure.raiseException()
         # TODO: We don't actually have checksum_public_address at this level - maybe only Characters can crash gracefully :-)
         self.log.critical("{} crashed with {}".format(self.checksum_public_address, failure))
@@ -515,7 +1016,14 @@ class Learner:
         if not nodes_we_know_about:
             raise self.NotEnoughTeachers("Need some nodes to start learning from.")
 
-        self.teacher_nodes.extend(nodes_we_know_about)
+        eligible_teachers, _backed_off = self.node_health.partition(nodes_we_know_about)
+        if not eligible_teachers:
+            raise self.NotEnoughTeachers("All of the nodes we know about have been unreachable lately.")
+
+        # Teachers are popped from the right.
+        teachers = self.teacher_selection.select(eligible_teachers, quantity=self.teachers_per_round)
+        with self._learning_state_lock:
+            self.teacher_nodes.extend(reversed(teachers))
 
     def cycle_teacher_node(self):
         # To ensure that all the best teachers are available, first let's make sure
@@ -524,13 +1032,19 @@ class Learner:
             self.log.info("Still have unresponsive seed nodes; trying again to connect.")
             self.load_seednodes()  # Ideally, this is async and singular.
 
-        if not self.teacher_nodes:
-            self.select_teacher_nodes()
-        try:
-            self._current_teacher_node = self.teacher_nodes.pop()
-        except IndexError:
-            error = "Not enough nodes to select a good teacher, Check your network connection then node configuration"
-            raise self.NotEnoughTeachers(error)
+        self._current_teacher_node = None
+        with self._learning_state_lock:
+            if not self.teacher_nodes:
+                self.select_teacher_nodes()
+            try:
+                teacher = self.teacher_nodes.pop()
+                # Teachers may have become unreachable since they were selected.
+                while not self.node_health.is_available(teacher):
+                    teacher = self.teacher_nodes.pop()
+            except IndexError:
+                error = "Not enough nodes to select a good teacher, Check your network connection then node configuration"
+                raise self.NotEnoughTeachers(error)
+        self._current_teacher_node = teacher
         self.log.info("Cycled teachers; New teacher is {}".format(self._current_teacher_node))
 
     def current_teacher_node(self, cycle=False):
@@ -546,6 +1060,10 @@ class Learner:
 
     def learn_about_nodes_now(self, force=False):
         if self._learning_task.running:
+            if self._learning_round_in_flight:
+                # Don't start a second round alongside this one; start it as soon as this one is over.
+                self._learn_again_when_done = True
+                return
             self._learning_task.reset()
             self._learning_task()
         elif not force:
@@ -555,15 +1073,73 @@ class Learner:
             self.log.info("Learning loop wasn't started; forcing start now.")
             self._learning_task.start(self._SHORT_LEARNING_DELAY, now=True)
 
+    def _learn_in_background(self) -> defer.Deferred:
+        """
+        Runs keep_learning_about_nodes on the learning thread.  The returned Deferred
+        fires on the reactor thread once the round is over, so that the learning task
+        doesn't schedule the next round before then.
+
+        Without a running reactor there's nobody to hand the result back to, so the
+        round runs right here instead.
+        """
+        if not reactor.running:
+            return self.keep_learning_about_nodes()
+
+        self._learning_round_in_flight = True
+        round_over = defer.Deferred()
+
+        def learning_round():
+            try:
+                return self.keep_learning_about_nodes()
+            except Exception:
+                return Failure()  # Captured here, so that the traceback survives the trip back to the reactor.
+            finally:
+                # Not left to the reactor, which may not get around to it (if it isn't processing events).
+                self._learning_round_in_flight = False
+
+        if self._learning_executor is None:
+            self._learning_executor = ThreadPoolExecutor(max_workers=1)
+        round_in_progress = self._learning_executor.submit(learning_round)
+        round_in_progress.add_done_callback(
+            lambda finished_round: reactor.callFromThread(self._learning_round_finished,
+                                                          finished_round.result(),
+                                                          round_over))
+        return round_over
+
+    def _learning_round_finished(self, result, round_over: defer.Deferred) -> None:
+        if isinstance(result, Failure):
+            round_over.errback(result)
+        else:
+            round_over.callback(result)
+        learn_again, self._learn_again_when_done = self._learn_again_when_done, False
+        if learn_again and self._learning_task.running:
+            self.learn_about_nodes_now()
+
     def keep_learning_about_nodes(self):
         """
         Continually learn about new nodes.
         """
+        # Nodes that somebody is waiting on are looked up by name first.
+        with self._learning_state_lock:
+            wanted_node_ids = set(self._node_ids_to_learn_about_immediately)
+        if wanted_node_ids:
+            self.get_nodes_by_ids(wanted_node_ids)
+
         # TODO: Allow the user to set eagerness?
-        self.learn_from_teacher_node(eager=False)
+        if self.teachers_per_round > 1:
+            self.learn_from_teachers()
+        else:
+            self.learn_from_teacher_node(eager=False)
+
+    def record_connection_failure(self, node, error) -> None:
+        if isinstance(error, PeerCircuitBreakers.CircuitOpen):
+            return  # Nothing was sent; the failures that opened the circuit were counted as they happened.
+        bucket = self.node_health.BAD_TLS if isinstance(error, SSLError) else self.node_health.GHOST
+        self.node_health.record_failure(node.checksum_public_address, bucket=bucket)
 
     def learn_about_specific_nodes(self, addresses: Set):
-        self._node_ids_to_learn_about_immediately.update(addresses)  # hmmmm
+        with self._learning_state_lock:
+            self._node_ids_to_learn_about_immediately.update(addresses)  # hmmmm
         self.learn_about_nodes_now()
 
     # TODO: Dehydrate these next two methods.
@@ -592,14 +1168,17 @@ class Learner:
                     self.log.warn("Teacher was unreachable.  No good way to handle this on the main thread.")
 
             # The rest of the fucking owl
-            if (maya.now() - start).seconds > timeout:
+            remaining = timeout - (maya.now() - start).total_seconds()
+            if remaining <= 0:
                 if not self._learning_task.running:
                     raise RuntimeError("Learning loop is not running.  Start it with start_learning().")
                 else:
                     raise self.NotEnoughNodes("After {} seconds and {} rounds, didn't find {} nodes".format(
                         timeout, rounds_undertaken, number_of_nodes_to_know))
             else:
-                time.sleep(.1)
+                self._wait_for_known_nodes(lambda: len(self.__known_nodes) >= number_of_nodes_to_know,
+                                           timeout=remaining,
+                                           learn_on_this_thread=learn_on_this_thread)
 
     def block_until_specific_nodes_are_known(self,
                                              addresses: Set,
@@ -609,6 +1188,10 @@ class Learner:
         start = maya.now()
         starting_round = self._learning_round
 
+        if learn_on_this_thread:
+            # Before learning at large, ask for these nodes by name.
+            self.get_nodes_by_ids(addresses)
+
         while True:
             if self._crashed:
                 return self._crashed
@@ -623,7 +1206,8 @@ class Learner:
             if learn_on_this_thread:
                 self.learn_from_teacher_node(eager=True)
 
-            if (maya.now() - start).seconds > timeout:
+            remaining = timeout - (maya.now() - start).total_seconds()
+            if remaining <= 0:
 
                 still_unknown = addresses.difference(self.known_nodes.addresses())
 
@@ -636,7 +1220,20 @@ class Learner:
                         "After {} seconds and {} rounds, didn't find these {} nodes: {}".format(
                             timeout, rounds_undertaken, len(still_unknown), still_unknown))
             else:
-                time.sleep(.1)
+                self._wait_for_known_nodes(lambda: self._crashed or addresses.issubset(self.known_nodes.addresses()),
+                                           timeout=remaining,
+                                           learn_on_this_thread=learn_on_this_thread)
+
+    def _wait_for_known_nodes(self, predicate, timeout: float, learn_on_this_thread: bool = False) -> bool:
+        """
+        Waits until predicate is true, waking up as soon as remember_node gives it reason to be.
+
+        If we're learning on this thread, we only pause briefly before the next learning round.
+        """
+        if learn_on_this_thread:
+            timeout = min(timeout, self._PAUSE_BETWEEN_BLOCKING_ROUNDS)
+        with self._known_nodes_changed:
+            return self._known_nodes_changed.wait_for(predicate, timeout=timeout)
 
     def _adjust_learning(self, node_list):
         """
@@ -660,26 +1257,86 @@ class Learner:
         """
         If any node_addresses are discovered, push them to queue_to_push.
         """
-        for node_address in node_addresses:
-            self.log.info("Adding listener for {}".format(node_address))
-            self._learning_listeners[node_address].append(queue_to_push)
+        with self._learning_state_lock:
+            for node_address in node_addresses:
+                self.log.info("Adding listener for {}".format(node_address))
+                self._learning_listeners[node_address].append(queue_to_push)
 
     def network_bootstrap(self, node_list: list) -> None:
         for node_addr, port in node_list:
             new_nodes = self.learn_about_nodes_now(node_addr, port)
-            self.__known_nodes.update(new_nodes)
+            self.__known_nodes.update({node.checksum_public_address: node for node in new_nodes})
+
+    def get_nodes_by_ids(self, node_ids) -> list:
+        """
+        Returns the nodes with these checksum addresses, looking up (and verifying) any we don't already know.
+        Nodes which can't be found are left out.
+        """
+        # Scenario 1: We already know about this node.
+        unknown_node_ids = set(node_ids) - set(self.__known_nodes.addresses())
+
+        # Scenario 2: We don't know about this node, but a nearby node (or one of its teachers) does.
+        if unknown_node_ids:
+            self._verify_and_remember_nodes(self.lookup_nodes(unknown_node_ids))
 
-    def get_nodes_by_ids(self, node_ids):
-        for node_id in node_ids:
+        # Scenario 3: We don't know about this node, and neither do our friends.
+        return [self.__known_nodes[node_id] for node_id in node_ids if node_id in self.__known_nodes.addresses()]
+
+    def lookup_nodes(self, checksum_addresses, hops: int = None, visited: Set = None) -> list:
+        """
+        Asks a few teachers for the nodes at checksum_addresses that we don't know about yet;
+        teachers which don't know about them either may pass the question on, up to hops times
+        (and never more than _LOOKUP_HOPS times).
+
+        visited holds the addresses of the nodes which have already been asked as part of this
+        lookup; they aren't asked again.
+
+        Returns the nodes that the teachers told us about.  They have not been verified.
+        """
+        hops = self._LOOKUP_HOPS if hops is None else min(hops, self._LOOKUP_HOPS)
+        visited = set(visited or ())
+        if Teacher in self.__class__.__bases__:
+            visited.add(self.checksum_public_address)
+
+        wanted_addresses = set(checksum_addresses) - set(self.__known_nodes.addresses())
+        if not wanted_addresses:
+            return []
+
+        eligible_teachers, _backed_off = self.node_health.partition(self.__known_nodes.shuffled())
+        eligible_teachers = [t for t in eligible_teachers if t.checksum_public_address not in visited]
+        if not eligible_teachers:
+            return []
+        teachers = self.teacher_selection.select(eligible_teachers, quantity=self._LOOKUP_FANOUT)
+        teachers = teachers[:self._LOOKUP_FANOUT]
+
+        # None of these teachers (nor anyone they ask) need ask any of the others.
+        visited.update(teacher.checksum_public_address for teacher in teachers)
+
+        found_nodes = dict()
+        for teacher in teachers:
             try:
-                # Scenario 1: We already know about this node.
-                return self.__known_nodes[node_id]
-            except KeyError:
-                raise NotImplementedError
-        # Scenario 2: We don't know about this node, but a nearby node does.
-        # TODO: Build a concurrent pool of lookups here.
+                response = self.network_middleware.lookup_nodes(node=teacher,
+                                                                checksum_addresses=wanted_addresses,
+                                                                hops=hops,
+                                                                visited=visited)
+            except NodeSeemsToBeDown as e:
+                self.log.info("Bad Response from teacher: {}:{}.".format(teacher, e))
+                self.record_connection_failure(teacher, e)
+                continue
 
-        # Scenario 3: We don't know about this node, and neither does our friend.
+            # A lookup only returns a few of the teacher's nodes; that says nothing about its fleet state.
+            node_list = self._nodes_from_teacher_response(teacher, response, update_snapshot=False)
+            if node_list is None or node_list is NO_KNOWN_NODES or node_list is FLEET_STATES_MATCH:
+                continue
+
+            for sketch in node_list:
+                if sketch.checksum_public_address in wanted_addresses:
+                    found_nodes[sketch.checksum_public_address] = sketch
+            wanted_addresses -= found_nodes.keys()
+            if not wanted_addresses:
+                break
+
+        return [sketch.materialize() for sketch in found_nodes.values()]
 
     def write_node_metadata(self, node, serializer=bytes) -> str:
         return self.node_storage.store_node_metadata(node=node)
@@ -696,27 +1353,155 @@ class Learner:
             self.log.warn("Can't learn right now: {}".format(e.args[0]))
             return
 
+        try:
+            response = self._request_nodes_from_teacher(current_teacher)
+        except NodeSeemsToBeDown as e:
+            self.log.info("Bad Response from teacher: {}:{}.".format(current_teacher, e))
+            self.record_connection_failure(current_teacher, e)
+            return
+        finally:
+            with suppress(self.NotEnoughTeachers):  # We'll find out next round.
+                self.cycle_teacher_node()
+
+        node_list = self._nodes_from_teacher_response(current_teacher, response)
+        if node_list is FLEET_STATES_MATCH:
+            self.teacher_selection.record_freshness(current_teacher, 0)
+        if node_list is None or node_list is NO_KNOWN_NODES or node_list is FLEET_STATES_MATCH:
+            return node_list
+
+        unknown_nodes = [sketch.materialize() for sketch in self._unknown_nodes_in_our_domains(node_list)]
+
+        if eager:
+            new_nodes = self._verify_and_remember_nodes(unknown_nodes, teacher=current_teacher)
+        else:
+            new_nodes = []
+            for node in unknown_nodes:
+                self.node_storage.store_node_certificate(certificate=node.certificate)
+                try:
+                    node.validate_metadata(accept_federated_only=self.federated_only)  # TODO: 466
+                except node.InvalidNode:
+                    # TODO: Account for possibility that stamp, rather than interface, was bad.
+                    self.log.warn(node.invalid_metadata_message.format(node))
+                except node.SuspiciousActivity:
+                    message = "Suspicious Activity: Discovered node with bad signature: {}.  " \
+                              "Propagated by: {}".format(node.checksum_public_address,
+                                                         current_teacher.checksum_public_address)
+                    self.log.warn(message)
+                else:
+                    new = self.remember_node(node, record_fleet_state=False)
+                    if new:
+                        new_nodes.append(node)
+
+        # Only nodes which checked out count towards the teacher's freshness;
+        # otherwise, a teacher could make itself look fresh by making nodes up.
+        self.teacher_selection.record_freshness(current_teacher, len(new_nodes))
+        self._adjust_learning(new_nodes)
+
+        learning_round_log_message = "Learning round {}.  Teacher: {} knew about {} nodes, {} were new."
+        self.log.info(learning_round_log_message.format(self._learning_round,
+                                                        current_teacher,
+                                                        len(node_list),
+                                                        len(new_nodes)), )
+        if new_nodes:
+            self.known_nodes.record_fleet_state()
+            for node in new_nodes:
+                self.node_storage.store_node_certificate(certificate=node.certificate)
+        return new_nodes
+
+    def learn_from_teachers(self, number_of_teachers: int = None):
+        """
+        Like learn_from_teacher_node, but asks several teachers at once.
+
+        The teachers' payloads are merged (keeping the freshest representation of each node),
+        and the merged set of candidates is verified concurrently, at most
+        verification_concurrency at a time.
+        """
+        self._learning_round += 1
+        number_of_teachers = number_of_teachers or self.teachers_per_round
+
+        teachers = dict()
+        try:
+            for _ in range(number_of_teachers):
+                teacher = self.current_teacher_node()
+                teachers[teacher.checksum_public_address] = teacher
+                self.cycle_teacher_node()
+        except self.NotEnoughTeachers as e:
+            if not teachers:
+                self.log.warn("Can't learn right now: {}".format(e.args[0]))
+                return
+
+        # Ask every teacher at once...
+        with ThreadPoolExecutor(max_workers=len(teachers)) as executor:
+            pending_responses = {executor.submit(self._request_nodes_from_teacher, teacher): teacher
+                                 for teacher in teachers.values()}
+
+        # ...and merge their answers, keeping only the freshest representation of each node.
+        candidates = dict()
+        offered_addresses = dict()
+        for pending_response, teacher in pending_responses.items():
+            try:
+                response = pending_response.result()
+            except NodeSeemsToBeDown as e:
+                self.log.info("Bad Response from teacher: {}:{}.".format(teacher, e))
+                self.record_connection_failure(teacher, e)
+                continue
+
+            node_list = self._nodes_from_teacher_response(teacher, response)
+            if node_list is FLEET_STATES_MATCH:
+                self.teacher_selection.record_freshness(teacher, 0)
+            if node_list is None or node_list is NO_KNOWN_NODES or node_list is FLEET_STATES_MATCH:
+                continue
+
+            unknown_nodes = list(self._unknown_nodes_in_our_domains(node_list))
+            offered_addresses[teacher.checksum_public_address] = set(s.checksum_public_address for s in unknown_nodes)
+            for sketch in unknown_nodes:
+                with suppress(KeyError):
+                    if not sketch.timestamp > candidates[sketch.checksum_public_address].timestamp:
+                        continue
+                candidates[sketch.checksum_public_address] = sketch
+
+        new_nodes = self._verify_and_remember_nodes(sketch.materialize() for sketch in candidates.values())
+
+        # Each teacher is credited with the nodes it told us about which checked out.
+        new_addresses = set(node.checksum_public_address for node in new_nodes)
+        for teacher_address, addresses in offered_addresses.items():
+            self.teacher_selection.record_freshness(teachers[teacher_address], len(addresses & new_addresses))
+        self._adjust_learning(new_nodes)
+
+        learning_round_log_message = "Learning round {}.  {} teachers knew about {} unknown nodes, {} were new."
+        self.log.info(learning_round_log_message.format(self._learning_round,
+                                                        len(teachers),
+                                                        len(candidates),
+                                                        len(new_nodes)), )
+        if new_nodes:
+            self.known_nodes.record_fleet_state()
+        return new_nodes
+
+    def _request_nodes_from_teacher(self, teacher):
         if Teacher in self.__class__.__bases__:
             announce_nodes = [self]
         else:
             announce_nodes = None
 
-        unresponsive_nodes = set()
+        start = time.time()
         try:
-            # TODO: Streamline path generation
-            certificate_filepath = self.node_storage.generate_certificate_filepath(
-                checksum_address=current_teacher.checksum_public_address)
-            response = self.network_middleware.get_nodes_via_rest(node=current_teacher,
-                                                                  nodes_i_need=self._node_ids_to_learn_about_immediately,
+            response = self.network_middleware.get_nodes_via_rest(node=teacher,
                                                                   announce_nodes=announce_nodes,
                                                                   fleet_checksum=self.known_nodes.checksum)
-        except NodeSeemsToBeDown as e:
-            unresponsive_nodes.add(current_teacher)
-            self.log.info("Bad Response from teacher: {}:{}.".format(current_teacher, e))
-            return
-        finally:
-            self.cycle_teacher_node()
+        except NodeSeemsToBeDown:
+            self.teacher_selection.record_latency(teacher, self.LEARNING_TIMEOUT)
+            raise
+        self.teacher_selection.record_latency(teacher, time.time() - start)
+        return response
+
+    def _nodes_from_teacher_response(self, teacher, response, update_snapshot: bool = True):
+        """
+        Parses and verifies a teacher's node_metadata response.
 
+        Returns a NodeSketch for each node the teacher told us about, or NO_KNOWN_NODES, FLEET_STATES_MATCH,
+        or None (if the response is unusable).  Unless update_snapshot is False, the teacher's
+        fleet state snapshot is updated from the response.
+        """
         #
         # Before we parse the response, let's handle some edge cases.
         if response.status_code == 204:
@@ -727,7 +1512,7 @@ class Learner:
             # It's possible that our fleet states match, and we'll check for that later.
 
         elif response.status_code != 200:
-            self.log.info("Bad response from teacher {}: {} - {}".format(current_teacher, response, response.content))
+            self.log.info("Bad response from teacher {}: {} - {}".format(teacher, response, response.content))
             return
 
         try:
@@ -737,8 +1522,8 @@ class Learner:
             return
 
         try:
-            self.verify_from(current_teacher, node_payload, signature=signature)
-        except current_teacher.InvalidSignature:
+            self.verify_from(teacher, node_payload, signature=signature)
+        except teacher.InvalidSignature:
             # TODO: What to do if the teacher improperly signed the node payload?
             raise
         # End edge case handling.
@@ -747,32 +1532,42 @@ class Learner:
         fleet_state_checksum_bytes, fleet_state_updated_bytes, node_payload = FleetStateTracker.snapshot_splitter(
             node_payload,
             return_remainder=True)
-        current_teacher.last_seen = maya.now()
+        self.known_nodes.mark_seen(teacher)
+        self.node_health.record_success(teacher.checksum_public_address)
         # TODO: This is weird - let's get a stranger FleetState going.
         checksum = fleet_state_checksum_bytes.hex()
 
         # TODO: This doesn't make sense - a decentralized node can still learn about a federated-only node.
         from nucypher.characters.lawful import Ursula
         if constant_or_bytes(node_payload) is FLEET_STATES_MATCH:
-            current_teacher.update_snapshot(checksum=checksum,
-                                            updated=maya.MayaDT(
-                                                int.from_bytes(fleet_state_updated_bytes, byteorder="big")),
-                                            number_of_known_nodes=len(self.known_nodes)
-                                            )
+            if update_snapshot:
+                teacher.update_snapshot(checksum=checksum,
+                                        updated=maya.MayaDT(int.from_bytes(fleet_state_updated_bytes, byteorder="big")),
+                                        number_of_known_nodes=len(self.known_nodes)
+                                        )
             return FLEET_STATES_MATCH
 
-        node_list = Ursula.batch_from_bytes(node_payload, federated_only=self.federated_only)  # TODO: 466
+        if node_payload:
+            node_list = Ursula.sketches_from_bytes(node_payload, federated_only=self.federated_only)  # TODO: 466
+        else:
+            node_list = []  # Lookups can come back empty-handed.
 
-        current_teacher.update_snapshot(checksum=checksum,
-                                        updated=maya.MayaDT(
-                                            int.from_bytes(fleet_state_updated_bytes, byteorder="big")),
-                                        number_of_known_nodes=len(node_list)
-                                        )
+        if update_snapshot:
+            teacher.update_snapshot(checksum=checksum,
+                                    updated=maya.MayaDT(int.from_bytes(fleet_state_updated_bytes, byteorder="big")),
+                                    number_of_known_nodes=len(node_list)
+                                    )
+        return node_list
 
-        new_nodes = []
+    def _unknown_nodes_in_our_domains(self, node_list):
+        """
+        Yields the nodes (or NodeSketches) in node_list which serve one of our domains and which
+        are either unknown to us or newer than the representation we already know.
+        """
+        learning_domains = set(self.learning_domains)
         for node in node_list:
-            if GLOBAL_DOMAIN not in self.learning_domains:
-                if not set(self.learning_domains).intersection(set(node.serving_domains)):
+            if GLOBAL_DOMAIN not in learning_domains:
+                if learning_domains.isdisjoint(node.serving_domains):
                     continue  # This node is not serving any of our domains.
 
             # First, determine if this is an outdated representation of an already known node.
@@ -783,43 +1578,38 @@ class Learner:
                     # This node is already known.  We can safely continue to the next.
                     continue
 
-            certificate_filepath = self.node_storage.store_node_certificate(certificate=node.certificate)
+            if not self.node_health.is_eligible(node.checksum_public_address):
+                self.log.debug("Not trying {} again until {}".format(node, self.node_health[node.checksum_public_address].next_eligible))
+                continue
 
-            try:
-                if eager:
-                    node.verify_node(self.network_middleware,
-                                     accept_federated_only=self.federated_only,  # TODO: 466
-                                     certificate_filepath=certificate_filepath)
-                    self.log.debug("Verified node: {}".format(node.checksum_public_address))
+            yield node
 
-                else:
-                    node.validate_metadata(accept_federated_only=self.federated_only)  # TODO: 466
-            # This block is a mess of eagerness.  This can all be done better lazily.
-            except NodeSeemsToBeDown as e:
+    def _verify_and_remember_nodes(self, nodes, teacher=None) -> list:
+        """
+        Hands nodes to the verification pool and waits for them, logging those that don't check out.
+        Returns the list of newly remembered nodes.
+        """
+        pending_verifications = [(self.verification_pool.submit(node), node) for node in nodes]
+
+        new_nodes = []
+        for pending_verification, node in pending_verifications:
+            try:
+                new = pending_verification.result()
+            except SSLError:
+                self.log.info(f"Bad TLS information for {node}; not remembering it.")
+            except NodeSeemsToBeDown:
                 self.log.info(f"Can't connect to {node} to verify it right now.")
             except node.InvalidNode:
                 # TODO: Account for possibility that stamp, rather than interface, was bad.
                 self.log.warn(node.invalid_metadata_message.format(node))
             except node.SuspiciousActivity:
-                message = "Suspicious Activity: Discovered node with bad signature: {}.  " \
-                          "Propagated by: {}".format(current_teacher.checksum_public_address, teacher_uri)
+                message = "Suspicious Activity: Discovered node with bad signature: {}.".format(node)
+                if teacher is not None:
+                    message += "  Propagated by: {}".format(teacher.checksum_public_address)
                 self.log.warn(message)
             else:
-                new = self.remember_node(node, record_fleet_state=False)
-                if new:
-                    new_nodes.append(node)
-
-        self._adjust_learning(new_nodes)
-
-        learning_round_log_message = "Learning round {}.  Teacher: {} knew about {} nodes, {} were new."
-        self.log.info(learning_round_log_message.format(self._learning_round,
-                                                        current_teacher,
-                                                        len(node_list),
-                                                        len(new_nodes)), )
-        if new_nodes:
-            self.known_nodes.record_fleet_state()
-            for node in new_nodes:
-                self.node_storage.store_node_certificate(certificate=node.certificate)
+                if new and new not in new_nodes:
+                    new_nodes.append(new)
         return new_nodes
 
 
@@ -828,6 +1618,8 @@ class Teacher:
     verified_stamp = False
     verified_interface = False
     _verified_node = False
+    _serialized_node = None
+    _serialized_node_fingerprint = None
     _interface_info_splitter = (int, 4, {'byteorder': 'big'})
     log = Logger("teacher")
     __DEFAULT_MIN_SEED_STAKE = 0
@@ -893,16 +1685,6 @@ class Teacher:
         nodes_to_consider = list(self.known_nodes.values()) + [self]
         return sorted(nodes_to_consider, key=lambda n: n.checksum_public_address)
 
-    def _stamp_has_valid_wallet_signature(self):
-        signature_bytes = self._evidence_of_decentralized_identity
-        if signature_bytes is NOT_SIGNED:
-            return False
-        else:
-            signature = EthSignature(signature_bytes)
-        proper_pubkey = signature.recover_public_key_from_msg(bytes(self.stamp))
-        proper_address = proper_pubkey.to_checksum_address()
-        return proper_address == self.checksum_public_address
-
     def update_snapshot(self, checksum, updated, number_of_known_nodes):
         # We update the simple snapshot here, but of course if we're dealing with an instance that is also a Learner, it has
         # its own notion of its FleetState, so we probably need a reckoning of sorts here to manage that.  In time.
@@ -923,8 +1705,7 @@ class Teacher:
             return False
         else:
             signature = EthSignature(signature_bytes)
-        proper_pubkey = signature.recover_public_key_from_msg(bytes(self.stamp))
-        proper_address = proper_pubkey.to_checksum_address()
+        proper_address = verification_cache.recover_address(signature, bytes(self.stamp))
         return proper_address == self.checksum_public_address
 
     def stamp_is_valid(self):
@@ -962,7 +1743,8 @@ class Teacher:
                     network_middleware,
                     certificate_filepath: str = None,
                     accept_federated_only: bool = False,
-                    force: bool = False
+                    force: bool = False,
+                    timeout: float = 2
                     ) -> bool:
         """
         Three things happening here:
@@ -987,7 +1769,8 @@ class Teacher:
         # The node's metadata is valid; let's be sure the interface is in order.
         response_data = network_middleware.node_information(host=self.rest_information()[0].host,
                                                             port=self.rest_information()[0].port,
-                                                            certificate_filepath=certificate_filepath)
+                                                            certificate_filepath=certificate_filepath,
+                                                            timeout=timeout)
 
         version, node_bytes = self.version_splitter(response_data, return_remainder=True)
 
@@ -1014,6 +1797,11 @@ class Teacher:
         blockchain_power.unlock_account(password=password)  # TODO: 349
         signature = blockchain_power.sign_message(bytes(self.stamp))
         self._evidence_of_decentralized_identity = signature
+        self._forget_serialized_node()
+
+    def _forget_serialized_node(self):
+        self._serialized_node = None
+        self._serialized_node_fingerprint = None
 
     #
     # Interface
@@ -1025,7 +1813,7 @@ class Teacher:
         """
         interface_info_message = self._signable_interface_info_message()  # Contains canonical address.
         message = self.timestamp_bytes() + interface_info_message
-        interface_is_valid = self._interface_signature.verify(message, self.public_keys(SigningPower))
+        interface_is_valid = verification_cache.verify(self._interface_signature, message, self.public_keys(SigningPower))
         self.verified_interface = interface_is_valid
         if interface_is_valid:
             return True
@@ -1040,6 +1828,7 @@ class Teacher:
         message = self._signable_interface_info_message()
         self._timestamp = maya.now()
         self._interface_signature_object = self.stamp(self.timestamp_bytes() + message)
+        self._forget_serialized_node()
 
     @property
     def _interface_signature(self):
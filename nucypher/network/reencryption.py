@@ -0,0 +1,251 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Iterator, List, Tuple
+
+from bytestring_splitter import VariableLengthBytestring
+from umbral import pre
+from umbral.config import default_params
+from umbral.keys import UmbralPrivateKey, UmbralPublicKey
+from umbral.kfrags import KFrag
+from umbral.pre import Capsule
+from umbral.signing import Signer
+
+
+class ReencryptionWorker:
+    """
+    Does the CPU-bound part of a work order: re-encrypting each capsule and signing the results.
+
+    Keeps the kfrags it has already deserialized, so that a hot arrangement only pays for
+    KFrag.from_bytes once per worker.
+    """
+
+    _KFRAG_CACHE_SIZE = 1000
+
+    def __init__(self, signing_key_bytes: bytes, kfrag_cache_size: int = None) -> None:
+        self.signing_key_bytes = signing_key_bytes
+        self.kfrag_cache_size = kfrag_cache_size or self._KFRAG_CACHE_SIZE
+        self._signer = Signer(UmbralPrivateKey.from_bytes(signing_key_bytes))
+        self._params = default_params()
+        self._kfrags = OrderedDict()
+
+    def _kfrag(self, arrangement_id: bytes, kfrag_bytes: bytes, verifying_key_bytes: bytes) -> Tuple:
+        try:
+            cached_bytes, kfrag, verifying_key = self._kfrags[arrangement_id]
+        except KeyError:
+            pass
+        else:
+            if cached_bytes == kfrag_bytes + verifying_key_bytes:
+                self._kfrags.move_to_end(arrangement_id)
+                return kfrag, verifying_key
+
+        kfrag = KFrag.from_bytes(kfrag_bytes)
+        verifying_key = UmbralPublicKey.from_bytes(verifying_key_bytes)
+        self._kfrags[arrangement_id] = (kfrag_bytes + verifying_key_bytes, kfrag, verifying_key)
+        while len(self._kfrags) > self.kfrag_cache_size:
+            self._kfrags.popitem(last=False)
+        return kfrag, verifying_key
+
+    def reencrypt(self,
+                  arrangement_id: bytes,
+                  kfrag_bytes: bytes,
+                  verifying_key_bytes: bytes,
+                  tasks: List[Tuple[bytes, bytes]]) -> List[bytes]:
+        """
+        Takes (capsule, Bob's task signature) pairs, as bytes, and returns the cfrag and
+        Ursula's signature of it for each, ready to be sent back to Bob.
+        """
+        kfrag, alices_verifying_key = self._kfrag(arrangement_id, kfrag_bytes, verifying_key_bytes)
+
+        results = list()
+        for capsule_bytes, task_signature in tasks:
+            # Ursula signs on top of Bob's signature of each task.
+            # Now both are committed to the same task.  See #259.
+            reencryption_metadata = bytes(self._signer(task_signature))
+
+            capsule = Capsule.from_bytes(capsule_bytes, self._params)
+            capsule.set_correctness_keys(verifying=alices_verifying_key)
+            cfrag = pre.reencrypt(kfrag, capsule, metadata=reencryption_metadata)
+
+            # Finally, Ursula commits to her result
+            reencryption_signature = self._signer(bytes(cfrag))
+            results.append(bytes(VariableLengthBytestring(cfrag)) + bytes(reencryption_signature))
+        return results
+
+
+_worker = None  # One per pool process; see _start_worker.
+
+
+def _start_worker(signing_key_bytes: bytes) -> None:
+    """
+    Runs once in each pool process, which is how Ursula's signing key gets there.
+    """
+    global _worker
+    _worker = ReencryptionWorker(signing_key_bytes)
+
+
+def _reencrypt_in_worker(*args) -> List[bytes]:
+    return _worker.reencrypt(*args)
+
+
+def _reencrypt_in_worker_with_key(signing_key_bytes: bytes, *args) -> List[bytes]:
+    """
+    For Python 3.6, whose ProcessPoolExecutor has no initializer: the key comes along with each task instead.
+    """
+    global _worker
+    if _worker is None or _worker.signing_key_bytes != signing_key_bytes:
+        _start_worker(signing_key_bytes)
+    return _worker.reencrypt(*args)
+
+
+class ReencryptionStream:
+    """
+    The cfrag and signature bytes for each task of a work order, in order, as they are produced.
+
+    The work order's place in the engine's queue is given back once the stream is exhausted or closed.
+    """
+
+    def __init__(self, results: Iterator[bytes], release: Callable, futures: List[Future] = ()) -> None:
+        self._results = results
+        self._release = release
+        self._futures = futures
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> bytes:
+        try:
+            return next(self._results)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        for future in self._futures:
+            future.cancel()  # Nobody is waiting for these anymore.
+        if self._release is not None:
+            release, self._release = self._release, None
+            release()
+
+
+class ReencryptionEngine:
+    """
+    Runs Ursula's re-encryptions in a pool of worker processes, so that they are not all
+    competing for the GIL with each other and with the rest of the node.  The workers are
+    spawned afresh, rather than forked from a node that's already running a reactor and threads.
+
+    Unless workers are asked for, re-encryption happens in the calling thread, as it always has.
+    At most queue_depth work orders can be waiting or in progress at once;
+    beyond that, reencrypt raises Busy rather than letting requests pile up.
+    """
+
+    _WORK_ORDERS_QUEUED_PER_WORKER = 16
+    _TASKS_PER_CHUNK = 8  # Large work orders are split up, so that their first cfrags are ready sooner.
+
+    class Busy(RuntimeError):
+        """
+        Raised when there are already as many work orders in flight as the queue allows.
+        """
+
+    def __init__(self, signing_key: UmbralPrivateKey, workers: int = None, queue_depth: int = None) -> None:
+        self._pool = None
+        self.workers = workers or 0
+        self.queue_depth = queue_depth or max(self.workers, 1) * self._WORK_ORDERS_QUEUED_PER_WORKER
+        self._slots = threading.BoundedSemaphore(self.queue_depth)
+
+        signing_key_bytes = signing_key.to_bytes()
+        self._signing_key_bytes = None  # Only kept if it has to be sent along with every task.
+        if self.workers:
+            self._inline_worker = None
+            try:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers,
+                                                 mp_context=multiprocessing.get_context("spawn"),
+                                                 initializer=_start_worker,
+                                                 initargs=(signing_key_bytes,))
+            except TypeError:  # Python 3.6
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+                self._signing_key_bytes = signing_key_bytes
+        else:
+            self._inline_worker = ReencryptionWorker(signing_key_bytes)
+            self._inline_lock = threading.Lock()
+
+    def reencrypt(self, arrangement_id: bytes, kfrag_bytes: bytes, verifying_key_bytes: bytes, tasks) -> ReencryptionStream:
+        """
+        Starts re-encrypting the capsules of a work order's tasks, returning a stream of the cfrag and signature
+        bytes for each.
+        """
+        return self.reencrypt_many([(arrangement_id, kfrag_bytes, verifying_key_bytes, tasks)])[0]
+
+    def reencrypt_many(self, work_orders: List[Tuple]) -> List[ReencryptionStream]:
+        """
+        Starts re-encrypting several work orders at once, spread across the workers, and returns the stream of results
+        for each in turn.  Each work order is given as (arrangement ID, kfrag bytes, Alice's verifying key bytes, tasks).
+        """
+        slots_taken = 0
+        streams = []
+        try:
+            for _work_order in work_orders:
+                if not self._slots.acquire(blocking=False):
+                    raise self.Busy(f"{self.queue_depth} work orders are already being re-encrypted.")
+                slots_taken += 1
+            for work_order in work_orders:
+                streams.append(self._start(*work_order))
+        except BaseException:
+            for stream in streams:
+                stream.close()
+            for _slot in range(slots_taken - len(streams)):
+                self._slots.release()
+            raise
+        return streams
+
+    def _start(self, arrangement_id: bytes, kfrag_bytes: bytes, verifying_key_bytes: bytes, tasks) -> ReencryptionStream:
+        task_bytes = [(bytes(task.capsule), bytes(task.signature)) for task in tasks]
+        if self._inline_worker is not None:
+            results = self._reencrypt_inline(arrangement_id, kfrag_bytes, verifying_key_bytes, task_bytes)
+            return ReencryptionStream(results, release=self._slots.release)
+
+        if self._pool is None:
+            raise RuntimeError("This re-encryption engine has been shut down.")
+
+        chunks = [task_bytes[start:start + self._TASKS_PER_CHUNK]
+                  for start in range(0, len(task_bytes), self._TASKS_PER_CHUNK)]
+        if self._signing_key_bytes is None:
+            submit = partial(self._pool.submit, _reencrypt_in_worker)
+        else:
+            submit = partial(self._pool.submit, _reencrypt_in_worker_with_key, self._signing_key_bytes)
+        futures = [submit(arrangement_id, kfrag_bytes, verifying_key_bytes, chunk) for chunk in chunks]
+        results = (result for future in futures for result in future.result())
+        return ReencryptionStream(results, release=self._slots.release, futures=futures)
+
+    def _reencrypt_inline(self, arrangement_id: bytes, kfrag_bytes: bytes, verifying_key_bytes: bytes,
+                          tasks: List[Tuple[bytes, bytes]]) -> Iterator[bytes]:
+        for task in tasks:
+            with self._inline_lock:
+                result, = self._inline_worker.reencrypt(arrangement_id, kfrag_bytes, verifying_key_bytes, [task])
+            yield result
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            pool.shutdown(wait=wait)
+
+    def __del__(self):
+        self.shutdown(wait=False)
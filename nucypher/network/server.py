@@ -18,13 +18,14 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 import binascii
 import json
 import os
+import zlib
 from typing import Callable, Tuple
 
+import msgpack
 from flask import Flask, Response
 from flask import request
 from jinja2 import Template, TemplateError
 from twisted.logger import Logger
-from umbral import pre
 from umbral.keys import UmbralPublicKey
 from umbral.kfrags import KFrag
 
@@ -32,20 +33,23 @@ from bytestring_splitter import VariableLengthBytestring
 from constant_sorrow import constants
 from constant_sorrow.constants import FLEET_STATES_MATCH
 from constant_sorrow.constants import GLOBAL_DOMAIN, NO_KNOWN_NODES
+from eth_utils import to_checksum_address
 from hendrix.experience import crosstown_traffic
 from nucypher.config.constants import GLOBAL_DOMAIN
-from nucypher.config.storages import ForgetfulNodeStorage
 from nucypher.crypto.api import keccak_digest
+from nucypher.crypto.constants import PUBLIC_ADDRESS_LENGTH
 from nucypher.crypto.kits import UmbralMessageKit
 from nucypher.crypto.powers import SigningPower, KeyPairBasedPower, PowerUpError
 from nucypher.crypto.signing import InvalidSignature, SignatureStamp, Signature
 from nucypher.crypto.utils import canonical_address_from_umbral_key
 from nucypher.keystore.keypairs import HostingKeypair
-from nucypher.keystore.keystore import NotFound
+from nucypher.keystore.keystore import CachedArrangement, NotFound, PolicyArrangementCache, WorkOrderLog
 from nucypher.keystore.threading import ThreadedSession
 from nucypher.network import LEARNING_LOOP_VERSION
-from nucypher.network.middleware import RestMiddleware
+from nucypher.network.announcements import NodeAnnouncementQueue
+from nucypher.network.middleware import RestMiddleware, NODE_METADATA_ENCODING
 from nucypher.network.protocols import InterfaceInfo, SuspiciousActivity
+from nucypher.network.reencryption import ReencryptionEngine
 
 HERE = BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 TEMPLATES_DIR = os.path.join(HERE, "templates")
@@ -88,18 +92,20 @@ def make_rest_app(
         treasure_map_tracker: dict,
         node_tracker: 'FleetStateTracker',
         node_bytes_caster: Callable,
-        work_order_tracker: list,
+        work_order_tracker: WorkOrderLog,
         node_nickname: str,
-        node_recorder: Callable,
+        node_verifier: Callable,
         stamp: SignatureStamp,
         verifier: Callable,
         suspicious_activity_tracker: dict,
         serving_domains,
+        reencryption_engine: ReencryptionEngine,
+        node_health: 'NodeHealthTracker' = None,
+        node_finder: Callable = None,
+        arrangement_cache: PolicyArrangementCache = None,
         log=Logger("http-application-layer")
         ) -> Tuple:
 
-    forgetful_node_storage = ForgetfulNodeStorage(federated_only=federated_only)
-
     from nucypher.keystore import keystore
     from nucypher.keystore.db import Base
     from sqlalchemy.engine import create_engine
@@ -117,6 +123,9 @@ def make_rest_app(
     Base.metadata.create_all(engine)
     datastore = keystore.KeyStore(engine)
     db_engine = engine
+    if arrangement_cache is None:
+        arrangement_cache = PolicyArrangementCache()
+    work_order_tracker.use_datastore(datastore)
 
     from nucypher.characters.lawful import Alice, Ursula
     _alice_class = Alice
@@ -124,6 +133,10 @@ def make_rest_app(
 
     rest_app = Flask("ursula-service")
 
+    # Many learners may announce the same nodes at once; they are verified in batches, one drain at a time.
+    announcements = NodeAnnouncementQueue(verifier=node_verifier,
+                                          on_suspicious_node=lambda node: suspicious_activity_tracker['vladimirs'].append(node))
+
     @rest_app.route("/public_information")
     def public_information():
         """
@@ -135,22 +148,49 @@ def make_rest_app(
 
         return response
 
+    def node_metadata_response(cache_key, build_signed_payload):
+        """
+        Serves the cached, signed node metadata - compressed (once per cache entry) for learners that accept it.
+        """
+        headers = {'Content-Type': 'application/octet-stream', 'Vary': 'Accept-Encoding'}
+        if NODE_METADATA_ENCODING in request.accept_encodings:
+            def compress_signed_payload():
+                return zlib.compress(node_tracker.signed_payload(cache_key, build_signed_payload))
+            payload = node_tracker.signed_payload((cache_key, NODE_METADATA_ENCODING), compress_signed_payload)
+            headers['Content-Encoding'] = NODE_METADATA_ENCODING
+        else:
+            payload = node_tracker.signed_payload(cache_key, build_signed_payload)
+        return Response(payload, headers=headers)
+
     @rest_app.route('/node_metadata', methods=["GET"])
     def all_known_nodes():
-        headers = {'Content-Type': 'application/octet-stream'}
-
         if node_tracker.checksum is NO_KNOWN_NODES:
+            headers = {'Content-Type': 'application/octet-stream'}
             return Response(b"", headers=headers, status=204)
 
-        payload = node_tracker.snapshot()
-
-        ursulas_as_vbytes = (VariableLengthBytestring(n) for n in node_tracker)
-        ursulas_as_bytes = bytes().join(bytes(u) for u in ursulas_as_vbytes)
-        ursulas_as_bytes += VariableLengthBytestring(node_bytes_caster())
+        # If we remember the learner's fleet state, we only need to send what has changed since then.
+        nodes_to_send = None
+        learner_fleet_state = request.args.get('fleet')
+        if learner_fleet_state:
+            nodes_to_send = node_tracker.nodes_updated_since(learner_fleet_state)
+        if nodes_to_send is None:
+            learner_fleet_state = None
+            nodes_to_send = node_tracker
+
+        def build_signed_payload():
+            payload = node_tracker.snapshot()
+            ursulas_as_vbytes = (VariableLengthBytestring(n) for n in nodes_to_send)
+            ursulas_as_bytes = bytes().join(bytes(u) for u in ursulas_as_vbytes)
+            ursulas_as_bytes += VariableLengthBytestring(node_bytes_caster())
+
+            payload += ursulas_as_bytes
+            signature = stamp(payload)
+            return bytes(signature) + payload
 
-        payload += ursulas_as_bytes
-        signature = stamp(payload)
-        return Response(bytes(signature) + payload, headers=headers)
+        # Our own metadata is part of every response, so a re-signed interface means a new response.
+        our_timestamps = tuple(node.timestamp for node in node_tracker.additional_nodes_to_track)
+        cache_key = (node_tracker.checksum, our_timestamps, learner_fleet_state)
+        return node_metadata_response(cache_key, build_signed_payload)
 
     @rest_app.route('/node_metadata', methods=["POST"])
     def node_metadata_exchange():
@@ -159,62 +199,70 @@ def make_rest_app(
         learner_fleet_state = request.args.get('fleet')
         if learner_fleet_state == node_tracker.checksum:
             log.debug("Learner already knew fleet state {}; doing nothing.".format(learner_fleet_state))
-            headers = {'Content-Type': 'application/octet-stream'}
-            payload = node_tracker.snapshot() + bytes(FLEET_STATES_MATCH)
-            signature = stamp(payload)
-            return Response(bytes(signature) + payload, headers=headers)
+
+            def build_signed_payload():
+                payload = node_tracker.snapshot() + bytes(FLEET_STATES_MATCH)
+                signature = stamp(payload)
+                return bytes(signature) + payload
+
+            cache_key = (node_tracker.checksum, FLEET_STATES_MATCH)
+            return node_metadata_response(cache_key, build_signed_payload)
 
         nodes = _node_class.batch_from_bytes(request.data, federated_only=federated_only)  # TODO: 466
 
         # TODO: This logic is basically repeated in learn_from_teacher_node and remember_node.
         # Let's find a better way.  #555
+        our_domains = set(serving_domains)
+        nodes_to_verify = list()
         for node in nodes:
-            if GLOBAL_DOMAIN not in serving_domains:
-                if not set(serving_domains).intersection(set(node.serving_domains)):
+            if GLOBAL_DOMAIN not in our_domains:
+                if our_domains.isdisjoint(node.serving_domains):
                     continue  # This node is not serving any of our domains.
 
             if node in node_tracker:
                 if node.timestamp <= node_tracker[node.checksum_public_address].timestamp:
                     continue
 
+            nodes_to_verify.append(node)
+
+        if announcements.announce(request.remote_addr, nodes_to_verify):
             @crosstown_traffic()
             def learn_about_announced_nodes():
-
-                try:
-                    certificate_filepath = forgetful_node_storage.store_node_certificate(
-                        certificate=node.certificate)
-
-                    node.verify_node(network_middleware,
-                                     accept_federated_only=federated_only,  # TODO: 466
-                                     certificate_filepath=certificate_filepath)
-
-                # Suspicion
-                except node.SuspiciousActivity:
-                    # TODO: Include data about caller?
-                    # TODO: Account for possibility that stamp, rather than interface, was bad.
-                    # TODO: Maybe also record the bytes representation separately to disk?
-                    message = f"Suspicious Activity: Discovered node with bad signature: {node}.  Announced via REST."
-                    log.warn(message)
-                    suspicious_activity_tracker['vladimirs'].append(node)
-
-                # Async Sentinel
-                except Exception as e:
-                    log.critical(str(e))
-                    raise
-
-                # Believable
-                else:
-                    log.info("Learned about previously unknown node: {}".format(node))
-                    node_recorder(node)
-                    # TODO: Record new fleet state
-
-                # Cleanup
-                finally:
-                    forgetful_node_storage.forget()
+                announcements.drain()
 
         # TODO: What's the right status code here?  202?  Different if we already knew about the node?
         return all_known_nodes()
 
+    @rest_app.route('/node_metadata/lookup', methods=["POST"])
+    def lookup_nodes():
+        headers = {'Content-Type': 'application/octet-stream'}
+
+        if node_tracker.checksum is NO_KNOWN_NODES:
+            return Response(b"", headers=headers, status=204)
+
+        wanted_addresses = [to_checksum_address(request.data[i:i + PUBLIC_ADDRESS_LENGTH])
+                            for i in range(0, len(request.data), PUBLIC_ADDRESS_LENGTH)]
+        found_nodes = [node_tracker[address] for address in wanted_addresses if address in node_tracker]
+
+        # If we don't know about some of these nodes, maybe our teachers do (but we decide how far to look).
+        try:
+            hops = int(request.args.get('hops', 0))
+        except ValueError:
+            hops = -1
+        if hops < 0:
+            return Response(response="hops must be a non-negative integer.", status=400)
+        hops = min(hops, _node_class._LOOKUP_HOPS)
+        visited = set(address for address in request.args.get('visited', "").split(",") if address)
+
+        missing_addresses = set(wanted_addresses) - set(node.checksum_public_address for node in found_nodes)
+        if missing_addresses and hops > 0 and node_finder is not None:
+            found_nodes.extend(node_finder(missing_addresses, hops=hops - 1, visited=visited))
+
+        payload = node_tracker.snapshot()
+        payload += bytes().join(bytes(VariableLengthBytestring(n)) for n in found_nodes)
+        signature = stamp(payload)
+        return Response(bytes(signature) + payload, headers=headers)
+
     @rest_app.route('/consider_arrangement', methods=['POST'])
     def consider_arrangement():
         from nucypher.policy.models import Arrangement
@@ -265,6 +313,7 @@ def make_rest_app(
                 id_as_hex,
                 kfrag,
                 session=session)
+        arrangement_cache.invalidate(binascii.unhexlify(id_as_hex))
 
         # TODO: Sign the arrangement here.  #495
         return ""  # TODO: Return A 200, with whatever policy metadata.
@@ -293,6 +342,7 @@ def make_rest_app(
                 elif revocation.verify_signature(alice_pubkey):
                     datastore.del_policy_arrangement(
                         id_as_hex.encode(), session=session)
+                    arrangement_cache.invalidate(revocation.arrangement_id)
         except (NotFound, InvalidSignature) as e:
             log.debug("Exception attempting to revoke: {}".format(e))
             return Response(response='KFrag not found or revocation signature is invalid.', status=404)
@@ -300,51 +350,136 @@ def make_rest_app(
             log.info("KFrag successfully removed.")
             return Response(response='KFrag deleted!', status=200)
 
-    @rest_app.route('/kFrag/<id_as_hex>/reencrypt', methods=["POST"])
-    def reencrypt_via_rest(id_as_hex):
-        from nucypher.policy.models import WorkOrder  # Avoid circular import
-        arrangement_id = binascii.unhexlify(id_as_hex)
-
+    def load_arrangement(arrangement_id: bytes) -> CachedArrangement:
         with ThreadedSession(db_engine) as session:
-            policy_arrangement = datastore.get_policy_arrangement(arrangement_id=id_as_hex.encode(),
+            policy_arrangement = datastore.get_policy_arrangement(arrangement_id=arrangement_id.hex().encode(),
                                                                   session=session)
-        kfrag_bytes = policy_arrangement.kfrag  # Careful!  :-)
-        verifying_key_bytes = policy_arrangement.alice_pubkey_sig.key_data
+            kfrag_bytes = policy_arrangement.kfrag  # Careful!  :-)
+            verifying_key_bytes = policy_arrangement.alice_pubkey_sig.key_data
+            expiration = policy_arrangement.expiration
+        if kfrag_bytes is None:
+            raise NotFound("Arrangement {} doesn't have a kfrag yet.".format(arrangement_id.hex()))
 
         # TODO: Push this to a lower level. Perhaps to Ursula character? #619
-        kfrag = KFrag.from_bytes(kfrag_bytes)
         alices_verifying_key = UmbralPublicKey.from_bytes(verifying_key_bytes)
-        alices_address = canonical_address_from_umbral_key(alices_verifying_key)
+        return CachedArrangement(kfrag_bytes=kfrag_bytes,
+                                 alices_verifying_key=alices_verifying_key,
+                                 alices_address=canonical_address_from_umbral_key(alices_verifying_key),
+                                 expiration=expiration)
 
+    def work_order_and_arrangement(arrangement_id: bytes, rest_payload: bytes) -> Tuple:
+        """
+        Returns the WorkOrder in rest_payload, along with what we know of the arrangement it is for.
+        """
+        from nucypher.policy.models import WorkOrder  # Avoid circular import
+
+        arrangement = arrangement_cache.get(arrangement_id, load=lambda: load_arrangement(arrangement_id))
         work_order = WorkOrder.from_rest_payload(arrangement_id=arrangement_id,
-                                                 rest_payload=request.data,
+                                                 rest_payload=rest_payload,
                                                  ursula_pubkey_bytes=bytes(stamp),
-                                                 alice_address=alices_address)
+                                                 alice_address=arrangement.alices_address)
 
         log.info(f"Work Order from {work_order.bob}, signed {work_order.receipt_signature}")
+        return work_order, arrangement
 
-        cfrag_byte_stream = b""
-
-        for task in work_order.tasks:
-            # Ursula signs on top of Bob's signature of each task.
-            # Now both are committed to the same task.  See #259.
-            reencryption_metadata = bytes(stamp(bytes(task.signature)))
+    @rest_app.route('/kFrag/<id_as_hex>/reencrypt', methods=["POST"])
+    def reencrypt_via_rest(id_as_hex):
+        arrangement_id = binascii.unhexlify(id_as_hex)
+        try:
+            work_order, arrangement = work_order_and_arrangement(arrangement_id, request.data)
+        except NotFound as e:
+            log.info(f"Work Order is for unknown arrangement {id_as_hex}.")
+            return Response(response=str(e), status=404)
 
-            capsule = task.capsule
-            capsule.set_correctness_keys(verifying=alices_verifying_key)
-            cfrag = pre.reencrypt(kfrag, capsule, metadata=reencryption_metadata)
-            log.info(f"Re-encrypting for {capsule}, made {cfrag}.")
+        # The capsules are re-encrypted (and the results signed) by the engine's workers.
+        try:
+            cfrags_and_signatures = reencryption_engine.reencrypt(arrangement_id=arrangement_id,
+                                                                  kfrag_bytes=arrangement.kfrag_bytes,
+                                                                  verifying_key_bytes=arrangement.verifying_key_bytes,
+                                                                  tasks=work_order.tasks)
+        except reencryption_engine.Busy as e:
+            log.info(f"Turning away Work Order from {work_order.bob}: {e}")
+            return Response(response=str(e), status=503)
+
+        # Wait for the first cfrag before answering, so that a bad kfrag or capsule (or a crashed worker)
+        # makes for an error response rather than a truncated 200.
+        try:
+            first_cfrag_and_signature = next(cfrags_and_signatures, b"")
+        except Exception as e:
+            log.warn(f"Couldn't re-encrypt Work Order from {work_order.bob}: {e}")
+            return Response(response=f"Couldn't re-encrypt this Work Order: {e}", status=500)
 
-            # Finally, Ursula commits to her result
-            reencryption_signature = stamp(bytes(cfrag))
-            cfrag_byte_stream += VariableLengthBytestring(cfrag) + reencryption_signature
+        def stream_cfrags():
+            # Each cfrag goes out as soon as it's ready, rather than once the whole work order is done.
+            yield first_cfrag_and_signature
+            yield from cfrags_and_signatures
+            log.info(f"Re-encrypted {len(work_order.tasks)} capsules for {work_order.bob}.")
 
-        # TODO: Put this in Ursula's datastore
-        work_order_tracker.append(work_order)
+            work_order_tracker.append(work_order)
 
         headers = {'Content-Type': 'application/octet-stream'}
 
-        return Response(response=cfrag_byte_stream, headers=headers)
+        response = Response(response=stream_cfrags(), headers=headers)
+        response.call_on_close(cfrags_and_signatures.close)
+        return response
+
+    @rest_app.route('/kFrags/reencrypt', methods=["POST"])
+    def reencrypt_in_bulk_via_rest():
+        """
+        REST endpoint for re-encrypting work orders for several arrangements in one request.
+
+        Responds with an (arrangement ID, cfrag stream) pair for each work order, in the order they were sent;
+        the stream is None for arrangements we don't have.
+        """
+        from nucypher.policy.models import WorkOrder  # Avoid circular import
+
+        try:
+            bobs_verifying_key, entries = WorkOrder.from_batch_rest_payload(rest_payload=request.data,
+                                                                            ursula_pubkey_bytes=bytes(stamp))
+        except InvalidSignature:
+            log.info("Turning away bulk request with an invalid signature.")
+            return Response(response="This bulk request's signature is invalid.", status=400)
+
+        work_orders, jobs = [], []
+        for arrangement_id, work_order_payload in entries:
+            try:
+                work_order, arrangement = work_order_and_arrangement(arrangement_id, work_order_payload)
+            except NotFound:
+                log.info(f"Work Order in bulk request is for unknown arrangement {arrangement_id.hex()}.")
+                work_orders.append(None)
+                continue
+            except InvalidSignature:
+                log.info(f"Turning away bulk request from {bobs_verifying_key}: a Work Order's signature is invalid.")
+                return Response(response="A Work Order in this bulk request has an invalid signature.", status=400)
+            if bytes(work_order.bob.stamp) != bytes(bobs_verifying_key):
+                log.info(f"Turning away bulk request from {bobs_verifying_key}: not all of its Work Orders are theirs.")
+                return Response(response="A Work Order in this bulk request wasn't from the Bob who signed it.",
+                                status=400)
+            work_orders.append(work_order)
+            jobs.append((arrangement_id, arrangement.kfrag_bytes, arrangement.verifying_key_bytes, work_order.tasks))
+
+        try:
+            streams = reencryption_engine.reencrypt_many(jobs)
+        except reencryption_engine.Busy as e:
+            log.info(f"Turning away {len(jobs)} Work Orders from {bobs_verifying_key}: {e}")
+            return Response(response=str(e), status=503)
+
+        grouped_cfrag_streams = []
+        try:
+            results = iter(streams)
+            for (arrangement_id, _payload), work_order in zip(entries, work_orders):
+                if work_order is None:
+                    grouped_cfrag_streams.append((arrangement_id, None))
+                else:
+                    grouped_cfrag_streams.append((arrangement_id, b"".join(next(results))))
+                    work_order_tracker.append(work_order)
+        finally:
+            for stream in streams:
+                stream.close()
+        log.info(f"Re-encrypted {len(jobs)} Work Orders in bulk for {bobs_verifying_key}.")
+
+        headers = {'Content-Type': 'application/octet-stream'}
+        return Response(response=msgpack.dumps(grouped_cfrag_streams), headers=headers)
 
     @rest_app.route('/treasure_map/<treasure_map_id>')
     def provide_treasure_map(treasure_map_id):
@@ -408,7 +543,8 @@ def make_rest_app(
         try:
             content = status_template.render(this_node=this_node,
                                              known_nodes=node_tracker,
-                                             previous_states=previous_states)
+                                             previous_states=previous_states,
+                                             node_health=node_health)
         except Exception as e:
             log.debug("Template Rendering Exception: ".format(str(e)))
             raise TemplateError(str(e)) from e
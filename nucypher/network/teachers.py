@@ -0,0 +1,113 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import random
+import threading
+from typing import List
+
+
+class RandomTeacherSelection:
+    """
+    Every known node is as good a teacher as any other: teachers are used in a random order,
+    each of them once before any of them is used again.
+    """
+
+    def select(self, nodes: List, quantity: int = None) -> List:
+        """
+        Returns the teachers to use next (at least quantity of them, if there are
+        that many nodes), in the order in which to use them.
+        """
+        nodes = list(nodes)
+        random.shuffle(nodes)
+        return nodes
+
+    def record_latency(self, teacher, seconds: float) -> None:
+        pass
+
+    def record_freshness(self, teacher, new_nodes: int) -> None:
+        pass
+
+
+class LatencyAwareTeacherSelection(RandomTeacherSelection):
+    """
+    Prefers teachers which answer quickly and which tend to tell us about nodes we don't know yet.
+
+    Each teacher's response time and freshness (the number of nodes it told us about
+    which were new to us, and which we verified and remembered) are tracked as exponentially weighted moving averages,
+    and teachers are drawn by weighted sampling.  Some of the probability mass is
+    always spread evenly among all known nodes, so that slow teachers are still
+    consulted now and then and our view of the fleet doesn't become siloed.
+    Teachers we haven't measured yet are weighted like the best teacher we know.
+    """
+
+    _SMOOTHING = 0.3
+    _EXPLORATION = 0.1
+    _BATCH_SIZE = 4
+    _MINIMUM_LATENCY = 0.01  # seconds
+
+    def __init__(self, smoothing: float = None, exploration: float = None, batch_size: int = None) -> None:
+        self.smoothing = smoothing if smoothing is not None else self._SMOOTHING
+        self.exploration = exploration if exploration is not None else self._EXPLORATION
+        self.batch_size = batch_size or self._BATCH_SIZE
+        self.latencies = dict()
+        self.freshness = dict()
+        self._lock = threading.Lock()
+
+    def _smooth(self, averages: dict, teacher, sample: float) -> None:
+        address = teacher.checksum_public_address
+        with self._lock:
+            try:
+                previous = averages[address]
+            except KeyError:
+                averages[address] = sample
+            else:
+                averages[address] = self.smoothing * sample + (1 - self.smoothing) * previous
+
+    def record_latency(self, teacher, seconds: float) -> None:
+        self._smooth(self.latencies, teacher, seconds)
+
+    def record_freshness(self, teacher, new_nodes: int) -> None:
+        self._smooth(self.freshness, teacher, new_nodes)
+
+    def weight(self, teacher) -> float:
+        address = teacher.checksum_public_address
+        try:
+            latency = self.latencies[address]
+        except KeyError:
+            return None  # Not measured yet.
+        freshness = self.freshness.get(address, 0)
+        return (1 + freshness) / max(latency, self._MINIMUM_LATENCY)
+
+    def probabilities(self, nodes: List) -> List[float]:
+        weights = [self.weight(node) for node in nodes]
+        measured_weights = [w for w in weights if w is not None]
+        optimistic_weight = max(measured_weights) if measured_weights else 1
+        weights = [optimistic_weight if w is None else w for w in weights]
+
+        total_weight = sum(weights)
+        evenly = 1 / len(nodes)
+        return [(1 - self.exploration) * w / total_weight + self.exploration * evenly for w in weights]
+
+    def select(self, nodes: List, quantity: int = None) -> List:
+        nodes = list(nodes)
+        if not nodes:
+            return nodes
+
+        # Weighted sampling without replacement (Efraimidis & Spirakis): sort by u ** (1 / p).
+        probabilities = self.probabilities(nodes)
+        keys = [random.random() ** (1 / p) for p in probabilities]
+        ranked = sorted(zip(keys, range(len(nodes))), reverse=True)
+        return [nodes[index] for _key, index in ranked[:max(self.batch_size, quantity or 0)]]
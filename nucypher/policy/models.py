@@ -26,7 +26,7 @@ from constant_sorrow.constants import UNKNOWN_KFRAG, NO_DECRYPTION_PERFORMED, NO
 from cryptography.hazmat.backends.openssl import backend
 from cryptography.hazmat.primitives import hashes
 from eth_utils import to_canonical_address, to_checksum_address
-from typing import Generator, List, Set, Optional
+from typing import Generator, List, Set, Optional, Tuple
 
 from umbral.cfrags import CapsuleFrag
 from umbral.config import default_params
@@ -313,7 +313,13 @@ class Policy:
                                value: int,
                                expiration: maya.MayaDT):
 
-        for selected_ursula in candidate_ursulas:
+        # Prefer Ursulas that haven't been unreachable lately, only falling back
+        # to those that are still backed off if we don't have enough arrangements.
+        healthy_ursulas, backed_off_ursulas = self.alice.node_health.partition(candidate_ursulas)
+        for selected_ursula in healthy_ursulas + backed_off_ursulas:
+            if selected_ursula in backed_off_ursulas and len(self._accepted_arrangements) >= self.n:
+                break
+
             arrangement = self._arrangement_class(alice=self.alice,
                                                   ursula=selected_ursula,
                                                   value=value,
@@ -323,12 +329,14 @@ class Policy:
                                                         arrangement=arrangement,
                                                         network_middleware=network_middleware)
 
-            except NodeSeemsToBeDown:  # TODO: Also catch InvalidNode here?  355
+            except NodeSeemsToBeDown as e:  # TODO: Also catch InvalidNode here?  355
                 # This arrangement won't be added to the accepted bucket.
                 # If too many nodes are down, it will fail in make_arrangements.
+                self.alice.record_connection_failure(selected_ursula, e)
                 continue
 
             else:
+                self.alice.node_health.record_success(selected_ursula.checksum_public_address)
 
                 # Bucket the arrangements
                 if is_accepted:
@@ -667,6 +675,33 @@ class WorkOrder:
                    blockhash=blockhash,
                    receipt_signature=signature)
 
+    @staticmethod
+    def batch_payload(work_orders: List['WorkOrder']) -> bytes:
+        """
+        Bundles Bob's work orders for several arrangements with the same Ursula into one request,
+        which Bob signs as a whole.
+        """
+        bob, ursula = work_orders[0].bob, work_orders[0].ursula
+        for work_order in work_orders:
+            if bytes(work_order.bob.stamp) != bytes(bob.stamp) or bytes(work_order.ursula.stamp) != bytes(ursula.stamp):
+                raise ValueError("Work orders in a batch must all be from the same Bob to the same Ursula.")
+
+        entries = msgpack.dumps([(work_order.arrangement_id, work_order.payload()) for work_order in work_orders])
+        batch_signature = bob.stamp(b"wos:" + bytes(ursula.stamp) + entries)
+        return bytes(batch_signature) + bob.stamp + entries
+
+    @staticmethod
+    def from_batch_rest_payload(rest_payload, ursula_pubkey_bytes) -> Tuple[UmbralPublicKey, List]:
+        """
+        Checks Bob's signature of a batch and returns his key along with the
+        (arrangement ID, work order payload) pairs it contains.
+        """
+        payload_splitter = BytestringSplitter(Signature) + key_splitter
+        signature, bob_pubkey_sig, entries = payload_splitter(rest_payload, return_remainder=True)
+        if not signature.verify(b"wos:" + ursula_pubkey_bytes + entries, bob_pubkey_sig):
+            raise InvalidSignature()
+        return bob_pubkey_sig, [(bytes(arrangement_id), bytes(payload)) for arrangement_id, payload in msgpack.loads(entries)]
+
     def payload(self):
         tasks_bytes = [bytes(item) for item in self.tasks]
         payload_elements = msgpack.dumps((tasks_bytes, self.blockhash))
@@ -678,22 +713,9 @@ class WorkOrder:
             raise ValueError("Ursula gave back the wrong number of cfrags.  "
                              "She's up to something.")
 
-        ursula_verifying_key = self.ursula.stamp.as_umbral_pubkey()
-
         for task, (cfrag, reencryption_signature) in zip(self.tasks, cfrags_and_signatures):
-            # Validate re-encryption metadata
-            metadata_input = bytes(task.signature)
-            metadata_as_signature = Signature.from_bytes(cfrag.proof.metadata)
-            if not metadata_as_signature.verify(metadata_input, ursula_verifying_key):
-                raise InvalidSignature(f"Invalid metadata for {cfrag}.")
-                # TODO: Instead of raising, we should do something
-
-            # Validate re-encryption signatures
-            if reencryption_signature.verify(bytes(cfrag), ursula_verifying_key):
-                good_cfrags.append(cfrag)
-            else:
-                raise InvalidSignature(f"{cfrag} is not properly signed by Ursula.")
-                # TODO: Instead of raising, we should do something
+            self._verify_work_result(task, cfrag, reencryption_signature)
+            good_cfrags.append(cfrag)
 
         for task, (cfrag, reencryption_signature) in zip(self.tasks, cfrags_and_signatures):
             task.attach_work_result(cfrag, reencryption_signature)
@@ -701,6 +723,40 @@ class WorkOrder:
         self.completed = maya.now()
         return good_cfrags
 
+    def complete_incrementally(self, cfrags_and_signatures):
+        """
+        Like complete, but checks, attaches and yields each cfrag as it arrives from Ursula.
+        """
+        tasks = iter(self.tasks)
+        for cfrag, reencryption_signature in cfrags_and_signatures:
+            task = next(tasks, None)
+            if task is None:
+                raise ValueError("Ursula gave back the wrong number of cfrags.  "
+                                 "She's up to something.")
+            self._verify_work_result(task, cfrag, reencryption_signature)
+            task.attach_work_result(cfrag, reencryption_signature)
+            yield cfrag
+
+        if next(tasks, None) is not None:
+            raise ValueError("Ursula gave back the wrong number of cfrags.  "
+                             "She's up to something.")
+        self.completed = maya.now()
+
+    def _verify_work_result(self, task, cfrag, reencryption_signature):
+        ursula_verifying_key = self.ursula.stamp.as_umbral_pubkey()
+
+        # Validate re-encryption metadata
+        metadata_input = bytes(task.signature)
+        metadata_as_signature = Signature.from_bytes(cfrag.proof.metadata)
+        if not metadata_as_signature.verify(metadata_input, ursula_verifying_key):
+            raise InvalidSignature(f"Invalid metadata for {cfrag}.")
+            # TODO: Instead of raising, we should do something
+
+        # Validate re-encryption signatures
+        if not reencryption_signature.verify(bytes(cfrag), ursula_verifying_key):
+            raise InvalidSignature(f"{cfrag} is not properly signed by Ursula.")
+            # TODO: Instead of raising, we should do something
+
 
 class WorkOrderHistory:
 
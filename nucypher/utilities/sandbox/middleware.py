@@ -16,10 +16,12 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 import requests
 import socket
+import time
+import zlib
 
 from bytestring_splitter import VariableLengthBytestring
 from nucypher.characters.lawful import Ursula
-from nucypher.network.middleware import RestMiddleware, NucypherMiddlewareClient
+from nucypher.network.middleware import RestMiddleware, NucypherMiddlewareClient, NODE_METADATA_ENCODING
 from nucypher.utilities.sandbox.constants import MOCK_KNOWN_URSULAS_CACHE
 from constant_sorrow.constants import CERTIFICATE_NOT_SAVED
 
@@ -30,7 +32,12 @@ class _TestMiddlewareClient(NucypherMiddlewareClient):
 
     @staticmethod
     def response_cleaner(response):
-        response.content = response.data
+        # Unlike requests, the Flask test client leaves compressed responses for us to decode.
+        if response.headers.get('Content-Encoding') == NODE_METADATA_ENCODING:
+            response.content = zlib.decompress(response.data)
+        else:
+            response.content = response.data
+        response.iter_content = lambda chunk_size=None: iter((response.content,))
         return response
 
     def _get_mock_client_by_ursula(self, ursula):
@@ -77,12 +84,13 @@ class _TestMiddlewareClient(NucypherMiddlewareClient):
 
     def clean_params(self, request_kwargs):
         request_kwargs["query_string"] = request_kwargs.pop("params", {})
+        request_kwargs.pop("stream", None)  # The test client reads the whole response anyway.
 
 
 class MockRestMiddleware(RestMiddleware):
     _ursulas = None
 
-    client = _TestMiddlewareClient()
+    _client_class = _TestMiddlewareClient
 
     class NotEnoughMockUrsulas(Ursula.NotEnoughUrsulas):
         pass
@@ -122,9 +130,10 @@ class NodeIsDownMiddleware(MockRestMiddleware):
     """
     Modified middleware to emulate one node being down amongst many.
     """
+    _client_class = _MiddlewareClientWithConnectionProblems
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.client = _MiddlewareClientWithConnectionProblems()
         self.ports_that_are_down = []
 
     def node_is_down(self, node):
@@ -134,6 +143,21 @@ class NodeIsDownMiddleware(MockRestMiddleware):
         self.client.ports_that_are_down.remove(node.rest_information()[0].port)
 
 
+class SlowMockRestMiddleware(MockRestMiddleware):
+    """
+    Mock middleware that pays a fixed round-trip cost for every learning and verification request.
+    """
+    latency = 0
+
+    def get_nodes_via_rest(self, *args, **kwargs):
+        time.sleep(self.latency)
+        return super().get_nodes_via_rest(*args, **kwargs)
+
+    def node_information(self, *args, **kwargs):
+        time.sleep(self.latency)
+        return super().node_information(*args, **kwargs)
+
+
 class EvilMiddleWare(MockRestMiddleware):
     """
     Middleware for assholes.
@@ -0,0 +1,120 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import datetime
+import os
+
+import maya
+from constant_sorrow.constants import NON_PAYMENT
+
+from nucypher.characters.lawful import Enrico
+from nucypher.crypto.powers import DecryptingPower
+from nucypher.policy.models import WorkOrder
+from nucypher.utilities.sandbox.middleware import MockRestMiddleware
+from nucypher.utilities.sandbox.policy import generate_random_label
+
+
+def enact_policy(alice, bob, ursulas):
+    policy = alice.create_policy(bob, label=generate_random_label(), m=1, n=len(ursulas), federated=True)
+    policy.make_arrangements(MockRestMiddleware(),
+                             value=NON_PAYMENT,
+                             expiration=maya.now() + datetime.timedelta(days=5),
+                             handpicked_ursulas=ursulas)
+    policy.enact(MockRestMiddleware())
+    return policy
+
+
+def test_bob_coalesces_work_orders_for_many_policies(federated_alice, federated_bob, federated_ursulas):
+    for ursula in federated_ursulas:
+        federated_bob.remember_node(ursula)
+
+    work_orders = []
+    for _ in range(3):
+        policy = enact_policy(federated_alice, federated_bob, federated_ursulas)
+        map_id = policy.treasure_map.public_id()
+        federated_bob.treasure_maps[map_id] = policy.treasure_map
+
+        message_kit, _signature = Enrico(policy_encrypting_key=policy.public_key).encrypt_message(b"Tick, tock.")
+        capsule = message_kit.capsule
+        capsule.set_correctness_keys(delegating=policy.public_key,
+                                     receiving=federated_bob.public_keys(DecryptingPower),
+                                     verifying=federated_alice.stamp.as_umbral_pubkey())
+        work_orders.extend(federated_bob.generate_work_orders(map_id, capsule).values())
+
+    # Three policies, each with an arrangement on every Ursula.
+    assert len(work_orders) == 3 * len(federated_ursulas)
+    assert len({w.arrangement_id for w in work_orders}) == len(work_orders)
+
+    cfrags_by_work_order = federated_bob.get_reencrypted_cfrags_in_bulk(work_orders)
+
+    for work_order, cfrags in zip(work_orders, cfrags_by_work_order):
+        assert work_order.completed
+        cfrag, = cfrags
+        assert cfrag.verify_correctness(work_order.tasks[0].capsule)
+
+    # Each Ursula recorded the work orders she completed, just as if they had come one at a time.
+    for ursula in federated_ursulas:
+        for work_order in work_orders:
+            if work_order.ursula.checksum_public_address == ursula.checksum_public_address:
+                assert work_order in ursula._work_orders
+
+
+def test_bulk_reencryption_skips_arrangements_ursula_does_not_have(federated_alice, federated_bob, federated_ursulas):
+    for ursula in federated_ursulas:
+        federated_bob.remember_node(ursula)
+
+    policy = enact_policy(federated_alice, federated_bob, federated_ursulas)
+    map_id = policy.treasure_map.public_id()
+    federated_bob.treasure_maps[map_id] = policy.treasure_map
+
+    message_kit, _signature = Enrico(policy_encrypting_key=policy.public_key).encrypt_message(b"Tick, tock.")
+    capsule = message_kit.capsule
+    capsule.set_correctness_keys(delegating=policy.public_key,
+                                 receiving=federated_bob.public_keys(DecryptingPower),
+                                 verifying=federated_alice.stamp.as_umbral_pubkey())
+
+    work_order = list(federated_bob.generate_work_orders(map_id, capsule, num_ursulas=1).values())[0]
+    unknown_work_order = WorkOrder.construct_by_bob(os.urandom(32), [capsule], work_order.ursula, federated_bob)
+
+    cfrags, no_cfrags = federated_bob.network_middleware.reencrypt_in_bulk([work_order, unknown_work_order])
+    assert len(cfrags) == 1
+    assert no_cfrags is None
+    assert work_order.completed
+    assert not unknown_work_order.completed
+
+
+def test_bulk_reencryption_skips_arrangement_ursula_does_not_have_even_alone(federated_alice,
+                                                                            federated_bob,
+                                                                            federated_ursulas):
+    for ursula in federated_ursulas:
+        federated_bob.remember_node(ursula)
+
+    policy = enact_policy(federated_alice, federated_bob, federated_ursulas)
+    map_id = policy.treasure_map.public_id()
+    federated_bob.treasure_maps[map_id] = policy.treasure_map
+
+    message_kit, _signature = Enrico(policy_encrypting_key=policy.public_key).encrypt_message(b"Tick, tock.")
+    capsule = message_kit.capsule
+    capsule.set_correctness_keys(delegating=policy.public_key,
+                                 receiving=federated_bob.public_keys(DecryptingPower),
+                                 verifying=federated_alice.stamp.as_umbral_pubkey())
+
+    # The only work order for this Ursula is for an arrangement she doesn't have.
+    work_order = list(federated_bob.generate_work_orders(map_id, capsule, num_ursulas=1).values())[0]
+    unknown_work_order = WorkOrder.construct_by_bob(os.urandom(32), [capsule], work_order.ursula, federated_bob)
+
+    assert federated_bob.get_reencrypted_cfrags_in_bulk([unknown_work_order]) == [None]
+    assert not unknown_work_order.completed
@@ -15,7 +15,11 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+from bytestring_splitter import VariableLengthBytestring
+
 from nucypher.characters.lawful import Ursula
+from nucypher.utilities.sandbox.middleware import MockRestMiddleware
+from nucypher.utilities.sandbox.ursula import make_federated_ursulas
 
 
 def test_serialize_ursula(federated_ursulas):
@@ -23,3 +27,54 @@ def test_serialize_ursula(federated_ursulas):
     ursula_as_bytes = bytes(ursula)
     ursula_object = Ursula.from_bytes(ursula_as_bytes, federated_only=True)
     assert ursula == ursula_object
+
+
+def test_ursula_serialization_is_cached_until_her_metadata_changes(federated_ursulas):
+    ursula = list(federated_ursulas)[0]
+    ursula_as_bytes = bytes(ursula)
+
+    hits = Ursula.serialization_cache_stats['hits']
+    assert bytes(ursula) is ursula_as_bytes
+    assert Ursula.serialization_cache_stats['hits'] == hits + 1
+
+    # A new interface signature and timestamp mean new metadata.
+    ursula._sign_and_date_interface_info()
+    resigned_ursula_as_bytes = bytes(ursula)
+    assert resigned_ursula_as_bytes != ursula_as_bytes
+    assert Ursula.from_bytes(resigned_ursula_as_bytes, federated_only=True).timestamp == ursula.timestamp
+
+    # So do changes made without going through Ursula's own methods.
+    ursula._evidence_of_decentralized_identity = b"this is not really evidence of anything"
+    assert bytes(ursula) != resigned_ursula_as_bytes
+
+
+def test_ursula_sketches_are_only_materialized_on_demand(federated_ursulas):
+    ursulas = list(federated_ursulas)
+    ursulas_as_bytes = bytes().join(bytes(VariableLengthBytestring(bytes(ursula))) for ursula in ursulas)
+
+    sketches = Ursula.sketches_from_bytes(ursulas_as_bytes, federated_only=True)
+    for ursula, sketch in zip(ursulas, sketches):
+        assert sketch.checksum_public_address == ursula.checksum_public_address
+        assert sketch.timestamp == ursula.timestamp
+        assert sketch.serving_domains == ursula.serving_domains
+        assert sketch._node is None
+
+        materialized_ursula = sketch.materialize()
+        assert materialized_ursula == ursula
+        assert sketch.materialize() is materialized_ursula
+
+
+def test_only_ursula_herself_keeps_a_work_order_log(ursula_federated_test_config):
+    ursula = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                    quantity=1,
+                                    know_each_other=False,
+                                    network_middleware=MockRestMiddleware()).pop()
+    assert ursula._work_orders is not None
+
+    stranger = Ursula.from_bytes(bytes(ursula), federated_only=True)
+    assert stranger._work_orders is None
+    assert stranger.work_orders() == []
+
+    # Stopping Ursula writes out the work orders she hasn't stored yet, and stops her writer thread.
+    ursula.stop()
+    assert ursula._work_orders._writer._shutdown
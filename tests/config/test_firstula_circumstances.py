@@ -15,12 +15,15 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import time
 from functools import partial
 
 import pytest_twisted as pt
 from twisted.internet.threads import deferToThread
 
+from nucypher.config.constants import SeednodeMetadata
 from nucypher.network.middleware import RestMiddleware
+from nucypher.utilities.sandbox.middleware import MockRestMiddleware
 from nucypher.utilities.sandbox.ursula import make_federated_ursulas
 
 
@@ -39,6 +42,62 @@ def test_proper_seed_node_instantiation(ursula_federated_test_config):
     assert firstula in any_other_ursula.known_nodes
 
 
+def test_seed_nodes_are_loaded_together_with_stored_certificates(ursula_federated_test_config):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+
+    class CertificateCountingMiddleware(MockRestMiddleware):
+        certificates_fetched = 0
+
+        def get_certificate(self, *args, **kwargs):
+            self.certificates_fetched += 1
+            return super().get_certificate(*args, **kwargs)
+
+    firstula = lonely_ursula_maker().pop()
+    nowhere = SeednodeMetadata(firstula.checksum_public_address, "localhost", 1)  # Nobody is listening here.
+    middleware = CertificateCountingMiddleware()
+    any_other_ursula = lonely_ursula_maker(seed_nodes=[nowhere, firstula.seed_node_metadata()],
+                                           network_middleware=middleware).pop()
+
+    # We've been here before, and kept firstula's certificate.
+    any_other_ursula.node_storage.store_node_certificate(certificate=firstula.certificate)
+    any_other_ursula.load_seednodes(read_storages=False)
+
+    # An unreachable seed node doesn't keep us from the others, and we didn't have to ask for a certificate again.
+    assert firstula in any_other_ursula.known_nodes
+    assert any_other_ursula.unresponsive_seed_nodes == {nowhere}
+    assert middleware.certificates_fetched == 0
+
+
+
+def test_a_seed_node_that_never_answers_does_not_hold_up_startup(ursula_federated_test_config, monkeypatch):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+
+    class BlackholeMiddleware(MockRestMiddleware):
+        def get_certificate(self, host, port, *args, **kwargs):
+            if port == 1:
+                time.sleep(5)  # Long after we've stopped waiting.
+            return super().get_certificate(host, port, *args, **kwargs)
+
+    firstula = lonely_ursula_maker().pop()
+    blackhole = SeednodeMetadata(firstula.checksum_public_address, "localhost", 1)
+    any_other_ursula = lonely_ursula_maker(seed_nodes=[blackhole, firstula.seed_node_metadata()],
+                                           network_middleware=BlackholeMiddleware()).pop()
+    any_other_ursula.node_storage.store_node_certificate(certificate=firstula.certificate)
+    monkeypatch.setattr(any_other_ursula, "_SEEDING_DEADLINE", 1)
+
+    started = time.time()
+    any_other_ursula.load_seednodes(read_storages=False)
+    assert time.time() - started < 3
+
+    assert firstula in any_other_ursula.known_nodes
+    assert any_other_ursula.unresponsive_seed_nodes == {blackhole}
+
 @pt.inlineCallbacks
 def test_get_cert_from_running_seed_node(ursula_federated_test_config):
     lonely_ursula_maker = partial(make_federated_ursulas,
@@ -20,7 +20,7 @@ from cryptography.hazmat.primitives import hashes
 from umbral.keys import UmbralPrivateKey
 
 from nucypher.crypto.api import ecdsa_sign
-from nucypher.crypto.signing import Signature, Signer
+from nucypher.crypto.signing import Signature, Signer, VerificationCache
 from nucypher.crypto.utils import recover_pubkey_from_signature
 
 
@@ -72,3 +72,29 @@ def test_recover_pubkey_from_signature(execution_number):
                                                      signature=signature,
                                                      v_value_to_try=v_value)
     assert pubkey_bytes == pubkey.to_bytes()
+
+
+def test_verification_cache_only_remembers_valid_signatures():
+    privkey = UmbralPrivateKey.gen_key()
+    signer = Signer(private_key=privkey)
+    message = b"peace at dawn"
+    signature = signer(message=message)
+
+    cache = VerificationCache(max_size=2)
+    assert cache.verify(signature, message, privkey.get_pubkey())
+    assert cache.verify(Signature.from_bytes(bytes(signature)), message, privkey.get_pubkey())
+    assert cache.stats['hits'] == 1
+    assert cache.hit_rate == 0.5
+
+    # Invalid signatures are checked every time.
+    assert not cache.verify(signature, b"war at dusk", privkey.get_pubkey())
+    assert not cache.verify(signature, b"war at dusk", privkey.get_pubkey())
+    assert len(cache) == 1
+
+    # The least recently used entries are evicted.
+    for other_message in (b"peace at noon", b"peace at dusk"):
+        assert cache.verify(signer(message=other_message), other_message, privkey.get_pubkey())
+    assert len(cache) == 2
+    misses = cache.stats['misses']
+    assert cache.verify(signature, message, privkey.get_pubkey())
+    assert cache.stats['misses'] == misses + 1
@@ -14,10 +14,15 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
+import os
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
 import pytest
-from datetime import datetime
+from sqlalchemy.engine import create_engine
 
 from nucypher.keystore import keystore, keypairs
+from nucypher.keystore.db import Base
 
 
 @pytest.mark.usefixtures('testerchain')
@@ -75,3 +80,89 @@ def test_workorder_sqlite_keystore(test_keystore):
     deleted = test_keystore.del_workorders(arrangement_id)
     assert deleted > 0
     assert test_keystore.get_workorders(arrangement_id).count() == 0
+
+
+def test_policy_arrangement_cache():
+    alices_verifying_key = keypairs.SigningKeypair(generate_keys_if_needed=True).pubkey
+    loads = []
+
+    def loader(kfrag_bytes, expiration=None):
+        def load():
+            loads.append(kfrag_bytes)
+            return keystore.CachedArrangement(kfrag_bytes=kfrag_bytes,
+                                              alices_verifying_key=alices_verifying_key,
+                                              alices_address=b"an address",
+                                              expiration=expiration)
+        return load
+
+    cache = keystore.PolicyArrangementCache(max_entries=2)
+    assert cache.get(b"hot", load=loader(b"hot kfrag")).kfrag_bytes == b"hot kfrag"
+    assert cache.get(b"hot", load=loader(b"hot kfrag")).kfrag_bytes == b"hot kfrag"
+    assert loads == [b"hot kfrag"]
+    assert cache.stats['hits'] == 1 and cache.stats['misses'] == 1
+
+    # Revoked arrangements are forgotten.
+    cache.invalidate(b"hot")
+    cache.get(b"hot", load=loader(b"hot kfrag"))
+    assert loads == [b"hot kfrag"] * 2
+
+    # The least recently used arrangement makes room for new ones...
+    cache.get(b"warm", load=loader(b"warm kfrag"))
+    cache.get(b"hot", load=loader(b"hot kfrag"))
+    cache.get(b"cold", load=loader(b"cold kfrag"))
+    assert len(cache) == 2
+    assert cache.stats['evictions'] == 1
+    cache.get(b"hot", load=loader(b"hot kfrag"))
+    assert loads.count(b"hot kfrag") == 2
+
+    # ...as do arrangements beyond the cache's size in bytes.
+    entry_size = len(cache.get(b"hot", load=loader(b"hot kfrag")))
+    small_cache = keystore.PolicyArrangementCache(max_bytes=entry_size)
+    small_cache.get(b"hot", load=loader(b"hot kfrag"))
+    small_cache.get(b"cold", load=loader(b"old kfrag"))
+    assert len(small_cache) == 1
+    assert small_cache.size_in_bytes <= entry_size
+
+    # Arrangements are only cached until they expire.
+    expiration = datetime(2030, 1, 1)
+    cache.get(b"expiring", load=loader(b"expiring kfrag", expiration=expiration))
+    cache.get(b"expiring", load=loader(b"expiring kfrag", expiration=expiration), now=expiration.timestamp() + 1e6)
+    assert cache.stats['expirations'] == 1
+    assert loads.count(b"expiring kfrag") == 2
+
+
+def test_work_order_log(tmpdir):
+    engine = create_engine(f"sqlite:///{tmpdir.join('work_orders.db')}")
+    Base.metadata.create_all(engine)
+    datastore = keystore.KeyStore(engine)
+
+    bobs = [SimpleNamespace(stamp=keypairs.SigningKeypair(generate_keys_if_needed=True).get_signature_stamp())
+            for _ in range(2)]
+    work_orders = [SimpleNamespace(bob=bobs[number % 2],
+                                   receipt_signature=os.urandom(64),
+                                   arrangement_id=b"arrangement %d" % (number % 3))
+                   for number in range(10)]
+
+    work_order_log = keystore.WorkOrderLog(datastore=datastore, recent_work_orders=4, batch_size=3)
+    for work_order in work_orders:
+        work_order_log.append(work_order)
+
+    # Only the most recent are kept in memory...
+    assert work_order_log.total == 10
+    assert len(work_order_log) == 4
+    assert work_order_log.recent(bob=bobs[0]) == [work_orders[6], work_orders[8]]
+    assert work_order_log.recent(bob=bobs[1]) == [work_orders[7], work_orders[9]]
+
+    # ...but all of them make it to the datastore.
+    work_order_log.close()
+    assert len(work_order_log.find()) == 10
+    assert len(work_order_log.find(bob=bobs[0])) == 5
+    assert len(work_order_log.find(arrangement_id=b"arrangement 0")) == 4
+    tomorrow = datetime.utcnow() + timedelta(days=1)
+    assert work_order_log.find(since=tomorrow) == []
+    assert len(work_order_log.find(until=tomorrow)) == 10
+
+    # Work orders that are already stored aren't stored again.
+    stored = [(work_order.bob.stamp, work_order.receipt_signature, work_order.arrangement_id, None)
+              for work_order in work_orders]
+    assert datastore.add_workorders(stored) == 0
@@ -0,0 +1,43 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import threading
+import time
+
+from nucypher.utilities.sandbox.ursula import make_federated_ursulas
+
+
+def test_blocked_learner_wakes_up_as_soon_as_nodes_are_remembered(federated_ursulas, ursula_federated_test_config):
+    learner = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                     quantity=1,
+                                     know_each_other=False).pop()
+    ursula = list(federated_ursulas)[0]
+
+    outcomes = []
+
+    def wait_for_ursula():
+        started = time.time()
+        outcomes.append(learner.block_until_specific_nodes_are_known({ursula.checksum_public_address}, timeout=10))
+        outcomes.append(time.time() - started)
+
+    waiter = threading.Thread(target=wait_for_ursula)
+    waiter.start()
+    learner.remember_node(ursula)
+    waiter.join(timeout=10)
+
+    learned, seconds_waited = outcomes
+    assert learned is True
+    assert seconds_waited < 5
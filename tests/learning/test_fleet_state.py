@@ -1,6 +1,7 @@
 from constant_sorrow.constants import FLEET_STATES_MATCH, NO_KNOWN_NODES
 from hendrix.experience import crosstown_traffic
 from hendrix.utils.test_utils import crosstownTaskListDecoratorFactory
+from nucypher.network.nodes import FleetStateTracker
 from nucypher.utilities.sandbox.ursula import make_federated_ursulas
 from functools import partial
 
@@ -73,11 +74,13 @@ def test_old_state_is_preserved(federated_ursulas, ursula_federated_test_config)
 
     assert checksum_after_learning_one != checksum_after_learning_two
 
-    proper_first_state = sorted([some_ursula_in_the_fleet, lonely_learner], key=lambda n: n.checksum_public_address)
+    def state_of(*nodes):
+        return tuple(sorted(((n.checksum_public_address, n.timestamp.epoch) for n in nodes)))
+
+    proper_first_state = state_of(some_ursula_in_the_fleet, lonely_learner)
     assert lonely_learner.known_nodes.states[checksum_after_learning_one].nodes == proper_first_state
 
-    proper_second_state = sorted([some_ursula_in_the_fleet, another_ursula_in_the_fleet, lonely_learner],
-                                 key=lambda n: n.checksum_public_address)
+    proper_second_state = state_of(some_ursula_in_the_fleet, another_ursula_in_the_fleet, lonely_learner)
     assert lonely_learner.known_nodes.states[checksum_after_learning_two].nodes == proper_second_state
 
 
@@ -106,3 +109,72 @@ def test_state_is_recorded_after_learning(federated_ursulas, ursula_federated_te
 
     assert len(states[0].nodes) == 2  # This and one other.
     assert len(states[1].nodes) == len(federated_ursulas) + 1  # Again, accounting for this Learner.
+
+
+def test_fleet_checksum_is_maintained_incrementally(federated_ursulas):
+    first, second, third, *_ = sorted(federated_ursulas, key=lambda n: n.checksum_public_address)
+
+    one_way = FleetStateTracker()
+    for node in (first, second, third):
+        one_way[node.checksum_public_address] = node
+    one_way.record_fleet_state()
+
+    another_way = FleetStateTracker()
+    for node in (third, first, second):
+        another_way[node.checksum_public_address] = node
+    another_way.record_fleet_state()
+
+    # Insertion order doesn't matter.
+    assert one_way.checksum == another_way.checksum
+
+    # Neither does rebuilding the digests from scratch.
+    checksum_before_rebuild = one_way._calculate_checksum()
+    one_way._reindex()
+    assert one_way._calculate_checksum() == checksum_before_rebuild
+
+    # Replacing a node divides its digest back out.
+    replaced = FleetStateTracker()
+    for node in (first, second):
+        replaced[node.checksum_public_address] = node
+    replaced[second.checksum_public_address] = third
+    replaced.record_fleet_state()
+    first_and_third = FleetStateTracker()
+    for node in (first, third):
+        first_and_third[node.checksum_public_address] = node
+    first_and_third.record_fleet_state()
+    assert replaced.checksum == first_and_third.checksum
+
+    # But the set of nodes does.
+    smaller = FleetStateTracker()
+    for node in (first, second):
+        smaller[node.checksum_public_address] = node
+    smaller.record_fleet_state()
+    assert smaller.checksum != one_way.checksum
+
+
+def test_fleet_state_history_is_bounded(federated_ursulas, ursula_federated_test_config):
+    lonely_learner = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                            quantity=1,
+                                            know_each_other=False).pop()
+    lonely_learner.known_nodes._MAX_FLEET_STATES = 3
+
+    for ursula in federated_ursulas:
+        lonely_learner.remember_node(ursula)
+    assert len(lonely_learner.known_nodes.states) == 3
+    assert lonely_learner.known_nodes.checksum in lonely_learner.known_nodes.states
+
+    # Teachers can still send deltas to learners whose fleet state is within the retained window...
+    oldest_retained_checksum = next(iter(lonely_learner.known_nodes.states))
+    assert len(lonely_learner.known_nodes.nodes_updated_since(oldest_retained_checksum)) == 2
+
+    # ...and old states also expire after a while, apart from the current one.
+    states = lonely_learner.known_nodes.states
+    for checksum, state in states.items():
+        states[checksum] = state._replace(updated=state.updated.subtract(days=2))
+    lonely_learner.known_nodes._evict_old_states()
+    assert list(lonely_learner.known_nodes.states) == [lonely_learner.known_nodes.checksum]
+
+    # The current state's nodes can still be worked out once the journal has been compacted.
+    current_state = lonely_learner.known_nodes.states[lonely_learner.known_nodes.checksum]
+    expected_nodes = tuple((n.checksum_public_address, n.timestamp.epoch) for n in lonely_learner.known_nodes.sorted())
+    assert current_state.nodes == expected_nodes
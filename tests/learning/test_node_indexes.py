@@ -0,0 +1,53 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import maya
+
+from nucypher.utilities.sandbox.ursula import make_federated_ursulas
+
+
+def test_fleet_state_tracker_indexes(federated_ursulas, ursula_federated_test_config):
+    lonely_learner = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                            quantity=1,
+                                            know_each_other=False).pop()
+    tracker = lonely_learner.known_nodes
+    some_ursula, another_ursula, *other_ursulas = list(federated_ursulas)
+    tracker.update({ursula.checksum_public_address: ursula for ursula in (some_ursula, another_ursula)})
+
+    # Membership, both by address and by node.
+    assert some_ursula.checksum_public_address in tracker
+    assert some_ursula in tracker
+    assert other_ursulas[0] not in tracker
+    assert other_ursulas[0].checksum_public_address not in tracker
+
+    # By domain.
+    domain, = some_ursula.serving_domains
+    assert set(tracker.nodes_serving([domain])) == {some_ursula, another_ursula}
+    assert tracker.nodes_serving([b"not-a-domain-anyone-serves"]) == []
+
+    # By staleness: nodes we've never heard from come first, then the ones we heard from longest ago.
+    now = maya.now()
+    tracker.mark_seen(another_ursula, when=now.subtract(minutes=5))
+    tracker.mark_seen(some_ursula, when=now.subtract(minutes=1))
+    assert tracker.stalest(2) == [another_ursula, some_ursula]
+    tracker.mark_seen(another_ursula, when=now)
+    assert tracker.stalest(1) == [some_ursula]
+
+    # Replacing the tracked nodes wholesale rebuilds the indexes.
+    tracker._nodes = {}
+    assert some_ursula not in tracker
+    assert tracker.nodes_serving([domain]) == []
+    assert tracker.stalest(1) == []
@@ -0,0 +1,97 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from collections import Counter
+from functools import partial
+
+from nucypher.network.teachers import LatencyAwareTeacherSelection, RandomTeacherSelection
+from nucypher.utilities.sandbox.middleware import NodeIsDownMiddleware
+from nucypher.utilities.sandbox.ursula import make_federated_ursulas
+
+
+def test_fast_and_fresh_teachers_are_preferred_but_slow_ones_are_still_used(federated_ursulas):
+    nearby, faraway, *_ = list(federated_ursulas)
+    selection = LatencyAwareTeacherSelection(batch_size=1)
+
+    for _ in range(5):
+        selection.record_latency(nearby, 0.01)
+        selection.record_freshness(nearby, 3)
+        selection.record_latency(faraway, 2)
+        selection.record_freshness(faraway, 0)
+    assert selection.weight(nearby) > selection.weight(faraway)
+
+    first_choices = Counter(selection.select([nearby, faraway]).pop() for _ in range(1000))
+    assert first_choices[nearby] > first_choices[faraway] > 0
+
+    # A teacher we haven't measured yet is given the benefit of the doubt.
+    newcomer = list(federated_ursulas)[2]
+    nearby_probability, _, newcomer_probability = selection.probabilities([nearby, faraway, newcomer])
+    assert newcomer_probability == nearby_probability
+
+
+def test_teacher_selection_is_pluggable(federated_ursulas, ursula_federated_test_config):
+    learner = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                     quantity=1,
+                                     know_each_other=False,
+                                     teacher_selection=RandomTeacherSelection()).pop()
+    assert isinstance(learner.teacher_selection, RandomTeacherSelection)
+
+    for ursula in federated_ursulas:
+        learner.remember_node(ursula)
+
+    # Random selection queues up every known node as a teacher.
+    learner.select_teacher_nodes()
+    assert len(learner.teacher_nodes) == len(federated_ursulas)
+
+
+def test_teachers_are_only_credited_with_nodes_that_check_out(federated_ursulas, ursula_federated_test_config):
+    learner = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                     quantity=1,
+                                     know_each_other=False).pop()
+    teacher, *other_ursulas = list(federated_ursulas)
+    learner.remember_node(teacher)
+
+    # The teacher tells us about all of the other Ursulas, but we can't reach any of them to verify them.
+    learner.network_middleware = NodeIsDownMiddleware()
+    for ursula in other_ursulas:
+        learner.network_middleware.node_is_down(ursula)
+
+    learner._current_teacher_node = teacher
+    assert learner.learn_from_teacher_node(eager=True) == []
+    assert learner.teacher_selection.freshness[teacher.checksum_public_address] == 0
+
+
+def test_learner_learns_from_several_teachers_at_once(federated_ursulas, ursula_federated_test_config):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+    lonely_learner = lonely_ursula_maker(teachers_per_round=2).pop()
+
+    first_teacher, second_teacher, *_ = list(federated_ursulas)
+    lonely_learner.remember_node(first_teacher)
+    lonely_learner.remember_node(second_teacher)
+
+    new_nodes = lonely_learner.learn_from_teachers()
+
+    # Both teachers told the same story; each node was learned about (and verified) exactly once.
+    assert len(new_nodes) == len(federated_ursulas) - 2
+    assert len(set(n.checksum_public_address for n in new_nodes)) == len(new_nodes)
+    assert len(lonely_learner.known_nodes) == len(federated_ursulas)
+
+    # Only one new fleet state was recorded for the whole round.
+    states = list(lonely_learner.known_nodes.states.values())
+    assert len(states[-1].nodes) == len(federated_ursulas) + 1
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import timeit
+
+from eth_utils import to_checksum_address
+
+from nucypher.crypto.api import keccak_digest
+from nucypher.network.nodes import FleetStateTracker
+
+FLEET_SIZES = (100, 1000, 10000)
+SERIALIZED_NODE_SIZE = 1300  # Roughly the size of a serialized Ursula, certificate included.
+REPETITIONS = 20
+
+
+class FakeNode:
+
+    def __init__(self):
+        self.checksum_public_address = to_checksum_address(os.urandom(20))
+        self._bytes = os.urandom(SERIALIZED_NODE_SIZE)
+
+    def __bytes__(self):
+        return self._bytes
+
+
+def full_checksum(tracker):
+    """
+    The previous approach: sort and serialize every known node on every change.
+    """
+    return keccak_digest(b"".join(bytes(n) for n in tracker.sorted())).hex()
+
+
+def main():
+    print(f"{'nodes'.ljust(10)}{'full (ms)'.rjust(14)}{'incremental (ms)'.rjust(20)}")
+    for fleet_size in FLEET_SIZES:
+        tracker = FleetStateTracker()
+        for _ in range(fleet_size):
+            node = FakeNode()
+            tracker[node.checksum_public_address] = node
+
+        def add_node_and_recalculate_fully():
+            node = FakeNode()
+            tracker[node.checksum_public_address] = node
+            full_checksum(tracker)
+
+        def add_node_and_recalculate_incrementally():
+            node = FakeNode()
+            tracker[node.checksum_public_address] = node
+            tracker._calculate_checksum()
+
+        full = timeit.timeit(add_node_and_recalculate_fully, number=REPETITIONS) / REPETITIONS
+        incremental = timeit.timeit(add_node_and_recalculate_incrementally, number=REPETITIONS) / REPETITIONS
+        print(f"{str(fleet_size).ljust(10)}{full * 1000:14.3f}{incremental * 1000:20.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import time
+
+from nucypher.config.characters import UrsulaConfiguration
+from nucypher.utilities.sandbox.constants import MOCK_URSULA_STARTING_PORT
+from nucypher.utilities.sandbox.middleware import SlowMockRestMiddleware
+from nucypher.utilities.sandbox.ursula import make_federated_ursulas
+
+FLEET_SIZE = 40
+NEIGHBORS_PER_NODE = 3
+SIMULATED_LATENCY = 0.05  # seconds per request
+FANOUTS = (1, 2, 4, 8)
+MAX_ROUNDS = 200
+
+
+def make_sparse_fleet(ursula_config, quantity, neighbors):
+    """
+    Each node in the fleet initially knows only about its next few neighbors in a ring.
+    """
+    fleet = list(make_federated_ursulas(ursula_config=ursula_config, quantity=quantity, know_each_other=False))
+    for index, ursula in enumerate(fleet):
+        for offset in range(1, neighbors + 1):
+            ursula.remember_node(fleet[(index + offset) % len(fleet)])
+    return fleet
+
+
+def measure_convergence(ursula_config, seed_node, teachers_per_round, target):
+    learner = make_federated_ursulas(ursula_config=ursula_config,
+                                     quantity=1,
+                                     know_each_other=False,
+                                     teachers_per_round=teachers_per_round).pop()
+    learner.remember_node(seed_node)
+
+    start = time.time()
+    for learning_round in range(1, MAX_ROUNDS + 1):
+        if teachers_per_round > 1:
+            learner.learn_from_teachers()
+        else:
+            learner.learn_from_teacher_node()
+        if len(learner.known_nodes) >= target:
+            break
+    elapsed = time.time() - start
+    return elapsed, learning_round, len(learner.known_nodes)
+
+
+def main():
+    middleware = SlowMockRestMiddleware()
+    ursula_config = UrsulaConfiguration(dev_mode=True,
+                                        rest_port=MOCK_URSULA_STARTING_PORT,
+                                        is_me=True,
+                                        start_learning_now=False,
+                                        abort_on_learning_error=True,
+                                        federated_only=True,
+                                        network_middleware=middleware,
+                                        save_metadata=False,
+                                        reload_metadata=False)
+
+    print(f"Building a sparse fleet of {FLEET_SIZE} nodes ({NEIGHBORS_PER_NODE} neighbors each)...")
+    fleet = make_sparse_fleet(ursula_config, quantity=FLEET_SIZE, neighbors=NEIGHBORS_PER_NODE)
+    SlowMockRestMiddleware.latency = SIMULATED_LATENCY
+
+    print(f"{'teachers/round'.ljust(16)}{'seconds'.rjust(10)}{'rounds'.rjust(10)}{'known'.rjust(10)}")
+    for fanout in FANOUTS:
+        elapsed, rounds, known = measure_convergence(ursula_config,
+                                                     seed_node=fleet[0],
+                                                     teachers_per_round=fanout,
+                                                     target=FLEET_SIZE)
+        print(f"{str(fanout).ljust(16)}{elapsed:10.2f}{rounds:10}{known:10}")
+
+    ursula_config.cleanup()
+
+
+if __name__ == "__main__":
+    main()
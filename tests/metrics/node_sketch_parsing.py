@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import time
+
+from bytestring_splitter import VariableLengthBytestring
+
+from nucypher.characters.lawful import Ursula
+from nucypher.config.characters import UrsulaConfiguration
+from nucypher.utilities.sandbox.constants import MOCK_URSULA_STARTING_PORT
+from nucypher.utilities.sandbox.middleware import MockRestMiddleware
+from nucypher.utilities.sandbox.ursula import make_federated_ursulas
+
+FLEET_SIZE = 20
+PAYLOAD_REPETITIONS = 10  # The payload holds each node this many times, as if from a large fleet.
+ROUNDS = 5
+
+
+def nodes_per_second(parse, payload, number_of_nodes):
+    start = time.time()
+    for _ in range(ROUNDS):
+        parse(payload)
+    return number_of_nodes * ROUNDS / (time.time() - start)
+
+
+def main():
+    ursula_config = UrsulaConfiguration(dev_mode=True,
+                                        rest_port=MOCK_URSULA_STARTING_PORT,
+                                        is_me=True,
+                                        start_learning_now=False,
+                                        abort_on_learning_error=True,
+                                        federated_only=True,
+                                        network_middleware=MockRestMiddleware(),
+                                        save_metadata=False,
+                                        reload_metadata=False)
+
+    fleet = make_federated_ursulas(ursula_config=ursula_config, quantity=FLEET_SIZE, know_each_other=False)
+    payload = bytes().join(bytes(VariableLengthBytestring(bytes(ursula))) for ursula in fleet) * PAYLOAD_REPETITIONS
+    number_of_nodes = FLEET_SIZE * PAYLOAD_REPETITIONS
+
+    full = nodes_per_second(lambda p: Ursula.batch_from_bytes(p, federated_only=True), payload, number_of_nodes)
+    sketched = nodes_per_second(lambda p: Ursula.sketches_from_bytes(p, federated_only=True), payload, number_of_nodes)
+
+    print(f"{'parser'.ljust(24)}{'nodes/sec'.rjust(12)}")
+    print(f"{'batch_from_bytes'.ljust(24)}{full:12.0f}")
+    print(f"{'sketches_from_bytes'.ljust(24)}{sketched:12.0f}")
+
+    ursula_config.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import threading
+import time
+
+from twisted.internet import reactor
+from twisted.internet.threads import blockingCallFromThread
+
+from nucypher.config.characters import UrsulaConfiguration
+from nucypher.network.middleware import NucypherMiddlewareClient, RestMiddleware
+from nucypher.utilities.sandbox.constants import MOCK_URSULA_STARTING_PORT
+from nucypher.utilities.sandbox.ursula import make_federated_ursulas, start_pytest_ursula_services
+
+DURATION = 5  # seconds per client
+
+
+class UnpooledMiddlewareClient(NucypherMiddlewareClient):
+    """
+    The way it used to be: every request is a new connection (and a new TLS handshake).
+    """
+
+    def http_client_for(self, host, certificate_filepath, http_client):
+        return http_client
+
+
+def requests_per_second(client, teacher):
+    requests_made = 0
+    start = time.time()
+    while time.time() - start < DURATION:
+        client.get(node=teacher, path="public_information")
+        requests_made += 1
+    return requests_made / (time.time() - start)
+
+
+def run(ursula_config):
+    # Knowing each other, each has the other's certificate on file.
+    teacher, _learner = make_federated_ursulas(ursula_config=ursula_config, quantity=2)
+    blockingCallFromThread(reactor, start_pytest_ursula_services, teacher)
+
+    print(f"{'client'.ljust(16)}{'requests/sec'.rjust(14)}")
+    for label, client in (("unpooled", UnpooledMiddlewareClient()), ("pooled", NucypherMiddlewareClient())):
+        print(f"{label.ljust(16)}{requests_per_second(client, teacher):14.1f}")
+
+
+def main():
+    ursula_config = UrsulaConfiguration(dev_mode=True,
+                                        rest_port=MOCK_URSULA_STARTING_PORT,
+                                        is_me=True,
+                                        start_learning_now=False,
+                                        abort_on_learning_error=True,
+                                        federated_only=True,
+                                        network_middleware=RestMiddleware(),
+                                        save_metadata=False,
+                                        reload_metadata=False)
+
+    def benchmark():
+        try:
+            run(ursula_config)
+        finally:
+            ursula_config.cleanup()
+            reactor.callFromThread(reactor.stop)
+
+    threading.Thread(target=benchmark).start()
+    reactor.run()
+
+
+if __name__ == "__main__":
+    main()
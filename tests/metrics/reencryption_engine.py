@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from umbral import pre
+from umbral.keys import UmbralPrivateKey
+from umbral.signing import Signer
+
+from nucypher.network.reencryption import ReencryptionEngine
+from nucypher.policy.models import WorkOrder
+
+ARRANGEMENTS = 10
+CAPSULES_PER_WORK_ORDER = 5
+WORK_ORDERS = 200
+CONCURRENT_REQUESTS_PER_WORKER = 4
+
+
+def make_arrangements(alices_signing_key):
+    """
+    Returns (arrangement ID, kfrag bytes, tasks) for a number of policies, each with a work order's worth of capsules.
+    """
+    arrangements = list()
+    for _ in range(ARRANGEMENTS):
+        delegating_key, receiving_key = UmbralPrivateKey.gen_key(), UmbralPrivateKey.gen_key()
+        kfrag, = pre.generate_kfrags(delegating_privkey=delegating_key,
+                                     receiving_pubkey=receiving_key.get_pubkey(),
+                                     threshold=1,
+                                     N=1,
+                                     signer=Signer(alices_signing_key))
+        tasks = list()
+        for _ in range(CAPSULES_PER_WORK_ORDER):
+            _ciphertext, capsule = pre.encrypt(delegating_key.get_pubkey(), b"Tick, tock.")
+            tasks.append(WorkOrder.Task(capsule=capsule, signature=Signer(receiving_key)(bytes(capsule))))
+        arrangements.append((os.urandom(32), bytes(kfrag), tasks))
+    return arrangements
+
+
+def measure(workers, arrangements, alices_verifying_key_bytes):
+    """
+    Sends work orders to an engine from as many concurrent requests as Hendrix might serve,
+    and returns the elapsed time along with the latency of each work order.
+    """
+    engine = ReencryptionEngine(signing_key=UmbralPrivateKey.gen_key(), workers=workers, queue_depth=WORK_ORDERS)
+
+    def work_order(number):
+        arrangement_id, kfrag_bytes, tasks = arrangements[number % len(arrangements)]
+        start = time.time()
+        list(engine.reencrypt(arrangement_id=arrangement_id,
+                              kfrag_bytes=kfrag_bytes,
+                              verifying_key_bytes=alices_verifying_key_bytes,
+                              tasks=tasks))
+        return time.time() - start
+
+    # Let the worker processes start (and deserialize their kfrags) before the clock starts.
+    for number in range(len(arrangements) * max(workers, 1)):
+        work_order(number)
+
+    concurrency = max(workers, 1) * CONCURRENT_REQUESTS_PER_WORKER
+    with ThreadPoolExecutor(max_workers=concurrency) as requests:
+        start = time.time()
+        latencies = list(requests.map(work_order, range(WORK_ORDERS)))
+        elapsed = time.time() - start
+
+    engine.shutdown()
+    return elapsed, latencies
+
+
+def main():
+    alices_signing_key = UmbralPrivateKey.gen_key()
+    arrangements = make_arrangements(alices_signing_key)
+    alices_verifying_key_bytes = bytes(alices_signing_key.get_pubkey())
+
+    worker_counts = [0] + [2 ** n for n in range(os.cpu_count().bit_length()) if 2 ** n <= os.cpu_count()]
+    print(f"{WORK_ORDERS} work orders of {CAPSULES_PER_WORK_ORDER} capsules each, on {os.cpu_count()} cores")
+    print(f"{'workers'.ljust(16)}{'cfrags/sec'.rjust(14)}{'p50 (ms)'.rjust(12)}{'p99 (ms)'.rjust(12)}")
+    for workers in worker_counts:
+        elapsed, latencies = measure(workers, arrangements, alices_verifying_key_bytes)
+        latencies.sort()
+        p50 = latencies[len(latencies) // 2]
+        p99 = latencies[int(len(latencies) * 0.99) - 1]
+        label = str(workers) if workers else "0 (inline)"
+        print(f"{label.ljust(16)}"
+              f"{WORK_ORDERS * CAPSULES_PER_WORK_ORDER / elapsed:14.1f}"
+              f"{p50 * 1000:12.1f}"
+              f"{p99 * 1000:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
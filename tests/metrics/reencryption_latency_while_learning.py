@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import datetime
+import statistics
+import threading
+import time
+
+import maya
+from constant_sorrow.constants import NON_PAYMENT
+from twisted.internet import reactor, task
+from twisted.internet.threads import blockingCallFromThread
+
+from nucypher.characters.lawful import Enrico
+from nucypher.config.characters import AliceConfiguration, BobConfiguration, UrsulaConfiguration
+from nucypher.crypto.powers import DecryptingPower
+from nucypher.utilities.sandbox.constants import MOCK_URSULA_STARTING_PORT
+from nucypher.utilities.sandbox.middleware import MockRestMiddleware, SlowMockRestMiddleware
+from nucypher.utilities.sandbox.ursula import make_federated_ursulas
+
+FLEET_SIZE = 10
+SIMULATED_LATENCY = 0.05  # seconds per learning or verification request
+REQUESTS = 50
+
+
+def make_work_order(fleet, target):
+    """
+    Enacts a policy over the fleet and returns a work order for the target Ursula.
+    """
+    alice_config = AliceConfiguration(dev_mode=True,
+                                      is_me=True,
+                                      network_middleware=MockRestMiddleware(),
+                                      known_nodes=fleet,
+                                      federated_only=True,
+                                      abort_on_learning_error=True,
+                                      save_metadata=False,
+                                      reload_metadata=False)
+    bob_config = BobConfiguration(dev_mode=True,
+                                  network_middleware=MockRestMiddleware(),
+                                  start_learning_now=False,
+                                  abort_on_learning_error=True,
+                                  federated_only=True,
+                                  save_metadata=False,
+                                  reload_metadata=False)
+    alice, bob = alice_config.produce(), bob_config.produce()
+
+    policy = alice.create_policy(bob, label=b"latency-while-learning", m=1, n=len(fleet), federated=True)
+    policy.make_arrangements(MockRestMiddleware(),
+                             value=NON_PAYMENT,
+                             expiration=maya.now() + datetime.timedelta(days=5),
+                             handpicked_ursulas=set(fleet))
+    policy.enact(MockRestMiddleware())
+
+    for ursula in fleet:
+        bob.remember_node(ursula)
+    map_id = policy.treasure_map.public_id()
+    bob.treasure_maps[map_id] = policy.treasure_map
+
+    message_kit, _signature = Enrico(policy_encrypting_key=policy.public_key).encrypt_message(b"Tick, tock.")
+    capsule = message_kit.capsule
+    capsule.set_correctness_keys(delegating=policy.public_key,
+                                 receiving=bob.public_keys(DecryptingPower),
+                                 verifying=alice.stamp.as_umbral_pubkey())
+
+    work_orders = bob.generate_work_orders(map_id, capsule, num_ursulas=len(fleet))
+    work_order = next(w for w in work_orders.values() if w.ursula == target)
+
+    alice_config.cleanup()
+    bob_config.cleanup()
+    return work_order
+
+
+def measure(target, work_order, learning_on_reactor):
+    """
+    Serves re-encryption requests from the reactor thread - as Hendrix would - while the target
+    learns as fast as it can, and returns the time each request took.
+    """
+    if learning_on_reactor:
+        # The way it used to be: the learning round itself runs on the reactor.
+        target._learning_task = task.LoopingCall(target.keep_learning_about_nodes)
+    target._SHORT_LEARNING_DELAY = 0
+    blockingCallFromThread(reactor, target.start_learning_loop)
+
+    client = target.rest_app.test_client()
+    path = f"/kFrag/{work_order.arrangement_id.hex()}/reencrypt"
+    payload = work_order.payload()
+
+    def reencrypt():
+        response = client.post(path, data=payload)
+        response.get_data()  # The cfrags are streamed; they're only all made once the response is read.
+        return response
+
+    latencies = []
+    for _ in range(REQUESTS):
+        start = time.time()
+        response = blockingCallFromThread(reactor, reencrypt)
+        assert response.status_code == 200
+        latencies.append(time.time() - start)
+
+    blockingCallFromThread(reactor, target.stop_learning_loop)
+    return latencies
+
+
+def run(ursula_config):
+    print(f"Building a fleet of {FLEET_SIZE} nodes...")
+    fleet = list(make_federated_ursulas(ursula_config=ursula_config, quantity=FLEET_SIZE))
+    target = fleet[0]
+    work_order = make_work_order(fleet, target)
+    SlowMockRestMiddleware.latency = SIMULATED_LATENCY
+
+    print(f"{'learning round runs on'.ljust(26)}{'median (ms)'.rjust(14)}{'p95 (ms)'.rjust(12)}{'max (ms)'.rjust(12)}")
+    for label, learning_on_reactor in (("a learning thread", False), ("the reactor", True)):
+        latencies = sorted(measure(target, work_order, learning_on_reactor))
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+        print(f"{label.ljust(26)}"
+              f"{statistics.median(latencies) * 1000:14.1f}"
+              f"{p95 * 1000:12.1f}"
+              f"{latencies[-1] * 1000:12.1f}")
+
+
+def main():
+    ursula_config = UrsulaConfiguration(dev_mode=True,
+                                        rest_port=MOCK_URSULA_STARTING_PORT,
+                                        is_me=True,
+                                        start_learning_now=False,
+                                        abort_on_learning_error=True,
+                                        federated_only=True,
+                                        network_middleware=SlowMockRestMiddleware(),
+                                        save_metadata=False,
+                                        reload_metadata=False)
+
+    def benchmark():
+        try:
+            run(ursula_config)
+        finally:
+            ursula_config.cleanup()
+            reactor.callFromThread(reactor.stop)
+
+    threading.Thread(target=benchmark).start()
+    reactor.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import random
+import time
+
+from nucypher.config.characters import UrsulaConfiguration
+from nucypher.network.teachers import RandomTeacherSelection, LatencyAwareTeacherSelection
+from nucypher.utilities.sandbox.constants import MOCK_URSULA_STARTING_PORT
+from nucypher.utilities.sandbox.middleware import MockRestMiddleware
+from nucypher.utilities.sandbox.ursula import make_federated_ursulas
+
+FLEET_SIZE = 20
+FARAWAY_FRACTION = 0.5
+NEARBY_LATENCY = 0.005  # seconds per request
+FARAWAY_LATENCY = 0.2
+LEARNING_ROUNDS = 100
+
+
+class FarawayMockRestMiddleware(MockRestMiddleware):
+    """
+    Mock middleware in which some teachers are on the other side of the world.
+    """
+    latencies = dict()
+
+    def get_nodes_via_rest(self, node, *args, **kwargs):
+        time.sleep(self.latencies.get(node.checksum_public_address, 0))
+        return super().get_nodes_via_rest(node, *args, **kwargs)
+
+
+def measure_learning_rounds(ursula_config, fleet, teacher_selection):
+    learner = make_federated_ursulas(ursula_config=ursula_config,
+                                     quantity=1,
+                                     know_each_other=False,
+                                     teacher_selection=teacher_selection).pop()
+    for ursula in fleet:
+        learner.remember_node(ursula)
+
+    teachers_used = set()
+    start = time.time()
+    for _ in range(LEARNING_ROUNDS):
+        teachers_used.add(learner.current_teacher_node().checksum_public_address)
+        learner.learn_from_teacher_node()
+    elapsed = time.time() - start
+    return elapsed, len(teachers_used)
+
+
+def main():
+    middleware = FarawayMockRestMiddleware()
+    ursula_config = UrsulaConfiguration(dev_mode=True,
+                                        rest_port=MOCK_URSULA_STARTING_PORT,
+                                        is_me=True,
+                                        start_learning_now=False,
+                                        abort_on_learning_error=True,
+                                        federated_only=True,
+                                        network_middleware=middleware,
+                                        save_metadata=False,
+                                        reload_metadata=False)
+
+    print(f"Building a fleet of {FLEET_SIZE} nodes, {int(FARAWAY_FRACTION * 100)}% of them far away...")
+    fleet = list(make_federated_ursulas(ursula_config=ursula_config, quantity=FLEET_SIZE))
+    for ursula in fleet:
+        latency = FARAWAY_LATENCY if random.random() < FARAWAY_FRACTION else NEARBY_LATENCY
+        FarawayMockRestMiddleware.latencies[ursula.checksum_public_address] = latency
+
+    print(f"{'selection'.ljust(32)}{'seconds'.rjust(10)}{'ms/round'.rjust(10)}{'teachers'.rjust(10)}")
+    for teacher_selection in (RandomTeacherSelection(), LatencyAwareTeacherSelection()):
+        elapsed, teachers_used = measure_learning_rounds(ursula_config, fleet, teacher_selection)
+        name = teacher_selection.__class__.__name__
+        print(f"{name.ljust(32)}{elapsed:10.2f}{1000 * elapsed / LEARNING_ROUNDS:10.1f}{teachers_used:10}")
+
+    ursula_config.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,17 @@
 import datetime
+import threading
+
 import maya
 import pytest
 
+from nucypher.characters.lawful import Ursula
+from nucypher.config.storages import NodeStorage
+from nucypher.network.exceptions import NodeSeemsToBeDown
+from nucypher.network.health import PeerCircuitBreakers
 from nucypher.network.nodes import Learner
 from nucypher.policy.models import TreasureMap, Policy
-from nucypher.utilities.sandbox.middleware import NodeIsDownMiddleware
+from nucypher.utilities.sandbox.middleware import NodeIsDownMiddleware, MockRestMiddleware, _TestMiddlewareClient
+from nucypher.utilities.sandbox.ursula import make_federated_ursulas
 from functools import partial
 
 
@@ -103,3 +110,136 @@ def test_node_has_changed_cert(federated_alice, federated_ursulas):
 
     # Cool - we didn't crash because of SSLError.
     # TODO: Assertions and such.
+
+
+def test_verification_pool_only_verifies_each_node_once_at_a_time(federated_ursulas, ursula_federated_test_config):
+    learner = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                     quantity=1,
+                                     know_each_other=False).pop()
+
+    class SlowToAnswerMiddleware(MockRestMiddleware):
+        answer = threading.Event()
+        requests_for_node_information = 0
+
+        def node_information(self, *args, **kwargs):
+            self.requests_for_node_information += 1
+            self.answer.wait()
+            return super().node_information(*args, **kwargs)
+
+    learner.network_middleware = SlowToAnswerMiddleware()
+
+    # The same node is announced to us several times while we're still verifying it.
+    ursula = list(federated_ursulas)[0]
+    announcements = [Ursula.from_bytes(bytes(ursula), federated_only=True) for _ in range(3)]
+    verifications = [learner.verification_pool.submit(node) for node in announcements]
+    assert len(set(verifications)) == 1
+    assert len(learner.verification_pool) == 1
+
+    learner.network_middleware.answer.set()
+    remembered_node = verifications[0].result()
+    assert learner.network_middleware.requests_for_node_information == 1
+    assert remembered_node.checksum_public_address == ursula.checksum_public_address
+    assert ursula.checksum_public_address in learner.known_nodes
+
+
+def test_certificates_of_unverified_nodes_are_not_stored(federated_ursulas, ursula_federated_test_config):
+    learner = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                     quantity=1,
+                                     know_each_other=False).pop()
+    learner.network_middleware = NodeIsDownMiddleware()
+
+    down_node = Ursula.from_bytes(bytes(list(federated_ursulas)[0]), federated_only=True)
+    learner.network_middleware.node_is_down(down_node)
+    with pytest.raises(NodeSeemsToBeDown):
+        learner.verification_pool.submit(down_node).result()
+
+    with pytest.raises(NodeStorage.UnknownNode):
+        learner.node_storage.get(checksum_address=down_node.checksum_public_address,
+                                 federated_only=True,
+                                 certificate_only=True)
+
+
+def test_learner_backs_off_from_unreachable_teachers(federated_ursulas, ursula_federated_test_config):
+    learner = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                     quantity=1,
+                                     know_each_other=False).pop()
+    learner.network_middleware = NodeIsDownMiddleware()
+
+    down_node, reliable_node = list(federated_ursulas)[:2]
+    learner.remember_node(down_node)
+    learner.remember_node(reliable_node)
+    learner.network_middleware.node_is_down(down_node)
+
+    learner._current_teacher_node = down_node
+    learner.learn_from_teacher_node()
+
+    health = learner.node_health[down_node.checksum_public_address]
+    assert health.bucket == learner.node_health.GHOST
+    assert health.consecutive_failures == 1
+    assert not learner.node_health.is_eligible(down_node.checksum_public_address)
+
+    # Until its backoff expires, the down node won't be chosen as a teacher again.
+    learner.teacher_nodes.clear()
+    for _ in range(5):
+        learner.cycle_teacher_node()
+        assert learner.current_teacher_node() is not down_node
+
+    # Each consecutive failure doubles the backoff.
+    assert learner.node_health.backoff(2) == 2 * learner.node_health.backoff(1)
+
+    # Once the node answers again, it's back in good standing.
+    learner.network_middleware.node_is_up(down_node)
+    learner._current_teacher_node = down_node
+    learner.learn_from_teacher_node()
+    assert learner.node_health[down_node.checksum_public_address].bucket is None
+    assert learner.node_health.is_eligible(down_node.checksum_public_address)
+
+
+def test_circuit_breaker_fails_fast_and_half_opens_after_cooling_down(federated_ursulas,
+                                                                      ursula_federated_test_config):
+    now = [0]
+    breakers = PeerCircuitBreakers(failure_threshold=2, cool_down=10, clock=lambda: now[0])
+    learner = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                     quantity=1,
+                                     know_each_other=False).pop()
+    learner.network_middleware = MockRestMiddleware()
+    learner.network_middleware.client = _TestMiddlewareClient(circuit_breakers=breakers)
+
+    flaky_node, reliable_node = list(federated_ursulas)[:2]
+    flaky_peer = flaky_node.rest_url()
+    flaky_interface = flaky_node.rest_information()[0]
+
+    # Until we've seen enough of a peer, requests get the usual timeout; after that, one derived from its latency.
+    assert breakers.timeout(flaky_peer, default=2) == 2
+    for _ in range(10):
+        breakers.record_success(flaky_peer, latency=.01)
+    assert breakers.timeout(flaky_peer, default=2) < 2
+
+    # A slow but healthy peer gets more time than usual, within reason.
+    slow_peer = reliable_node.rest_url()
+    for _ in range(10):
+        breakers.record_success(slow_peer, latency=1.5)
+    assert 2 < breakers.timeout(slow_peer, default=2) <= 2 * breakers._MAX_TIMEOUT_GROWTH
+
+    # After enough consecutive failures, the breaker opens...
+    breakers.record_failure(flaky_peer)
+    assert learner.network_middleware.peer_is_available(flaky_node)
+    breakers.record_failure(flaky_peer)
+    assert not learner.network_middleware.peer_is_available(flaky_node)
+
+    # ...so requests fail fast (as if the node were down), and it isn't considered for teaching or policies.
+    with pytest.raises(NodeSeemsToBeDown):
+        learner.network_middleware.node_information(host=flaky_interface.host, port=flaky_interface.port)
+    available, unavailable = learner.node_health.partition([flaky_node, reliable_node])
+    assert available == [reliable_node]
+    assert unavailable == [flaky_node]
+
+    # Failing fast doesn't count against the node's health, since it wasn't even contacted.
+    learner.record_connection_failure(flaky_node, PeerCircuitBreakers.CircuitOpen("Not contacting it for now."))
+    assert learner.node_health.is_eligible(flaky_node.checksum_public_address)
+
+    # After the cool-down, one trial request goes through; its success closes the breaker again.
+    now[0] += 10
+    learner.network_middleware.node_information(host=flaky_interface.host, port=flaky_interface.port)
+    assert breakers[flaky_peer].state == breakers[flaky_peer].CLOSED
+    assert learner.network_middleware.peer_is_available(flaky_node)
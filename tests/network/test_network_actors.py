@@ -18,6 +18,7 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 
 import pytest
 from binascii import unhexlify
+from concurrent.futures import Future
 from hendrix.experience import crosstown_traffic
 from hendrix.utils.test_utils import crosstownTaskListDecoratorFactory
 
@@ -25,6 +26,7 @@ from nucypher.characters.lawful import Ursula
 from nucypher.characters.unlawful import Vladimir
 from nucypher.crypto.api import keccak_digest
 from nucypher.crypto.powers import SigningPower
+from nucypher.network.announcements import NodeAnnouncementQueue
 from nucypher.network.nicknames import nickname_from_seed
 from nucypher.utilities.sandbox.constants import INSECURE_DEVELOPMENT_PASSWORD
 from nucypher.utilities.sandbox.middleware import MockRestMiddleware
@@ -180,6 +182,46 @@ def test_vladimir_illegal_interface_key_does_not_propagate(blockchain_ursulas):
     assert vladimir in other_ursula.suspicious_activities_witnessed['vladimirs']
 
 
+def test_announced_nodes_are_deduplicated_rate_limited_and_verified_in_batches(federated_ursulas):
+    ursulas = list(federated_ursulas)
+    batches = []
+    current_batch = []
+
+    def verifier(node):
+        current_batch.append(node)
+        verification = Future()
+        verification.set_result(True)
+        return verification
+
+    announcements = NodeAnnouncementQueue(verifier=verifier, batch_size=2, announcements_per_announcer=3)
+
+    # The same node announced over and over is only queued once.
+    assert announcements.announce("a learner", [ursulas[0], ursulas[0]]) is True
+    assert announcements.announce("another learner", [ursulas[0]]) is False
+    assert len(announcements) == 1
+
+    # Each announcer only gets so many announcements per window.
+    assert announcements.announce("a learner", ursulas[1:]) is True
+    assert len(announcements) == 3
+    assert announcements.announce("a learner", ursulas[3:]) is False
+    assert announcements.announce("another learner", ursulas[3:4]) is True
+    assert len(announcements) == 4
+
+    # Draining verifies everything that is pending, a batch at a time.
+    original_next_batch = announcements._next_batch
+
+    def next_batch():
+        if current_batch:
+            batches.append(list(current_batch))
+            current_batch.clear()
+        return original_next_batch()
+
+    announcements._next_batch = next_batch
+    announcements.drain()
+    assert len(announcements) == 0
+    assert batches == [ursulas[0:2], ursulas[2:4]]
+
+
 def test_alice_refuses_to_make_arrangement_unless_ursula_is_valid(blockchain_alice,
                                                                   idle_blockchain_policy,
                                                                   blockchain_ursulas):
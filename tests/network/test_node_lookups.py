@@ -0,0 +1,84 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from functools import partial
+
+import pytest
+
+from nucypher.network.middleware import UnexpectedResponse
+from nucypher.network.nodes import Learner
+from nucypher.utilities.sandbox.middleware import MockRestMiddleware
+from nucypher.utilities.sandbox.ursula import make_federated_ursulas
+
+
+def test_learner_looks_up_specific_nodes_through_teachers_of_teachers(ursula_federated_test_config):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+    learner, teacher, teachers_teacher, needle = (lonely_ursula_maker().pop() for _ in range(4))
+    learner.remember_node(teacher)
+    teacher.remember_node(teachers_teacher)
+    teachers_teacher.remember_node(needle)
+
+    # Only the teacher's teacher knows about the node we need; without forwarding, we can't find it.
+    assert learner.lookup_nodes({needle.checksum_public_address}, hops=0) == []
+
+    found_nodes = learner.get_nodes_by_ids([needle.checksum_public_address])
+    assert [node.checksum_public_address for node in found_nodes] == [needle.checksum_public_address]
+    assert needle.checksum_public_address in learner.known_nodes
+
+    # Asking for a node we already know doesn't bother anyone.
+    assert learner.lookup_nodes({needle.checksum_public_address}) == []
+
+
+def test_lookups_are_bounded_and_do_not_go_round_in_circles(ursula_federated_test_config, monkeypatch):
+    monkeypatch.setattr(Learner, "_LOOKUP_HOPS", 3)
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+    learner, teacher, teachers_teacher, needle = (lonely_ursula_maker().pop() for _ in range(4))
+    learner.remember_node(teacher)
+    teacher.remember_node(teachers_teacher)
+    teachers_teacher.remember_node(teacher)  # Nobody here knows about the needle.
+
+    class LookupCountingMiddleware(MockRestMiddleware):
+        nodes_asked = []
+
+        def lookup_nodes(self, node, *args, **kwargs):
+            self.nodes_asked.append(node.checksum_public_address)
+            return super().lookup_nodes(node, *args, **kwargs)
+
+    for ursula in (learner, teacher, teachers_teacher):
+        ursula.network_middleware = LookupCountingMiddleware()
+
+    icon_before_lookup = teacher.fleet_state_icon
+    assert learner.lookup_nodes({needle.checksum_public_address}) == []
+
+    # The teacher's teacher doesn't ask the teacher again, even though it has hops to spare.
+    assert LookupCountingMiddleware.nodes_asked == [teacher.checksum_public_address,
+                                                    teachers_teacher.checksum_public_address]
+
+    # A lookup doesn't tell us anything about the teacher's fleet state.
+    assert teacher.fleet_state_icon == icon_before_lookup
+
+    # Teachers don't take nonsense hops.
+    for nonsense in ("lots", -1):
+        with pytest.raises(UnexpectedResponse, match="400"):
+            learner.network_middleware.lookup_nodes(node=teacher,
+                                                    checksum_addresses={needle.checksum_public_address},
+                                                    hops=nonsense)
@@ -0,0 +1,88 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import zlib
+
+from nucypher.utilities.sandbox.ursula import make_federated_ursulas
+
+
+def test_teacher_only_sends_nodes_learned_since_the_learners_fleet_state(federated_ursulas,
+                                                                          ursula_federated_test_config):
+    teacher, learner, *_ = list(federated_ursulas)
+    assert teacher.known_nodes.checksum == learner.known_nodes.checksum
+
+    newcomer = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                      quantity=1,
+                                      know_each_other=False).pop()
+    teacher.remember_node(newcomer)
+    assert teacher.known_nodes.checksum != learner.known_nodes.checksum
+
+    # The learner is still in the teacher's previous fleet state, so the teacher only sends the newcomer
+    # (and, as always, itself).
+    response = learner.network_middleware.get_nodes_via_rest(node=teacher,
+                                                             announce_nodes=[learner],
+                                                             fleet_checksum=learner.known_nodes.checksum)
+    node_list = learner._nodes_from_teacher_response(teacher, response)
+    addresses = set(node.checksum_public_address for node in node_list)
+    assert addresses == {newcomer.checksum_public_address, teacher.checksum_public_address}
+
+    # A learner in a fleet state that the teacher has never been in gets everything.
+    response = learner.network_middleware.get_nodes_via_rest(node=teacher, fleet_checksum="deadbeef")
+    node_list = learner._nodes_from_teacher_response(teacher, response)
+    assert len(node_list) == len(teacher.known_nodes) + 1
+
+    learner._current_teacher_node = teacher
+    new_nodes = learner.learn_from_teacher_node()
+    assert [node.checksum_public_address for node in new_nodes] == [newcomer.checksum_public_address]
+
+
+def test_teacher_reuses_signed_node_metadata_until_the_fleet_changes(federated_ursulas, ursula_federated_test_config):
+    _, learner, teacher, *_ = list(federated_ursulas)
+
+    first_response = learner.network_middleware.get_nodes_via_rest(node=teacher, fleet_checksum="deadbeef")
+    second_response = learner.network_middleware.get_nodes_via_rest(node=teacher, fleet_checksum="deadbeef")
+    assert first_response.content == second_response.content
+
+    newcomer = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                      quantity=1,
+                                      know_each_other=False).pop()
+    teacher.remember_node(newcomer)
+
+    third_response = learner.network_middleware.get_nodes_via_rest(node=teacher, fleet_checksum="deadbeef")
+    assert third_response.content != first_response.content
+    node_list = learner._nodes_from_teacher_response(teacher, third_response)
+    assert newcomer.checksum_public_address in (node.checksum_public_address for node in node_list)
+
+
+def test_teacher_compresses_node_metadata_only_for_learners_that_accept_it(federated_ursulas):
+    _, learner, teacher, *_ = list(federated_ursulas)
+    client = teacher.rest_app.test_client()
+
+    # Learners that don't ask for compression (like older ones) get the plain payload.
+    plain_response = client.get("/node_metadata")
+    assert 'Content-Encoding' not in plain_response.headers
+
+    compressed_response = client.get("/node_metadata", headers={'Accept-Encoding': 'deflate'})
+    assert compressed_response.headers['Content-Encoding'] == 'deflate'
+    assert len(compressed_response.data) < len(plain_response.data)
+    assert zlib.decompress(compressed_response.data) == plain_response.data
+
+    # Our own middleware asks for it, and learns from it all the same.
+    response = learner.network_middleware.get_nodes_via_rest(node=teacher)
+    assert response.headers['Content-Encoding'] == 'deflate'
+    assert response.content == plain_response.data
+    node_list = learner._nodes_from_teacher_response(teacher, response)
+    assert teacher.checksum_public_address in (node.checksum_public_address for node in node_list)
@@ -0,0 +1,56 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import os
+
+from nucypher.network.middleware import PeerSessionPool, RestMiddleware
+from nucypher.utilities.sandbox.middleware import MockRestMiddleware
+
+
+def test_sessions_are_reused_per_peer_and_pinned_certificate(federated_ursulas):
+    some_ursula, another_ursula, yet_another_ursula, *_ = list(federated_ursulas)
+    pool = PeerSessionPool(max_sessions=2)
+
+    session = pool.session(some_ursula.rest_url(), some_ursula.certificate_filepath)
+    assert pool.session(some_ursula.rest_url(), some_ursula.certificate_filepath) is session
+
+    # A rewritten certificate means a new session.
+    stat = os.stat(some_ursula.certificate_filepath)
+    os.utime(some_ursula.certificate_filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert pool.session(some_ursula.rest_url(), some_ursula.certificate_filepath) is not session
+
+    # Only so many sessions are kept; the least recently used ones go first.
+    another_session = pool.session(another_ursula.rest_url(), another_ursula.certificate_filepath)
+    pool.session(yet_another_ursula.rest_url(), yet_another_ursula.certificate_filepath)
+    assert len(pool) == 2
+    assert pool.session(another_ursula.rest_url(), another_ursula.certificate_filepath) is another_session
+
+
+def test_idle_sessions_are_closed(federated_ursulas):
+    some_ursula = list(federated_ursulas)[0]
+    pool = PeerSessionPool(idle_timeout=1)
+
+    session = pool.session(some_ursula.rest_url(), some_ursula.certificate_filepath)
+    pool._close_idle_sessions(now=pool._sessions[next(iter(pool._sessions))][1] + 2)
+    assert len(pool) == 0
+    assert pool.session(some_ursula.rest_url(), some_ursula.certificate_filepath) is not session
+
+
+def test_each_middleware_has_its_own_sessions_and_circuit_breakers():
+    one_middleware, another_middleware = RestMiddleware(), RestMiddleware()
+    assert one_middleware.client.session_pool is not another_middleware.client.session_pool
+    assert one_middleware.client.circuit_breakers is not another_middleware.client.circuit_breakers
+    assert MockRestMiddleware().client is not MockRestMiddleware().client
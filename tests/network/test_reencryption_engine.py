@@ -0,0 +1,134 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import pytest
+from bytestring_splitter import BytestringSplitter, VariableLengthBytestring
+from umbral import pre
+from umbral.cfrags import CapsuleFrag
+from umbral.keys import UmbralPrivateKey
+from umbral.signing import Signature, Signer
+
+from nucypher.network.middleware import RestMiddleware, UnexpectedResponse
+from nucypher.network.reencryption import ReencryptionEngine
+from nucypher.policy.models import WorkOrder
+
+
+def make_tasks(alices_signing_key, number_of_tasks):
+    delegating_key, receiving_key = UmbralPrivateKey.gen_key(), UmbralPrivateKey.gen_key()
+    kfrags = pre.generate_kfrags(delegating_privkey=delegating_key,
+                                 receiving_pubkey=receiving_key.get_pubkey(),
+                                 threshold=1,
+                                 N=1,
+                                 signer=Signer(alices_signing_key))
+    tasks = list()
+    for _ in range(number_of_tasks):
+        _ciphertext, capsule = pre.encrypt(delegating_key.get_pubkey(), b"Knock knock.")
+        capsule.set_correctness_keys(delegating=delegating_key.get_pubkey(),
+                                     receiving=receiving_key.get_pubkey(),
+                                     verifying=alices_signing_key.get_pubkey())
+        tasks.append(WorkOrder.Task(capsule=capsule, signature=Signer(receiving_key)(bytes(capsule))))
+    return kfrags[0], tasks
+
+
+@pytest.mark.parametrize("workers", (0, 2))
+def test_reencryption_engine_reencrypts_and_signs(workers):
+    alices_signing_key, ursulas_signing_key = UmbralPrivateKey.gen_key(), UmbralPrivateKey.gen_key()
+    kfrag, tasks = make_tasks(alices_signing_key, number_of_tasks=3)
+
+    engine = ReencryptionEngine(signing_key=ursulas_signing_key, workers=workers)
+    engine._TASKS_PER_CHUNK = 2  # So that the work order is spread across both workers.
+    try:
+        results = list(engine.reencrypt(arrangement_id=b"an arrangement",
+                                        kfrag_bytes=bytes(kfrag),
+                                        verifying_key_bytes=bytes(alices_signing_key.get_pubkey()),
+                                        tasks=tasks))
+    finally:
+        engine.shutdown()
+
+    assert len(results) == len(tasks)
+    result_splitter = BytestringSplitter((CapsuleFrag, VariableLengthBytestring), Signature)
+    for task, result in zip(tasks, results):
+        cfrag, reencryption_signature = result_splitter(result)
+        assert cfrag.verify_correctness(task.capsule)
+        assert reencryption_signature.verify(bytes(cfrag), ursulas_signing_key.get_pubkey())
+
+
+def test_reencryption_engine_only_starts_workers_when_asked_to():
+    alices_signing_key, ursulas_signing_key = UmbralPrivateKey.gen_key(), UmbralPrivateKey.gen_key()
+    kfrag, tasks = make_tasks(alices_signing_key, number_of_tasks=1)
+    assert ReencryptionEngine(signing_key=ursulas_signing_key).workers == 0
+
+    engine = ReencryptionEngine(signing_key=ursulas_signing_key, workers=1)
+    engine.shutdown()
+    with pytest.raises(RuntimeError):
+        engine.reencrypt(arrangement_id=b"an arrangement",
+                         kfrag_bytes=bytes(kfrag),
+                         verifying_key_bytes=bytes(alices_signing_key.get_pubkey()),
+                         tasks=tasks)
+
+
+def test_reencryption_engine_turns_work_away_when_its_queue_is_full():
+    alices_signing_key, ursulas_signing_key = UmbralPrivateKey.gen_key(), UmbralPrivateKey.gen_key()
+    kfrag, tasks = make_tasks(alices_signing_key, number_of_tasks=1)
+    engine = ReencryptionEngine(signing_key=ursulas_signing_key, workers=0, queue_depth=1)
+
+    reencrypt = lambda: engine.reencrypt(arrangement_id=b"an arrangement",
+                                         kfrag_bytes=bytes(kfrag),
+                                         verifying_key_bytes=bytes(alices_signing_key.get_pubkey()),
+                                         tasks=tasks)
+
+    # Some other work order is taking up the only place in the queue.
+    engine._slots.acquire()
+    with pytest.raises(ReencryptionEngine.Busy):
+        reencrypt()
+
+    engine._slots.release()
+    stream = reencrypt()
+
+    # The work order keeps its place until its cfrags have all been sent...
+    with pytest.raises(ReencryptionEngine.Busy):
+        reencrypt()
+    assert len(list(stream)) == 1
+
+    # ...or until nobody wants them anymore.
+    reencrypt().close()
+    assert len(list(reencrypt())) == 1
+
+
+def test_cfrag_stream_is_parsed_as_it_arrives():
+    alices_signing_key, ursulas_signing_key = UmbralPrivateKey.gen_key(), UmbralPrivateKey.gen_key()
+    kfrag, tasks = make_tasks(alices_signing_key, number_of_tasks=3)
+    engine = ReencryptionEngine(signing_key=ursulas_signing_key, workers=0)
+    cfrag_stream = b"".join(engine.reencrypt(arrangement_id=b"an arrangement",
+                                             kfrag_bytes=bytes(kfrag),
+                                             verifying_key_bytes=bytes(alices_signing_key.get_pubkey()),
+                                             tasks=tasks))
+
+    # Bob gets the whole stream, a few bytes at a time.
+    chunks = (cfrag_stream[start:start + 7] for start in range(0, len(cfrag_stream), 7))
+    cfrags_and_signatures = RestMiddleware.split_cfrag_stream(chunks)
+    all_at_once = BytestringSplitter((CapsuleFrag, VariableLengthBytestring), Signature).repeat(cfrag_stream)
+    assert [(bytes(c), bytes(s)) for c, s in cfrags_and_signatures] == [(bytes(c), bytes(s)) for c, s in all_at_once]
+
+    # A stream that stops part way through a cfrag is no good.
+    with pytest.raises(UnexpectedResponse):
+        list(RestMiddleware.split_cfrag_stream([cfrag_stream[:-1]]))
+
+    # So is one that stops before all of the cfrags Bob asked for have arrived.
+    first_cfrag_and_signature = cfrag_stream[:len(cfrag_stream) // 3]
+    with pytest.raises(UnexpectedResponse):
+        list(RestMiddleware.split_cfrag_stream([first_cfrag_and_signature], expected_cfrags=3))
+    assert len(list(RestMiddleware.split_cfrag_stream([first_cfrag_and_signature]))) == 1
@@ -22,3 +22,15 @@ def test_render_ursula_status_page_with_known_nodes(tmpdir, federated_ursulas):
     # Every known nodes address is rendered
     for known_ursula in federated_ursulas:
         assert known_ursula.checksum_public_address in rendering
+
+
+def test_render_ursula_status_page_with_unreachable_nodes(tmpdir, federated_ursulas):
+    ursula_config = UrsulaConfiguration(dev_mode=True, federated_only=True)
+    ursula = ursula_config()
+
+    ghost = list(federated_ursulas)[0]
+    ursula.node_health.record_failure(ghost.checksum_public_address, bucket=ursula.node_health.GHOST)
+
+    rendering = status_template.render(this_node=ursula, known_nodes=ursula.known_nodes, node_health=ursula.node_health)
+    assert ursula.node_health.GHOST in rendering
+    assert ghost.checksum_public_address in rendering